@@ -0,0 +1,30 @@
+"""
+Command-line interface for the unified agent.
+
+Stdlib-only so `python unified_agent.py --help` can print usage before the
+agent module pulls in httpx/PIL and the memory/skills/planning packages.
+"""
+
+import argparse
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """CLI parser for unified_agent.main()."""
+    parser = argparse.ArgumentParser(description="StardewAI Unified Agent")
+    parser.add_argument("--config", "-c", default="./config/settings.yaml",
+                        help="Path to config file")
+    parser.add_argument("--goal", "-g", default="",
+                        help="Goal for the agent")
+    parser.add_argument("--mode", "-m", choices=["single", "splitscreen", "helper"],
+                        help="Override mode: single (full screen), splitscreen (Player 2), helper (advisory)")
+    parser.add_argument("--observe", "-o", action="store_true",
+                        help="Observe only (disable controller)")
+    parser.add_argument("--ui", action="store_true",
+                        help="Enable UI updates")
+    parser.add_argument("--ui-url", default=None,
+                        help="UI base URL (default http://localhost:9001)")
+    parser.add_argument("--plot", type=str, default=None,
+                        help="Define farm plot: 'x,y,width,height' e.g., '30,20,5,3'")
+    parser.add_argument("--clear-plan", action="store_true",
+                        help="Clear existing farm plan")
+    return parser
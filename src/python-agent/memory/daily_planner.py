@@ -252,6 +252,15 @@ class DailyPlanner:
         """Get the resolved task queue for TaskExecutor."""
         return self.resolved_queue
 
+    def remove_resolved_task(self, task_id: str) -> bool:
+        """Remove a task from the resolved queue in one pass, keeping queue order."""
+        for i, rt in enumerate(self.resolved_queue):
+            rt_id = rt.original_task_id if hasattr(rt, 'original_task_id') else rt.get('original_task_id', '')
+            if rt_id == task_id:
+                del self.resolved_queue[i]
+                return True
+        return False
+
     def get_next_resolved_task(self) -> Optional[Any]:
         """Get the next task from resolved queue (first pending one)."""
         for task in self.resolved_queue:
@@ -1066,8 +1075,7 @@ Output your reasoning (2-3 sentences), then "FINAL:" followed by any priority ch
             return
 
         try:
-            with open(self.persist_path) as f:
-                data = json.load(f)
+            data = json.loads(self.persist_path.read_bytes())
 
             self.current_day = data.get("current_day", 0)
             self.current_season = data.get("current_season", "spring")
@@ -2,13 +2,17 @@
 Episodic memory for Rusty using ChromaDB.
 Stores personal experiences - things learned by doing.
 """
+import importlib.util
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import chromadb
-from chromadb.config import Settings
+# chromadb is imported by EpisodicMemory() - it is slow to import, and importing
+# the memory package (e.g. for `unified_agent.py --help`) shouldn't pay for it.
+# Still fail the package import when it is missing so callers' HAS_MEMORY stays honest.
+if importlib.util.find_spec("chromadb") is None:
+    raise ImportError("chromadb is required for episodic memory")
 
 # Store ChromaDB data in project data directory
 DATA_DIR = Path(__file__).resolve().parents[2] / "data" / "chromadb"
@@ -31,6 +35,9 @@ class EpisodicMemory:
 
     def __init__(self, collection_name: str = "rusty_memories"):
         """Initialize ChromaDB client and collection."""
+        import chromadb
+        from chromadb.config import Settings
+
         self.client = chromadb.PersistentClient(
             path=str(DATA_DIR),
             settings=Settings(anonymized_telemetry=False)
@@ -204,8 +204,7 @@ class LessonMemory:
         """Load lessons from persistence file."""
         if self.persist_path.exists():
             try:
-                with open(self.persist_path) as f:
-                    data = json.load(f)
+                data = json.loads(self.persist_path.read_bytes())
                 self.lessons = data.get("lessons", [])
                 logger.info(f"Loaded {len(self.lessons)} lessons from {self.persist_path}")
             except (json.JSONDecodeError, IOError) as e:
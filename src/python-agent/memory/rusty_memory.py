@@ -432,8 +432,7 @@ class RustyMemory:
             return
 
         try:
-            with open(self.persist_path) as f:
-                data = json.load(f)
+            data = json.loads(self.persist_path.read_bytes())
 
             self.episodic = data.get("episodic", [])
             self.relationships = data.get("relationships", {})
@@ -6,6 +6,11 @@ from typing import Dict
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml C parser
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from .models import Skill, SkillAction, SkillPlanning, SkillPrecondition
 
 
@@ -50,7 +55,7 @@ class SkillLoader:
         return True
 
     def _load_file(self, path: Path) -> Dict[str, Skill]:
-        data = yaml.safe_load(path.read_text()) or {}
+        data = yaml.load(path.read_bytes(), Loader=_YamlLoader) or {}
         if not isinstance(data, dict):
             return {}
         skills: Dict[str, Skill] = {}
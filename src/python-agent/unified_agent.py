@@ -12,21 +12,57 @@ Run with: python unified_agent.py --mode coop --goal "Help with farming"
 
 import asyncio
 import base64
+import heapq
+import importlib.util
 import io
 import json
 import logging
+import os
+import queue
 import re
 import sys
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional, List, Dict, Any, Tuple, Set
 
+from agent_cli import build_arg_parser  # stdlib-only
+
+if __name__ == "__main__" and any(arg in ("-h", "--help") for arg in sys.argv[1:]):
+    # Script run with --help: print usage before the third-party imports below
+    build_arg_parser().parse_args()
+
 import httpx
 import yaml
-from mss import mss
-from PIL import Image
+from PIL import Image, __version__ as PIL_VERSION
+
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml C parser
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+# Optional: orjson for the per-tick SMAPI polls and /action bodies, and the config cache (bytes in/out)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+    HAS_ORJSON = True
+except ImportError:
+    _json_loads = json.loads
+    def _json_dumps(obj: Any) -> bytes: return json.dumps(obj).encode()
+    HAS_ORJSON = False
+
+# Optional: pybase64 (SIMD encoder) for the per-think screenshot payload
+try:
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    _b64encode = base64.b64encode
 
 # Session 120: Unified SMAPI client for complete game data access
 from smapi_client import SMAPIClient, get_client as get_smapi_client
@@ -127,19 +163,26 @@ except ImportError:
 # Optional Input Methods
 # =============================================================================
 
-try:
-    import pyautogui
-    pyautogui.FAILSAFE = True
-    HAS_PYAUTOGUI = True
-except ImportError:
-    HAS_PYAUTOGUI = False
+# Probe only - nothing drives pyautogui, and importing it pulls in its screenshot/GUI stack
+HAS_PYAUTOGUI = importlib.util.find_spec("pyautogui") is not None
+
+# Probe only - GamepadController imports vgamepad when it is actually created,
+# so ModBridge-only runs never load it (see _get_vgamepad)
+HAS_GAMEPAD = importlib.util.find_spec("vgamepad") is not None
+vg = None
+
+# Optional: h2 lets the VLM client negotiate HTTP/2 with an https llama-server
+HAS_H2 = importlib.util.find_spec("h2") is not None
+
+
+def _get_vgamepad():
+    """Import vgamepad on first use and cache it in the module global `vg`."""
+    global vg
+    if vg is None:
+        import vgamepad
+        vg = vgamepad
+    return vg
 
-try:
-    import vgamepad as vg
-    HAS_GAMEPAD = True
-except ImportError:
-    HAS_GAMEPAD = False
-    vg = None
 
 HAS_INPUT = HAS_GAMEPAD or HAS_PYAUTOGUI
 
@@ -190,10 +233,10 @@ def get_recommended_seed_skill(state: Optional[Dict[str, Any]]) -> Tuple[str, st
     if not state:
         return ("buy_parsnip_seeds", "Parsnip (fallback - no state)")
     
-    time_data = state.get("time", {})
+    time_data = state.get("time") or _EMPTY_DICT
     season = time_data.get("season", "spring")
     day = time_data.get("day", 1)
-    money = state.get("player", {}).get("money", 0)
+    money = (state.get("player") or _EMPTY_DICT).get("money", 0)
     
     try:
         rec = get_recommended_crop(season, day, money)
@@ -213,6 +256,47 @@ def get_recommended_seed_skill(state: Optional[Dict[str, Any]]) -> Tuple[str, st
 # =============================================================================
 
 CARDINAL_DIRECTIONS = ["north", "east", "south", "west"]
+_CARDINAL_SET = frozenset(CARDINAL_DIRECTIONS)
+# Stardew's player.facingDirection int -> direction name
+_FACING_NAMES = {0: "north", 1: "east", 2: "south", 3: "west"}
+
+# Blocker -> tool that removes it, and the verb used in the "IN FRONT OF YOU" hint
+BLOCKER_TOOL = {
+    "Weeds": "SCYTHE",
+    "Grass": "SCYTHE",
+    "Stone": "PICKAXE",
+    "Tree": "AXE",
+    "Stump": "AXE",
+    "Twig": "AXE",
+    "Wood": "AXE",
+}
+BLOCKER_VERB = {
+    "Weeds": "clear",
+    "Grass": "clear",
+    "Stone": "break",
+    "Tree": "chop",
+    "Stump": "chop",
+    "Twig": "chop",
+    "Wood": "chop",
+}
+# Adjacent blockers the "BLOCKED! Face ..." hint offers to clear (trees and stumps excluded)
+_CLEARABLE_DEBRIS = frozenset({"Weeds", "Grass", "Stone", "Twig", "Wood"})
+# Tools (lowercase substrings) that destroy a crop when used on its tile
+_CROP_DANGEROUS_TOOLS = ("scythe", "hoe", "pickaxe", "axe")
+# Harvested crops the hints tell the agent to ship
+_SELLABLE_CROPS = frozenset({
+    "Parsnip", "Potato", "Cauliflower", "Green Bean", "Kale", "Melon", "Blueberry",
+    "Corn", "Tomato", "Pumpkin", "Cranberry", "Eggplant", "Grape", "Radish",
+})
+# Debris the done-farming hint suggests clearing: adjacent blockers, and farm objects
+_NEARBY_DEBRIS = frozenset({"Stone", "Weeds", "Twig", "Wood", "Log", "Stump", "Boulder"})
+_FARM_DEBRIS = frozenset({"Weeds", "Stone", "Twig", "Wood"})
+# Debris type -> clearing skill; anything else (Twig, Wood, Log, Stump) is "clear_wood"
+_DEBRIS_CLEAR_SKILL = {"Weeds": "clear_weeds", "Grass": "clear_weeds", "Stone": "clear_stone", "Boulder": "clear_stone"}
+# Shared read-only defaults for missing payload sections: `d.get("player") or _EMPTY_DICT`
+# avoids building a throwaway {} / [] per lookup on the per-prompt formatting path
+_EMPTY_DICT = MappingProxyType({})
+_EMPTY_LIST = ()
 _DIRECTION_ALIASES = {
     "up": "north",
     "down": "south",
@@ -223,6 +307,13 @@ _DIRECTION_ALIASES = {
     "east": "east",
     "west": "west",
 }
+# Specialize the table for the casings the VLM actually emits ("North", "UP") so they
+# resolve in the single dict probe of normalize_direction without strip()/lower()
+_DIRECTION_ALIASES.update({
+    variant: canonical
+    for alias, canonical in list(_DIRECTION_ALIASES.items())
+    for variant in (alias.capitalize(), alias.upper())
+})
 
 # Diagonal directions split into two cardinal moves
 # Order: vertical first, then horizontal (so we move away from obstacles first)
@@ -241,10 +332,18 @@ DIAGONAL_TO_CARDINAL = {
 def normalize_direction(direction: str) -> str:
     if not direction:
         return ""
-    return _DIRECTION_ALIASES.get(direction.strip().lower(), direction.strip().lower())
+    # Fast path: any known alias/casing ("north", "Up", "WEST") - no new strings
+    canonical = _DIRECTION_ALIASES.get(direction)
+    if canonical is not None:
+        return canonical
+    cleaned = direction.strip().lower()
+    return _DIRECTION_ALIASES.get(cleaned, cleaned)
 
 
 def normalize_directions_map(directions: Dict[str, Any]) -> Dict[str, Any]:
+    # Fast path: the mod already reports canonical keys - return the map as-is (callers only read it)
+    if directions.keys() <= _CARDINAL_SET:
+        return directions
     normalized: Dict[str, Any] = {}
     for key, value in directions.items():
         normalized_key = normalize_direction(key)
@@ -252,7 +351,156 @@ def normalize_directions_map(directions: Dict[str, Any]) -> Dict[str, Any]:
             normalized[normalized_key] = value
     return normalized
 
-@dataclass
+
+_MANHATTAN_WORDS = {True: ("NORTH", "SOUTH", "WEST", "EAST"), False: ("north", "south", "west", "east")}
+
+
+@lru_cache(maxsize=256)
+def _format_manhattan(dx: int, dy: int, sep: str = " and ", empty: str = "here", caps: bool = True) -> str:
+    """Describe a tile offset as moves, vertical first - e.g. "3 NORTH and 2 EAST"."""
+    north, south, west, east = _MANHATTAN_WORDS[caps]
+    if dy < 0:
+        vertical = f"{-dy} {north}"
+    elif dy > 0:
+        vertical = f"{dy} {south}"
+    else:
+        vertical = ""
+    if dx < 0:
+        horizontal = f"{-dx} {west}"
+    elif dx > 0:
+        horizontal = f"{dx} {east}"
+    else:
+        horizontal = ""
+    if vertical and horizontal:
+        return f"{vertical}{sep}{horizontal}"
+    return vertical or horizontal or empty
+
+
+def _nearest_tile(items, px: int, py: int) -> Tuple[Optional[Dict[str, Any]], int]:
+    """One pass: (item nearest to (px, py) by Manhattan distance - first wins ties - or None, item count)."""
+    nearest = None
+    best = float("inf")
+    count = 0
+    for item in items:
+        count += 1
+        d = abs(item["x"] - px) + abs(item["y"] - py)
+        if d < best:
+            nearest, best = item, d
+    return nearest, count
+
+
+def _shipping_bin_xy(location: Dict[str, Any]) -> Tuple[int, int]:
+    """Shipping bin tile from a /state location payload (standard farm position if unreported)."""
+    shipping_bin = location.get("shippingBin") or _EMPTY_DICT
+    return shipping_bin.get("x", 71), shipping_bin.get("y", 14)
+
+
+def _inventory_summary(inventory) -> Tuple[int, int, bool]:
+    """One pass over inventory: (sellable crop stacks, total sellable items, has any seeds)."""
+    stacks = total = 0
+    has_seeds = False
+    for item in inventory:
+        if not item:
+            continue
+        name = item.get("name")
+        if name in _SELLABLE_CROPS:
+            stack = item.get("stack", 0)
+            if stack > 0:
+                stacks += 1
+                total += stack
+        elif not has_seeds and name and ("Seed" in name or name == "Mixed Seeds"):
+            has_seeds = True
+    return stacks, total, has_seeds
+
+
+def _load_yaml_cached(path: Path) -> Any:
+    """Load a YAML file via a JSON sibling cache (<name>.json), rebuilt when the YAML is newer."""
+    cache = path.with_name(path.name + ".json")
+    try:
+        if cache.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+            return _json_loads(cache.read_bytes())
+    except (OSError, ValueError):
+        pass  # No cache yet, or unreadable - parse the YAML
+
+    data = yaml.load(path.read_bytes(), Loader=_YamlLoader)
+    try:
+        blob = _json_dumps(data)
+        # Only cache if JSON round-trips exactly (e.g. no int keys or dates)
+        if _json_loads(blob) == data:
+            tmp = cache.with_name(cache.name + ".tmp")
+            tmp.write_bytes(blob)
+            os.replace(tmp, cache)
+    except (OSError, TypeError, ValueError) as e:
+        logging.debug(f"Config cache not written: {e}")
+    return data
+
+
+# Screenshot downscale: Pillow box-reduces by int(ratio / gap) before Lanczos, so with 1.5 a
+# 3x shrink (3840 -> 1280) reduces 2x then filters the last 1.5x; ratios below 3 (1920 -> 1280)
+# have no integer reduce step and run plain Lanczos
+_RESIZE_REDUCING_GAP = 1.5
+
+# capture.image_format spellings -> Pillow format name (Pillow has no "JPG" writer)
+_IMAGE_ENCODE_FORMATS = {"JPEG": "JPEG", "JPG": "JPEG", "WEBP": "WEBP", "PNG": "PNG"}
+
+
+def _image_encode_format(value: Any) -> str:
+    """Normalize capture.image_format at config load; unsupported formats fall back to JPEG."""
+    fmt = _IMAGE_ENCODE_FORMATS.get(str(value).strip().upper())
+    if fmt is None:
+        logging.warning(f"Unsupported capture.image_format {value!r} (use JPEG, WEBP or PNG), using JPEG")
+        return "JPEG"
+    return fmt
+
+
+# Config.from_yaml: YAML section -> (key, Config attribute, converter or None)
+_CONFIG_SCHEMA = (
+    ("server", (
+        ("url", "server_url", None),
+        ("model", "model", None),
+    )),
+    ("mode", (
+        ("type", "mode", None),
+        ("splitscreen_region", "splitscreen_region", None),
+    )),
+    ("timing", (
+        ("think_interval", "think_interval", None),
+        ("action_delay", "action_delay", None),
+        ("request_timeout", "request_timeout", None),
+    )),
+    ("capture", (
+        ("monitor", "monitor", None),
+        ("max_size", "max_image_size", None),
+        ("game_resolution", "game_resolution", tuple),
+        ("image_format", "image_encode_format", _image_encode_format),
+        ("vlm_input_size", "vlm_input_size", tuple),
+    )),
+    ("input", (
+        ("type", "input_type", None),
+    )),
+    ("logging", (
+        ("level", "log_level", None),
+        ("save_screenshots", "save_screenshots", None),
+        ("screenshot_dir", "screenshot_dir", Path),
+        ("history_dir", "history_dir", Path),
+    )),
+    ("ui", (
+        ("enabled", "ui_enabled", None),
+        ("url", "ui_url", None),
+        ("timeout", "ui_timeout", None),
+    )),
+    ("model", (
+        ("temperature", "temperature", None),
+        ("max_tokens", "max_tokens", None),
+    )),
+    ("vision_first", (
+        ("enabled", "vision_first_enabled", None),
+        ("light_context_template", "vision_first_context_template", None),
+    )),
+)
+
+
+@dataclass(slots=True)
 class Config:
     """Configuration loaded from settings.yaml."""
 
@@ -275,6 +523,8 @@ class Config:
     monitor: int = 1
     max_image_size: int = 1280
     game_resolution: tuple = (1920, 1080)
+    image_encode_format: str = "JPEG"  # JPEG, WEBP or PNG (for backends without JPEG support)
+    vlm_input_size: Optional[tuple] = None  # Fixed (w, h) sent to the VLM; overrides max_image_size
 
     # Input
     input_type: str = "gamepad"
@@ -293,6 +543,8 @@ class Config:
     # Model
     temperature: float = 0.7
     max_tokens: int = 1000
+    # System prompts are sent verbatim as the first message of every request so llama-server's
+    # cache_prompt can reuse their KV cache - keep per-frame values out of them
     system_prompt: str = ""
 
     # Vision-First Mode (Session 35)
@@ -306,55 +558,17 @@ class Config:
         config = cls()
 
         try:
-            with open(path, 'r') as f:
-                data = yaml.safe_load(f)
-
-            # Server
-            if 'server' in data:
-                config.server_url = data['server'].get('url', config.server_url)
-                config.model = data['server'].get('model', config.model)
-
-            # Mode
-            if 'mode' in data:
-                config.mode = data['mode'].get('type', config.mode)
-                if 'splitscreen_region' in data['mode']:
-                    config.splitscreen_region = data['mode']['splitscreen_region']
-
-            # Timing
-            if 'timing' in data:
-                config.think_interval = data['timing'].get('think_interval', config.think_interval)
-                config.action_delay = data['timing'].get('action_delay', config.action_delay)
-                config.request_timeout = data['timing'].get('request_timeout', config.request_timeout)
-
-            # Capture
-            if 'capture' in data:
-                config.monitor = data['capture'].get('monitor', config.monitor)
-                config.max_image_size = data['capture'].get('max_size', config.max_image_size)
-                res = data['capture'].get('game_resolution', list(config.game_resolution))
-                config.game_resolution = tuple(res)
-
-            # Input
-            if 'input' in data:
-                config.input_type = data['input'].get('type', config.input_type)
-
-            # Logging
-            if 'logging' in data:
-                config.log_level = data['logging'].get('level', config.log_level)
-                config.save_screenshots = data['logging'].get('save_screenshots', config.save_screenshots)
-                config.screenshot_dir = Path(data['logging'].get('screenshot_dir', str(config.screenshot_dir)))
-                config.history_dir = Path(data['logging'].get('history_dir', str(config.history_dir)))
-
-            # UI
-            if 'ui' in data:
-                config.ui_enabled = data['ui'].get('enabled', config.ui_enabled)
-                config.ui_url = data['ui'].get('url', config.ui_url)
-                config.ui_timeout = data['ui'].get('timeout', config.ui_timeout)
+            data = _load_yaml_cached(Path(path))
+
+            for section, fields in _CONFIG_SCHEMA:
+                values = data.get(section) or {}
+                for key, attr, convert in fields:
+                    if key in values:
+                        value = values[key]
+                        setattr(config, attr, convert(value) if convert else value)
 
             # Model
             if 'model' in data:
-                config.temperature = data['model'].get('temperature', config.temperature)
-                config.max_tokens = data['model'].get('max_tokens', config.max_tokens)
-
                 # Build system prompt: Character (from Python) + Game Mechanics (from YAML)
                 # This separates WHO Elias is from HOW the game works
                 game_mechanics = data['model'].get('game_mechanics', '')
@@ -371,8 +585,6 @@ class Config:
             # Vision-First Mode
             if 'vision_first' in data:
                 vf = data['vision_first']
-                config.vision_first_enabled = vf.get('enabled', False)
-                config.vision_first_context_template = vf.get('light_context_template', '')
 
                 # Vision-first also combines character + mechanics
                 vf_mechanics = vf.get('game_mechanics', '')
@@ -398,7 +610,20 @@ class Config:
 # Data Models
 # =============================================================================
 
-@dataclass
+_ENERGY_EMOJI = {"full": "💪", "good": "👍", "half": "😐", "low": "😓", "exhausted": "💀"}
+_WEATHER_EMOJI = {"sunny": "☀️", "rainy": "🌧️", "stormy": "⛈️", "snowy": "❄️"}
+
+# Fixed VLM perception vocabulary -> one shared str instance per value (literals are
+# interned), so parsed values compare by identity against the keys above
+_CANONICAL_STRINGS = {s: s for s in (*_ENERGY_EMOJI, *_WEATHER_EMOJI, *CARDINAL_DIRECTIONS, "unknown")}
+
+
+def _canonical_str(value: Any) -> Any:
+    """Swap a parsed vocabulary string for its shared instance (other values pass through)."""
+    return _CANONICAL_STRINGS.get(value, value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True)
 class Action:
     """An action to execute."""
     action_type: str
@@ -406,7 +631,7 @@ class Action:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ThinkResult:
     """Result of a unified think() call - perception + plan combined."""
     # Perception
@@ -434,6 +659,103 @@ class ThinkResult:
     parse_error: str = ""
 
 
+@dataclass(slots=True)
+class _TickContext:
+    """Game state snapshot taken once per tick, with the hot fields pre-extracted."""
+    game_state: Optional[Dict[str, Any]] = None   # Fresh /state payload (None if fetch failed)
+    data: Dict[str, Any] = field(default_factory=dict)  # Fresh state, or last good state
+    location_name: str = ""
+    hour: int = 6
+    day: int = 0
+    time_data: Dict[str, Any] = field(default_factory=dict)
+    player_tile: Optional[Tuple[int, int]] = None
+    current_tool: Optional[str] = None
+
+
+# Optional: json-repair parses malformed VLM JSON in one pass (see UnifiedVLM._loads_repaired)
+try:
+    from json_repair import repair_json as _repair_json_objects
+except ImportError:
+    _repair_json_objects = None
+
+# JSON repair patterns for malformed VLM output, used without json-repair (see UnifiedVLM._repair_json)
+_RE_TRAILING_COMMA = re.compile(r',(\s*[}\]])')
+_RE_MISSING_COMMA_NEWLINE = re.compile(r'(["}\]\d]|true|false|null)\s*\n\s*(")')
+_RE_MISSING_COMMA_INLINE = re.compile(r'(["\d])\s+("(?:inner_monologue|perception|mood|reasoning|actions|farming_eval)")')
+_RE_MISSING_COMMA_OBJECT = re.compile(r'([}\]])\s*\n\s*(\{)')
+_RE_UNQUOTED_FIRST_KEY = re.compile(r'{\s*(\w+):')
+_RE_UNQUOTED_KEY = re.compile(r',\s*(\w+):')
+
+
+def _skill_action_params(action_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Params for skills and unknown action types: capture the common fields."""
+    params = {}
+    # target_direction is used by clearing/farming skills
+    if "direction" in action_data:
+        params["target_direction"] = normalize_direction(action_data["direction"])
+    if "target_direction" in action_data:
+        params["target_direction"] = normalize_direction(action_data["target_direction"])
+    if "slot" in action_data:
+        params["slot"] = action_data["slot"]
+    if "seed_slot" in action_data:
+        params["seed_slot"] = action_data["seed_slot"]
+    return params
+
+
+def _no_action_params(action_data: Dict[str, Any]) -> Dict[str, Any]:
+    return {}
+
+
+# Debug dumps (failed VLM JSON) are written by a daemon thread so disk I/O stays off
+# the agent loop; full queue -> dump dropped, like CommentaryWorker.push
+_debug_dump_queue: "queue.Queue[Tuple[str, str]]" = queue.Queue(maxsize=32)
+_debug_dump_thread: Optional[threading.Thread] = None
+
+
+def _debug_dump_loop() -> None:
+    while True:
+        path, content = _debug_dump_queue.get()
+        try:
+            with open(path, "w") as f:
+                f.write(content)
+        except OSError:
+            pass
+
+
+def _write_debug_dump(path: str, content: str) -> None:
+    """Queue a debug file write for the background dump thread (non-blocking)."""
+    global _debug_dump_thread
+    if _debug_dump_thread is None:
+        _debug_dump_thread = threading.Thread(target=_debug_dump_loop, name="debug-dump", daemon=True)
+        _debug_dump_thread.start()
+    try:
+        _debug_dump_queue.put_nowait((path, content))
+    except queue.Full:
+        pass
+
+
+# Stand-in image URL in VLM payloads; _post_chat splices the real base64 data URL into
+# the serialized body at this spot
+_IMAGE_URL_PLACEHOLDER = "__STARDEWAI_IMAGE_DATA_URL__"
+_IMAGE_URL_PLACEHOLDER_BYTES = _IMAGE_URL_PLACEHOLDER.encode()
+
+# Per-type param extraction for _parse_response (one dict probe instead of an if/elif chain)
+_ACTION_PARAM_BUILDERS = {
+    "move": lambda a: {"direction": normalize_direction(a.get("direction", "south")),
+                       "duration": a.get("duration", 0.5)},
+    "button": lambda a: {"button": a.get("button", "a")},
+    "wait": lambda a: {"seconds": a.get("seconds", 1)},
+    "interact": _no_action_params,
+    "harvest": lambda a: {"direction": normalize_direction(a.get("direction", ""))},  # Optional facing direction
+    "use_tool": _no_action_params,
+    "cancel": _no_action_params,
+    "menu": _no_action_params,
+    "warp": lambda a: {"location": a.get("location", "farm")},
+    "face": lambda a: {"direction": normalize_direction(a.get("direction", "south"))},
+    "select_slot": lambda a: {"slot": a.get("slot", 0)},
+}
+
+
 # =============================================================================
 # Unified VLM - Single model for vision + planning
 # =============================================================================
@@ -443,38 +765,167 @@ class UnifiedVLM:
 
     def __init__(self, config: Config):
         self.config = config
-        self.client = httpx.Client(timeout=config.request_timeout)
         self.url = config.server_url
         self.model = config.model
+        # One warm keep-alive pool for think/reason/think_vision_first - all hit the same endpoint
+        self.client = httpx.Client(**self._client_kwargs())
+        self._img_mime = config.image_encode_format.lower()
+        self._img_url_prefix = f"data:image/{self._img_mime};base64,".encode()
+        self._sct = None  # mss screenshotter, created on first capture_screen()
+        self._monitor: Optional[Dict[str, int]] = None  # Geometry of config.monitor, bound with _sct
+        self._crop_rects: Dict[tuple, Dict[str, int]] = {}  # crop_region items -> grab rect on _monitor
+        self._enc_buf = io.BytesIO()  # Reused by image_to_base64, guarded by _enc_lock
+        self._enc_lock = threading.Lock()  # athink* encodes in a worker thread; commentary encodes on the loop
+        self._aclient: Optional[httpx.AsyncClient] = None  # Created on first async call (see _apost_chat)
+
+        # Prompts and generation params are fixed after config load - build them once
+        # and only attach the per-call user message (see _chat_payload)
+        self._think_system = {"role": "system", "content": config.system_prompt}
+        self._vision_first_system = {
+            "role": "system",
+            "content": config.vision_first_system_prompt or config.system_prompt,
+        }
+        self._reason_system = {
+            "role": "system",
+            "content": "You are Elias, an AI farmer in Stardew Valley. Think carefully and respond concisely.",
+        }
+        # cache_prompt: llama-server reuses the KV cache for the unchanged system-prompt prefix
+        self._vision_params = {"max_tokens": config.max_tokens, "temperature": config.temperature, "cache_prompt": True}
+        self._reason_params = {"max_tokens": 500, "temperature": 0.7, "cache_prompt": True}  # Shorter for reasoning
+
+    def _client_kwargs(self) -> Dict[str, Any]:
+        """llama-server connection settings shared by the sync client and the async one."""
+        return {
+            "base_url": self.url,
+            "http2": HAS_H2,
+            "timeout": httpx.Timeout(self.config.request_timeout, connect=5.0),
+            "limits": httpx.Limits(max_keepalive_connections=4, max_connections=8, keepalive_expiry=60.0),
+            "headers": {"Accept": "application/json", "Content-Type": "application/json"},
+        }
+
+    def close(self):
+        """Close the HTTP client and its pooled connections, and the screenshotter."""
+        self.client.close()
+        if self._sct is not None:
+            self._sct.close()
+            self._sct = None
+            self._monitor = None
+            self._crop_rects.clear()
+
+    async def aclose(self):
+        """Close the async HTTP client used by athink/athink_vision_first."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+    def _chat_payload(self, system_msg: Dict[str, str], user_content: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Assemble a chat-completions payload from a prebuilt system message and params."""
+        return {
+            "model": self.model,
+            "messages": [system_msg, {"role": "user", "content": user_content}],
+            **params,
+        }
+
+    def _encode_body(self, payload: Dict[str, Any], img_b64: Optional[bytes]) -> bytes:
+        """Serialize a chat-completions payload to the request body.
+
+        The body is pre-serialized with _json_dumps (orjson when installed). When
+        img_b64 is given, the payload carries _IMAGE_URL_PLACEHOLDER as its image URL
+        and the base64 bytes are spliced into the body there, so the screenshot is
+        never copied into a data-URL str and re-encoded by the serializer.
+        """
+        body = _json_dumps(payload)
+        if img_b64 is not None:
+            head, tail = body.split(_IMAGE_URL_PLACEHOLDER_BYTES, 1)
+            body = b"".join((head, self._img_url_prefix, img_b64, tail))
+        return body
+
+    def _post_chat(self, payload: Dict[str, Any], img_b64: Optional[bytes] = None) -> str:
+        """POST a chat-completions payload and return the reply text."""
+        response = self.client.post("/v1/chat/completions", content=self._encode_body(payload, img_b64))
+        response.raise_for_status()
+        return _json_loads(response.content)["choices"][0]["message"]["content"]
+
+    async def _apost_chat(self, payload: Dict[str, Any], img_b64: Optional[bytes] = None) -> str:
+        """Async _post_chat on a lazily created AsyncClient (bound to the running loop)."""
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(**self._client_kwargs())
+        response = await self._aclient.post("/v1/chat/completions", content=self._encode_body(payload, img_b64))
+        response.raise_for_status()
+        return _json_loads(response.content)["choices"][0]["message"]["content"]
+
+    def _vision_error_result(self, error: Exception, label: str) -> ThinkResult:
+        """ThinkResult that waits out a failed think/think_vision_first request."""
+        if isinstance(error, httpx.ConnectError):
+            logging.error(f"Cannot connect to {self.url} - is llama-server running?")
+            return ThinkResult(
+                reasoning="ERROR: Cannot connect to model server",
+                actions=[Action("wait", {"seconds": 2}, "Waiting for server")],
+                timestamp=time.time()
+            )
+        logging.error(f"{label} failed: {error}")
+        return ThinkResult(
+            reasoning=f"ERROR: {error}",
+            actions=[Action("wait", {"seconds": 2}, "Error recovery")],
+            timestamp=time.time()
+        )
 
     def capture_screen(self, crop_region: Optional[Dict[str, float]] = None) -> Image.Image:
         """Capture screen, optionally cropping to a region (for split-screen)."""
-        with mss() as sct:
-            shot = sct.grab(sct.monitors[self.config.monitor])
-            img = Image.frombytes("RGB", shot.size, shot.bgra, "raw", "BGRX")
+        if self._sct is None:
+            from mss import mss  # Deferred: only needed once the agent is running
+            self._sct = mss()  # Kept open so the XShm/DXGI grab buffers are reused
+            self._monitor = self._sct.monitors[self.config.monitor]
+        monitor = self._monitor
 
-        # Crop for split-screen co-op (e.g., right half for Player 2)
+        # Crop for split-screen co-op (e.g., right half for Player 2) - grab only that region
         if crop_region and crop_region.get('enabled', True):
-            w, h = img.size
-            x1 = int(w * crop_region.get('x_start', 0))
-            x2 = int(w * crop_region.get('x_end', 1))
-            y1 = int(h * crop_region.get('y_start', 0))
-            y2 = int(h * crop_region.get('y_end', 1))
-            img = img.crop((x1, y1, x2, y2))
+            crop_key = tuple(crop_region.items())
+            region = self._crop_rects.get(crop_key)
+            if region is None:
+                w, h = monitor["width"], monitor["height"]
+                x1 = int(w * crop_region.get('x_start', 0))
+                x2 = int(w * crop_region.get('x_end', 1))
+                y1 = int(h * crop_region.get('y_start', 0))
+                y2 = int(h * crop_region.get('y_end', 1))
+                region = {"left": monitor["left"] + x1, "top": monitor["top"] + y1,
+                          "width": x2 - x1, "height": y2 - y1}
+                self._crop_rects[crop_key] = region
+            monitor = region
+
+        shot = self._sct.grab(monitor)
+        img = Image.frombytes("RGB", shot.size, shot.bgra, "raw", "BGRX")
 
         # Resize for faster processing
-        if max(img.size) > self.config.max_image_size:
+        if self.config.vlm_input_size:
+            # Model-native size: the server-side encoder gets the same grid every frame
+            if img.size != self.config.vlm_input_size:
+                img = img.resize(self.config.vlm_input_size, Image.LANCZOS, reducing_gap=_RESIZE_REDUCING_GAP)
+        elif max(img.size) > self.config.max_image_size:
             ratio = self.config.max_image_size / max(img.size)
             new_size = (int(img.width * ratio), int(img.height * ratio))
-            img = img.resize(new_size, Image.LANCZOS)
+            img = img.resize(new_size, Image.LANCZOS, reducing_gap=_RESIZE_REDUCING_GAP)
 
         return img
 
-    def image_to_base64(self, img: Image.Image) -> str:
-        """Convert image to base64."""
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        return base64.b64encode(buffer.getvalue()).decode("utf-8")
+    def image_to_base64(self, img: Image.Image) -> bytes:
+        """Convert image to base64 in the configured encoding (see _img_mime).
+
+        Encodes into the shared _enc_buf under _enc_lock.
+        """
+        buffer = self._enc_buf
+        fmt = self.config.image_encode_format
+        with self._enc_lock:
+            buffer.seek(0)  # No truncate(): it would shrink the allocation we want to keep
+            if fmt == "JPEG":
+                img.save(buffer, format="JPEG", quality=85, subsampling=2, optimize=False)
+            elif fmt == "WEBP":
+                img.save(buffer, format="WEBP", quality=85, method=0)
+            else:
+                img.save(buffer, format=fmt)
+            size = buffer.tell()  # Bytes past this are a stale tail from a larger earlier frame
+            with buffer.getbuffer() as view, view[:size] as data:
+                return _b64encode(data)
 
     def think(self, img: Image.Image, goal: str = "", spatial_context: str = "", memory_context: str = "", action_context: str = "") -> ThinkResult:
         """
@@ -488,6 +939,35 @@ class UnifiedVLM:
             memory_context: Optional memory context (NPC info, past experiences)
         """
         start_time = time.time()
+        payload, img_b64 = self._think_payload(img, goal, spatial_context, memory_context, action_context)
+
+        try:
+            content = self._post_chat(payload, img_b64)
+            latency = (time.time() - start_time) * 1000
+
+            return self._parse_response(content, latency)
+
+        except Exception as e:
+            return self._vision_error_result(e, "Think")
+
+    async def athink(self, img: Image.Image, goal: str = "", spatial_context: str = "", memory_context: str = "", action_context: str = "") -> ThinkResult:
+        """think() for the agent loop: encodes in a worker thread and awaits the request."""
+        start_time = time.time()
+        payload, img_b64 = await asyncio.to_thread(
+            self._think_payload, img, goal, spatial_context, memory_context, action_context
+        )
+
+        try:
+            content = await self._apost_chat(payload, img_b64)
+            latency = (time.time() - start_time) * 1000
+
+            return self._parse_response(content, latency)
+
+        except Exception as e:
+            return self._vision_error_result(e, "Think")
+
+    def _think_payload(self, img: Image.Image, goal: str, spatial_context: str, memory_context: str, action_context: str) -> Tuple[Dict[str, Any], bytes]:
+        """Encode the screenshot and build the think() payload."""
         img_b64 = self.image_to_base64(img)
 
         # Build user prompt with all context
@@ -500,47 +980,11 @@ class UnifiedVLM:
             user_prompt += f"\n\n{spatial_context}"
         user_prompt += "\n\nAnalyze this Stardew Valley screenshot and plan your next actions."
 
-        payload = {
-            "model": self.model,
-            "messages": [
-                {"role": "system", "content": self.config.system_prompt},
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{img_b64}"}},
-                        {"type": "text", "text": user_prompt}
-                    ]
-                }
-            ],
-            "max_tokens": self.config.max_tokens,
-            "temperature": self.config.temperature,
-        }
-
-        try:
-            response = self.client.post(
-                f"{self.url}/v1/chat/completions",
-                json=payload
-            )
-            response.raise_for_status()
-            content = response.json()["choices"][0]["message"]["content"]
-            latency = (time.time() - start_time) * 1000
-
-            return self._parse_response(content, latency)
-
-        except httpx.ConnectError:
-            logging.error(f"Cannot connect to {self.url} - is llama-server running?")
-            return ThinkResult(
-                reasoning="ERROR: Cannot connect to model server",
-                actions=[Action("wait", {"seconds": 2}, "Waiting for server")],
-                timestamp=time.time()
-            )
-        except Exception as e:
-            logging.error(f"Think failed: {e}")
-            return ThinkResult(
-                reasoning=f"ERROR: {e}",
-                actions=[Action("wait", {"seconds": 2}, "Error recovery")],
-                timestamp=time.time()
-            )
+        payload = self._chat_payload(self._think_system, [
+            {"type": "image_url", "image_url": {"url": _IMAGE_URL_PLACEHOLDER}},
+            {"type": "text", "text": user_prompt}
+        ], self._vision_params)
+        return payload, img_b64
 
     def reason(self, prompt: str) -> str:
         """
@@ -550,23 +994,10 @@ class UnifiedVLM:
         """
         start_time = time.time()
 
-        payload = {
-            "model": self.model,
-            "messages": [
-                {"role": "system", "content": "You are Elias, an AI farmer in Stardew Valley. Think carefully and respond concisely."},
-                {"role": "user", "content": prompt}
-            ],
-            "max_tokens": 500,  # Shorter for reasoning
-            "temperature": 0.7,
-        }
+        payload = self._chat_payload(self._reason_system, prompt, self._reason_params)
 
         try:
-            response = self.client.post(
-                f"{self.url}/v1/chat/completions",
-                json=payload
-            )
-            response.raise_for_status()
-            content = response.json()["choices"][0]["message"]["content"]
+            content = self._post_chat(payload)
             latency = (time.time() - start_time) * 1000
             logging.info(f"🧠 VLM reason completed in {latency:.0f}ms")
             return content
@@ -597,6 +1028,41 @@ class UnifiedVLM:
             lessons: Previous failures/corrections from LessonMemory
         """
         start_time = time.time()
+        payload, img_b64 = self._vision_first_payload(img, goal, light_context, lessons)
+
+        try:
+            content = self._post_chat(payload, img_b64)
+            latency = (time.time() - start_time) * 1000
+
+            return self._parse_vision_first_response(content, latency)
+
+        except Exception as e:
+            return self._vision_error_result(e, "Vision-first think")
+
+    async def athink_vision_first(
+        self,
+        img: Image.Image,
+        goal: str = "",
+        light_context: str = "",
+        lessons: str = "",
+    ) -> ThinkResult:
+        """think_vision_first() for the agent loop: encodes in a worker thread and awaits the request."""
+        start_time = time.time()
+        payload, img_b64 = await asyncio.to_thread(
+            self._vision_first_payload, img, goal, light_context, lessons
+        )
+
+        try:
+            content = await self._apost_chat(payload, img_b64)
+            latency = (time.time() - start_time) * 1000
+
+            return self._parse_vision_first_response(content, latency)
+
+        except Exception as e:
+            return self._vision_error_result(e, "Vision-first think")
+
+    def _vision_first_payload(self, img: Image.Image, goal: str, light_context: str, lessons: str) -> Tuple[Dict[str, Any], bytes]:
+        """Encode the screenshot and build the think_vision_first() payload."""
         img_b64 = self.image_to_base64(img)
 
         # Build minimal user prompt
@@ -612,51 +1078,13 @@ class UnifiedVLM:
         user_prompt = "\n".join(user_parts)
 
         # Use vision-first system prompt
-        system_prompt = self.config.vision_first_system_prompt or self.config.system_prompt
-
-        payload = {
-            "model": self.model,
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {
-                    "role": "user",
-                    "content": [
-                        # Image FIRST - primary input
-                        {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{img_b64}"}},
-                        # Then minimal text context
-                        {"type": "text", "text": user_prompt}
-                    ]
-                }
-            ],
-            "max_tokens": self.config.max_tokens,
-            "temperature": self.config.temperature,
-        }
-
-        try:
-            response = self.client.post(
-                f"{self.url}/v1/chat/completions",
-                json=payload
-            )
-            response.raise_for_status()
-            content = response.json()["choices"][0]["message"]["content"]
-            latency = (time.time() - start_time) * 1000
-
-            return self._parse_vision_first_response(content, latency)
-
-        except httpx.ConnectError:
-            logging.error(f"Cannot connect to {self.url} - is llama-server running?")
-            return ThinkResult(
-                reasoning="ERROR: Cannot connect to model server",
-                actions=[Action("wait", {"seconds": 2}, "Waiting for server")],
-                timestamp=time.time()
-            )
-        except Exception as e:
-            logging.error(f"Vision-first think failed: {e}")
-            return ThinkResult(
-                reasoning=f"ERROR: {e}",
-                actions=[Action("wait", {"seconds": 2}, "Error recovery")],
-                timestamp=time.time()
-            )
+        payload = self._chat_payload(self._vision_first_system, [
+            # Image FIRST - primary input
+            {"type": "image_url", "image_url": {"url": _IMAGE_URL_PLACEHOLDER}},
+            # Then minimal text context
+            {"type": "text", "text": user_prompt}
+        ], self._vision_params)
+        return payload, img_b64
 
     def _parse_vision_first_response(self, content: str, latency_ms: float) -> ThinkResult:
         """
@@ -686,7 +1114,7 @@ class UnifiedVLM:
                 data = json.loads(json_str)
             except json.JSONDecodeError:
                 try:
-                    data = json.loads(self._repair_json(json_str))
+                    data = self._loads_repaired(json_str)
                 except json.JSONDecodeError as e:
                     logging.warning(f"Vision-first JSON parse failed: {e}")
 
@@ -723,35 +1151,35 @@ class UnifiedVLM:
 
         return result
 
+    def _loads_repaired(self, text: str) -> Dict[str, Any]:
+        """Parse malformed VLM JSON, preferring json-repair's single-pass repairer.
+
+        Raises json.JSONDecodeError when no JSON object can be recovered, like json.loads.
+        """
+        if _repair_json_objects is None:
+            return json.loads(self._repair_json(text))
+        data = _repair_json_objects(text, return_objects=True)
+        if not isinstance(data, dict) or not data:
+            raise json.JSONDecodeError("json-repair could not recover an object", text, 0)
+        return data
+
     def _repair_json(self, text: str) -> str:
         """Attempt to repair common JSON issues from VLM output."""
         # Remove trailing commas before } or ]
-        text = re.sub(r',(\s*[}\]])', r'\1', text)
-
-        # Add missing commas between "value" "key" patterns (newline)
-        text = re.sub(r'(")\s*\n\s*(")', r'\1,\n\2', text)
+        text = _RE_TRAILING_COMMA.sub(r'\1', text)
 
-        # Add missing commas between } "key" patterns
-        text = re.sub(r'(})\s*\n\s*(")', r'\1,\n\2', text)
-
-        # Add missing commas between ] "key" patterns
-        text = re.sub(r'(])\s*\n\s*(")', r'\1,\n\2', text)
+        # Add missing commas between a value/}/]/literal/number and a "key" on the next line
+        text = _RE_MISSING_COMMA_NEWLINE.sub(r'\1,\n\2', text)
 
         # Add missing commas between value and "key" on same line
-        text = re.sub(r'(["\d])\s+("(?:inner_monologue|perception|mood|reasoning|actions|farming_eval)")', r'\1, \2', text)
-
-        # Fix missing comma after true/false/null followed by "key"
-        text = re.sub(r'(true|false|null)\s*\n\s*(")', r'\1,\n\2', text)
-
-        # Fix missing comma after number followed by "key"
-        text = re.sub(r'(\d)\s*\n\s*(")', r'\1,\n\2', text)
+        text = _RE_MISSING_COMMA_INLINE.sub(r'\1, \2', text)
 
         # Fix missing comma between closing bracket/brace and opening on next line
-        text = re.sub(r'([}\]])\s*\n\s*(\{)', r'\1,\n\2', text)
+        text = _RE_MISSING_COMMA_OBJECT.sub(r'\1,\n\2', text)
 
         # Fix unquoted keys (common VLM mistake)
-        text = re.sub(r'{\s*(\w+):', r'{"\1":', text)
-        text = re.sub(r',\s*(\w+):', r', "\1":', text)
+        text = _RE_UNQUOTED_FIRST_KEY.sub(r'{"\1":', text)
+        text = _RE_UNQUOTED_KEY.sub(r', "\1":', text)
 
         return text
 
@@ -766,25 +1194,31 @@ class UnifiedVLM:
         data = None
         parse_error = ""
 
-        # Strategy 1: Try to extract JSON from markdown code block
-        json_block = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
-        if json_block:
-            try:
-                data = json.loads(json_block.group(1))
-            except json.JSONDecodeError:
-                # Try with repair
-                try:
-                    data = json.loads(self._repair_json(json_block.group(1)))
-                except json.JSONDecodeError as e:
-                    parse_error = f"JSON parse failed (code block): {e}"
+        # Candidate JSON texts in preference order: (strategy label, text)
+        candidates: List[Tuple[str, str]] = []
+
+        # Strategy 1: Try to extract JSON from markdown code block (plain scan, no DOTALL regex)
+        fence = content.find("```")
+        if fence >= 0:
+            fence_end = content.find("```", fence + 3)
+            if fence_end > 0:
+                block = content[fence + 3:fence_end].removeprefix("json").strip()
+                if block.startswith("{") and block.endswith("}"):
+                    candidates.append(("code block", block))
+                    try:
+                        data = json.loads(block)  # Well-formed fenced reply: skip the brace scan
+                    except json.JSONDecodeError:
+                        pass
 
-        # Strategy 2: Find balanced braces for first complete JSON object
         if data is None:
+            # Strategies 2 + 3 share one "{" / "}" scan of the response
             start = content.find("{")
-            if start >= 0:
+            last_end = content.rfind("}") + 1
+            if start >= 0 and last_end > start:
+                # Strategy 2: Find balanced braces for first complete JSON object
                 depth = 0
                 end = start
-                for i, c in enumerate(content[start:], start):
+                for i, c in enumerate(content[start:last_end], start):
                     if c == '{':
                         depth += 1
                     elif c == '}':
@@ -793,39 +1227,39 @@ class UnifiedVLM:
                             end = i + 1
                             break
                 if end > start:
-                    json_str = content[start:end]
-                    try:
-                        data = json.loads(json_str)
-                    except json.JSONDecodeError:
-                        # Try with repair
-                        try:
-                            data = json.loads(self._repair_json(json_str))
-                        except json.JSONDecodeError as e:
-                            parse_error = f"JSON parse failed (balanced braces): {e}"
-
-        # Strategy 3: Fallback - try first { to last }
-        if data is None:
-            start = content.find("{")
-            end = content.rfind("}") + 1
-            if start >= 0 and end > start:
-                json_str = content[start:end]
+                    candidates.append(("balanced braces", content[start:end]))
+                # Strategy 3: Fallback - try first { to last } (unless that is the slice above)
+                if last_end != end:
+                    candidates.append(("fallback", content[start:last_end]))
+
+            # Plain parse of every remaining candidate first; repair only when none is valid JSON
+            tried = candidates[0][1] if candidates and candidates[0][0] == "code block" else None
+            for _, text in candidates:
+                if text == tried:  # Already failed json.loads above
+                    continue
                 try:
-                    data = json.loads(json_str)
+                    data = json.loads(text)
+                    break
                 except json.JSONDecodeError:
-                    # Try with repair
+                    pass
+            else:
+                repaired = set()
+                for label, text in candidates:
+                    if text in repaired:
+                        continue
+                    repaired.add(text)
                     try:
-                        data = json.loads(self._repair_json(json_str))
+                        data = self._loads_repaired(text)
                         logging.info("JSON repaired successfully")
+                        break
                     except json.JSONDecodeError as e:
-                        logging.warning(f"JSON parse failed: {e}")
-                        logging.warning(f"Raw VLM response (first 800 chars): {content[:800]}")
-                        # Save failed JSON to file for debugging
-                        try:
-                            with open("/tmp/vlm_failed_json.txt", "w") as f:
-                                f.write(content)
-                        except:
-                            pass
-                        parse_error = f"JSON parse failed (fallback): {e}"
+                        parse_error = f"JSON parse failed ({label}): {e}"
+
+                if data is None and candidates:
+                    logging.warning(parse_error)
+                    logging.warning(f"Raw VLM response (first 800 chars): {content[:800]}")
+                    # Save failed JSON to file for debugging
+                    _write_debug_dump("/tmp/vlm_failed_json.txt", content)
 
         # Extract data if we got valid JSON
         if data:
@@ -835,9 +1269,9 @@ class UnifiedVLM:
                 perception = data.get("perception", {})
                 result.location = perception.get("location", "Unknown")
                 result.time_of_day = perception.get("time", "")
-                result.energy = perception.get("energy", "unknown")
+                result.energy = _canonical_str(perception.get("energy", "unknown"))
                 result.holding = perception.get("holding", "")
-                result.weather = perception.get("weather", "")
+                result.weather = _canonical_str(perception.get("weather", ""))
                 result.nearby_objects = perception.get("nearby", [])
                 result.menu_open = perception.get("menu_open", False)
 
@@ -851,42 +1285,8 @@ class UnifiedVLM:
                 # Actions
                 for action_data in data.get("actions", []):
                     action_type = action_data.get("type", "wait")
-                    params = {}
-
-                    if action_type == "move":
-                        params["direction"] = normalize_direction(action_data.get("direction", "south"))
-                        params["duration"] = action_data.get("duration", 0.5)
-                    elif action_type == "button":
-                        params["button"] = action_data.get("button", "a")
-                    elif action_type == "wait":
-                        params["seconds"] = action_data.get("seconds", 1)
-                    elif action_type == "interact":
-                        pass  # No extra params needed
-                    elif action_type == "harvest":
-                        params["direction"] = normalize_direction(action_data.get("direction", ""))  # Optional facing direction
-                    elif action_type == "use_tool":
-                        pass  # No extra params needed
-                    elif action_type == "cancel":
-                        pass  # No extra params needed
-                    elif action_type == "menu":
-                        pass  # No extra params needed
-                    elif action_type == "warp":
-                        params["location"] = action_data.get("location", "farm")
-                    elif action_type == "face":
-                        params["direction"] = normalize_direction(action_data.get("direction", "south"))
-                    elif action_type == "select_slot":
-                        params["slot"] = action_data.get("slot", 0)
-                    else:
-                        # Skills and unknown actions: capture common params
-                        # target_direction is used by clearing/farming skills
-                        if "direction" in action_data:
-                            params["target_direction"] = normalize_direction(action_data.get("direction", ""))
-                        if "target_direction" in action_data:
-                            params["target_direction"] = normalize_direction(action_data.get("target_direction", ""))
-                        if "slot" in action_data:
-                            params["slot"] = action_data.get("slot", 0)
-                        if "seed_slot" in action_data:
-                            params["seed_slot"] = action_data.get("seed_slot", 5)
+                    builder = _ACTION_PARAM_BUILDERS.get(action_type)
+                    params = builder(action_data) if builder else _skill_action_params(action_data)
 
                     result.actions.append(Action(
                         action_type=action_type,
@@ -912,6 +1312,113 @@ class UnifiedVLM:
 # ModBridgeController - SMAPI mod HTTP API
 # =============================================================================
 
+def _mod_move_payload(params: Dict[str, Any]) -> Dict[str, Any]:
+    direction = normalize_direction(params.get("direction", ""))
+    tiles = params.get("tiles", 1)
+    # Convert duration-based moves to tile-based
+    if "duration" in params:
+        tiles = max(1, int(params["duration"] * 3))  # ~3 tiles per second
+    return {"action": "move_direction", "direction": direction, "tiles": tiles}
+
+
+def _mod_warp_payload(params: Dict[str, Any]) -> Dict[str, Any]:
+    location = params.get("location", "").lower()
+    if location == "farm" or location == "outside":
+        return {"action": "warp_to_farm"}
+    elif location == "house" or location == "farmhouse":
+        return {"action": "warp_to_house"}
+    elif location:
+        return {"action": "warp_location", "location": location}
+    # Default: warp to farm if no location specified
+    return {"action": "warp_to_farm"}
+
+
+# ModBridgeController.execute: action type -> /action payload builder (one dict probe instead of an
+# if/elif chain). Aliases share a builder; actions needing polling/validation live in _EXECUTE_HANDLERS.
+_MOD_ACTION_PAYLOADS = {
+    "move": _mod_move_payload,
+    "interact": lambda p: {"action": "interact_facing"},
+    "harvest": lambda p: {"action": "harvest", "direction": normalize_direction(p.get("direction", ""))},
+    "use_tool": lambda p: {"action": "use_tool", "direction": normalize_direction(p.get("direction", ""))},
+    "face": lambda p: {"action": "face", "direction": normalize_direction(p.get("direction", "south"))},
+    "warp": _mod_warp_payload,
+    # Session 127: "equip_tool" alias used by batch mining
+    "equip": lambda p: {"action": "equip_tool", "tool": p.get("tool", "")},
+    "equip_tool": lambda p: {"action": "equip_tool", "tool": p.get("tool", "")},
+    "select_slot": lambda p: {"action": "select_slot", "slot": p.get("slot", 0)},
+    "menu": lambda p: {"action": "toggle_menu"},
+    "cancel": lambda p: {"action": "cancel"},
+    "dismiss_menu": lambda p: {"action": "dismiss_menu"},
+    "sleep": lambda p: {"action": "go_to_bed"},
+    "go_to_bed": lambda p: {"action": "go_to_bed"},
+    "toolbar_next": lambda p: {"action": "toolbar_next"},
+    "toolbar_right": lambda p: {"action": "toolbar_next"},
+    "toolbar_prev": lambda p: {"action": "toolbar_prev"},
+    "toolbar_left": lambda p: {"action": "toolbar_prev"},
+    "ship": lambda p: {"action": "ship", "slot": p.get("slot", -1)},
+    "buy_backpack": lambda p: {"action": "buy_backpack"},
+    # Session 131: Crafting action
+    "craft": lambda p: {"action": "craft", "item": p.get("item", ""), "quantity": p.get("quantity", 1)},
+    # Session 131: Chest operations
+    "open_chest": lambda p: {"action": "open_chest", "direction": normalize_direction(p.get("direction", "south"))},
+    "close_chest": lambda p: {"action": "close_chest"},
+    "deposit_item": lambda p: {"action": "deposit_item", "slot": p.get("slot", 0),
+                               "quantity": p.get("quantity", -1)},  # -1 = all
+    "withdraw_item": lambda p: {"action": "withdraw_item", "slot": p.get("slot", 0),
+                                "quantity": p.get("quantity", -1)},
+    "withdraw_by_name": lambda p: {"action": "withdraw_by_name", "item": p.get("item", ""),
+                                   "quantity": p.get("quantity", 1)},
+    # Session 131: Place item (for placing crafted items like chest/scarecrow)
+    "place_item": lambda p: {"action": "place_item",
+                             "direction": normalize_direction(p.get("direction", p.get("value", "south")))},
+    "upgrade_tool": lambda p: {"action": "upgrade_tool", "tool": p.get("tool", "")},
+    "collect_upgraded_tool": lambda p: {"action": "collect_upgraded_tool"},
+    # Mining actions
+    "enter_mine_level": lambda p: {"action": "enter_mine_level", "level": p.get("level", 1)},
+    "use_ladder": lambda p: {"action": "use_ladder"},
+    # Session 127: Descend to next mine level (works from entrance or ladder)
+    "descend_mine": lambda p: {"action": "descend_mine"},
+    "swing_weapon": lambda p: {"action": "swing_weapon", "direction": p.get("direction", "")},
+}
+
+# Seed shop prices (lowercase item name -> gold) for "buy" with quantity "max"/"auto"
+_SEED_BUY_PRICES = {
+    "parsnip seeds": 20, "cauliflower seeds": 80,
+    "potato seeds": 50, "kale seeds": 70, "garlic seeds": 40,
+    "bean starter": 60, "melon seeds": 80, "tomato seeds": 50,
+    "blueberry seeds": 80, "pepper seeds": 40, "radish seeds": 40,
+    "pumpkin seeds": 100, "cranberry seeds": 240, "grape starter": 60,
+    "wheat seeds": 10, "corn seeds": 150,
+}
+
+
+@dataclass(slots=True)
+class _TileHintContext:
+    """Per-prompt values read by the ModBridgeController._tile_hint_* handlers."""
+    state: Optional[Dict[str, Any]]
+    data: Dict[str, Any]
+    player: Dict[str, Any]
+    inventory: List[Dict[str, Any]]
+    player_x: int
+    player_y: int
+    tile_obj: Optional[str]
+    can_till: bool
+    can_plant: bool
+    current_tool: str
+    current_tool_lower: str
+    holding_crop_danger: bool
+    unwatered_count: int
+    harvestable_count: int
+    dry_other_count: int
+    nearest_unwatered: Optional[Dict[str, Any]]
+    nearest_harvestable: Optional[Dict[str, Any]]
+    nearest_dry_other: Optional[Dict[str, Any]]
+
+
+# Transport errors meaning the mod is gone (not a slow or failed request) - see _mark_down
+_MOD_DOWN_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+
 class ModBridgeController:
     """Controller that uses SMAPI mod HTTP API for precise game control.
     
@@ -919,51 +1426,131 @@ class ModBridgeController:
     All endpoints are available: /state, /farm, /npcs, /animals, /machines, etc.
     """
 
+    # Repeat /state and /surroundings polls within this window (well under one tick)
+    # reuse the last response; sending an action invalidates them
+    _STATE_TTL = 0.08
+    # While the mod is down, HTTP calls return immediately and /health is re-probed at most this often
+    _PROBE_INTERVAL = 5.0
+    # Localhost refuses a dead port instantly - don't let the probe sit on a long connect timeout
+    _PROBE_TIMEOUT = httpx.Timeout(2.0, connect=0.2)
+
     def __init__(self, base_url: str = "http://localhost:8790"):
         self.base_url = base_url
         self.enabled = True
+        self._last_probe = float("-inf")
+        # One keep-alive pool for every mod poll/action instead of a fresh connection per call
+        self._client = httpx.Client(
+            base_url=base_url,
+            timeout=5,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+            headers={"Content-Type": "application/json"},  # /action bodies are pre-serialized
+        )
+        # (monotonic fetch time, data) of the last /state and /surroundings poll - see _STATE_TTL
+        self._state_cache: Tuple[float, Optional[Dict[str, Any]]] = (float("-inf"), None)
+        self._surroundings_cache: Tuple[float, Optional[Dict[str, Any]]] = (float("-inf"), None)
+        self._invalidated_at = float("-inf")  # Polls started before this are not cached (see invalidate)
+        # (inventory list, seed slot, seed name) - _first_seed result for the current /state payload
+        self._first_seed_cache: Tuple[Optional[list], Optional[int], Optional[str]] = (None, None, None)
+        # (state, surroundings, hint) - _get_done_farming_hint result for the current poll payloads
+        self._done_hint_cache: Tuple[Optional[dict], Optional[dict], str] = (None, None, "")
         # Session 120: Unified SMAPI client for all game data
         self.smapi = SMAPIClient(base_url)
         self._check_connection()
 
+    def close(self):
+        """Close the pooled HTTP connections to the mod."""
+        self._client.close()
+
     def _check_connection(self) -> bool:
         """Check if mod is responding."""
+        self._last_probe = time.monotonic()
         try:
-            resp = httpx.get(f"{self.base_url}/health", timeout=2)
+            resp = self._client.get("/health", timeout=self._PROBE_TIMEOUT)
             if resp.status_code == 200:
                 logging.info(f"ModBridge connected at {self.base_url}")
+                self.enabled = True
                 return True
         except Exception as e:
-            logging.warning(f"ModBridge not available: {e}")
+            if self.enabled:
+                logging.warning(f"ModBridge not available: {e}")
+            else:
+                logging.debug(f"ModBridge still not available: {e}")
             self.enabled = False
         return False
 
+    def _mark_down(self, error: Exception) -> None:
+        """The mod stopped accepting connections mid-run: skip requests until the next /health probe."""
+        logging.warning(f"ModBridge connection lost: {error}")
+        self.enabled = False
+        self._last_probe = time.monotonic()
+
+    def _available(self) -> bool:
+        """True if the mod is up; while it's down, re-probe /health at most every _PROBE_INTERVAL."""
+        if not self.enabled and time.monotonic() - self._last_probe >= self._PROBE_INTERVAL:
+            self._check_connection()
+        return self.enabled
+
+    def invalidate(self) -> None:
+        """Drop the cached /state and /surroundings so the next poll refetches.
+
+        Called once an /action request has returned; a poll already in flight (e.g. in a
+        to_thread) started before the action took effect, so its result is not cached.
+        """
+        self._invalidated_at = time.monotonic()
+        self._state_cache = self._surroundings_cache = (float("-inf"), None)
+
     def get_state(self) -> Optional[Dict[str, Any]]:
         """Get current game state from mod."""
+        fetched_at, cached = self._state_cache
+        now = time.monotonic()
+        if cached is not None and now - fetched_at < self._STATE_TTL:
+            return cached
+        if not self._available():
+            return None
         try:
-            resp = httpx.get(f"{self.base_url}/state", timeout=5)
+            resp = self._client.get("/state")
             if resp.status_code == 200:
-                return resp.json().get("data", {})
+                data = _json_loads(resp.content).get("data", {})
+                if now > self._invalidated_at:
+                    self._state_cache = (now, data)
+                return data
+        except _MOD_DOWN_ERRORS as e:
+            self._mark_down(e)
         except Exception as e:
             logging.error(f"Failed to get state: {e}")
         return None
 
     def get_surroundings(self) -> Optional[Dict[str, Any]]:
         """Get directional surroundings from mod - what's blocked in each direction."""
+        fetched_at, cached = self._surroundings_cache
+        now = time.monotonic()
+        if cached is not None and now - fetched_at < self._STATE_TTL:
+            return cached
+        if not self._available():
+            return None
         try:
-            resp = httpx.get(f"{self.base_url}/surroundings", timeout=2)
+            resp = self._client.get("/surroundings", timeout=2)
             if resp.status_code == 200:
-                return resp.json().get("data", {})
+                data = _json_loads(resp.content).get("data", {})
+                if now > self._invalidated_at:
+                    self._surroundings_cache = (now, data)
+                return data
+        except _MOD_DOWN_ERRORS as e:
+            self._mark_down(e)
         except Exception as e:
             logging.debug(f"Failed to get surroundings: {e}")
         return None
 
     def get_farm(self) -> Optional[Dict[str, Any]]:
         """Get Farm state regardless of current location - for morning planning."""
+        if not self._available():
+            return None
         try:
-            resp = httpx.get(f"{self.base_url}/farm", timeout=5)
+            resp = self._client.get("/farm")
             if resp.status_code == 200:
-                return resp.json().get("data", {})
+                return _json_loads(resp.content).get("data", {})
+        except _MOD_DOWN_ERRORS as e:
+            self._mark_down(e)
         except Exception as e:
             logging.debug(f"Failed to get farm state: {e}")
         return None
@@ -978,14 +1565,15 @@ class ModBridgeController:
         Returns:
             Set of (x, y) tuples that can be tilled, or None if endpoint unavailable.
         """
+        if not self._available():
+            return None
         try:
-            resp = httpx.get(
-                f"{self.base_url}/tillable-area",
+            resp = self._client.get(
+                "/tillable-area",
                 params={"centerX": center_x, "centerY": center_y, "radius": radius},
-                timeout=5
             )
             if resp.status_code == 200:
-                data = resp.json().get("data", {})
+                data = _json_loads(resp.content).get("data", {})
                 if data.get("success") == False:  # Endpoint exists but failed
                     logging.warning(f"Tillable area query failed: {data.get('error')}")
                     return None
@@ -993,12 +1581,15 @@ class ModBridgeController:
                 for tile in data.get("tiles", []):
                     if tile.get("canTill", False):
                         tillable.add((tile.get("x"), tile.get("y")))
-                logging.info(f"🌱 Tillable area: {len(tillable)} tiles in radius {radius} around ({center_x},{center_y})")
+                logging.info("🌱 Tillable area: %d tiles in radius %s around (%s,%s)", len(tillable), radius, center_x, center_y)
                 return tillable
             else:
                 # Endpoint not found (older mod version)
                 logging.warning(f"Tillable area endpoint returned {resp.status_code} - update SMAPI mod")
                 return None
+        except _MOD_DOWN_ERRORS as e:
+            self._mark_down(e)
+            return None
         except Exception as e:
             logging.warning(f"Failed to get tillable area: {e}")
             return None
@@ -1213,24 +1804,41 @@ class ModBridgeController:
 
     def format_surroundings(self) -> str:
         """Format surroundings as text for VLM prompt with facing direction emphasis."""
-        data = self.get_surroundings()
-        state = self.get_state()
+        return self._format_surroundings(self.get_surroundings(), self.get_state())
+
+    async def format_surroundings_async(self) -> str:
+        """format_surroundings() with the /surroundings and /state polls in flight together."""
+        data, state = await asyncio.gather(
+            asyncio.to_thread(self.get_surroundings),
+            asyncio.to_thread(self.get_state),
+        )
+        return self._format_surroundings(data, state)
+
+    def _format_surroundings(self, data: Optional[Dict[str, Any]], state: Optional[Dict[str, Any]]) -> str:
+        """Build the format_surroundings() text from already-fetched surroundings and state."""
         if not data:
             return ""
 
-        dirs = normalize_directions_map(data.get("directions", {}))
+        dirs = normalize_directions_map(data.get("directions") or _EMPTY_DICT)
+
+        # State sections read by the hints below - look them up once (state may be None)
+        player = (state.get("player") or _EMPTY_DICT) if state else _EMPTY_DICT
+        location = (state.get("location") or _EMPTY_DICT) if state else _EMPTY_DICT
+        inventory = (state.get("inventory") or _EMPTY_LIST) if state else _EMPTY_LIST
+        crops = location.get("crops") or _EMPTY_LIST
+        player_x = player.get("tileX", 0)
+        player_y = player.get("tileY", 0)
 
         # Get facing direction from game state
         facing_dir = None
         if state:
-            facing_map = {0: "north", 1: "east", 2: "south", 3: "west"}
-            facing_dir = facing_map.get(state.get("player", {}).get("facingDirection"))
+            facing_dir = _FACING_NAMES.get(player.get("facingDirection"))
 
         # Format all directions
         parts = []
         front_info = ""
         for direction in CARDINAL_DIRECTIONS:
-            info = dirs.get(direction, {})
+            info = dirs.get(direction) or _EMPTY_DICT
             if info.get("clear"):
                 tiles = info.get("tilesUntilBlocked", "?")
                 desc = f"{direction}: clear ({tiles} tiles)"
@@ -1239,8 +1847,9 @@ class ModBridgeController:
             else:
                 blocker = info.get("blocker", "obstacle")
                 tiles = info.get("tilesUntilBlocked", 0)
+                is_water = "water" in blocker.lower()
                 # Special case: water is not a blocker, it's a resource!
-                if "water" in blocker.lower():
+                if is_water:
                     desc = f"{direction}: 💧 WATER ({tiles} tile{'s' if tiles != 1 else ''}) - refill here!"
                 elif tiles > 1:
                     # Can walk some tiles before hitting blocker
@@ -1249,16 +1858,14 @@ class ModBridgeController:
                     # Immediately blocked
                     desc = f"{direction}: BLOCKED ({blocker})"
                 if direction == facing_dir:
-                    if "water" in blocker.lower():
+                    if is_water:
                         front_info = f">>> 💧 WATER SOURCE! DO: refill_watering_can direction={facing_dir} <<<"
-                    elif blocker in ["Weeds", "Grass"]:
-                        front_info = f"IN FRONT OF YOU: {blocker} - use SCYTHE to clear!"
-                    elif blocker == "Stone":
-                        front_info = f"IN FRONT OF YOU: {blocker} - use PICKAXE to break!"
-                    elif blocker in ["Tree", "Stump"]:
-                        front_info = f"IN FRONT OF YOU: {blocker} - use AXE to chop!"
                     else:
-                        front_info = f"IN FRONT OF YOU: {blocker}"
+                        tool = BLOCKER_TOOL.get(blocker)
+                        if tool:
+                            front_info = f"IN FRONT OF YOU: {blocker} - use {tool} to {BLOCKER_VERB.get(blocker, 'clear')}!"
+                        else:
+                            front_info = f"IN FRONT OF YOU: {blocker}"
             parts.append(desc)
 
         result = "DIRECTIONS: " + " | ".join(parts)
@@ -1266,13 +1873,12 @@ class ModBridgeController:
         # Add hint if surrounded by clearable debris
         clearable_debris = []
         for direction in CARDINAL_DIRECTIONS:
-            info = dirs.get(direction, {})
+            info = dirs.get(direction) or _EMPTY_DICT
             if not info.get("clear"):
                 blocker = info.get("blocker", "")
                 dist = info.get("tilesUntilBlocked", 0)
-                if dist == 0 and blocker in ["Weeds", "Grass", "Stone", "Twig", "Wood"]:
-                    tool = "SCYTHE" if blocker in ["Weeds", "Grass"] else "PICKAXE" if blocker == "Stone" else "AXE"
-                    clearable_debris.append((direction, blocker, tool))
+                if dist == 0 and blocker in _CLEARABLE_DEBRIS:
+                    clearable_debris.append((direction, blocker, BLOCKER_TOOL[blocker]))
 
         if clearable_debris and not front_info:
             # Pick closest clearable debris
@@ -1280,43 +1886,69 @@ class ModBridgeController:
             front_info = f">>> BLOCKED! Face {d.upper()}, select {t}, use_tool to clear {b}! <<<"
 
         # Add current tile state from game data (more reliable than vision)
-        current_tile = data.get("currentTile", {})
-        current_tool = state.get("player", {}).get("currentTool", "Unknown") if state else "Unknown"
-        current_slot = state.get("player", {}).get("currentToolIndex", -1) if state else -1
+        current_tile = data.get("currentTile") or _EMPTY_DICT
+        current_tool = player.get("currentTool", "Unknown")
+        current_slot = player.get("currentToolIndex", -1)
+        current_tool_lower = current_tool.lower()
+        holding_crop_danger = any(tool in current_tool_lower for tool in _CROP_DANGEROUS_TOOLS)
 
         # EXPLICIT TOOL CONTEXT - VLM must know what's equipped!
         tool_info = f"🔧 EQUIPPED: {current_tool} (slot {current_slot})"
 
-        # Tool slot mapping for switch instructions (from constants)
-        tool_slots = TOOL_SLOTS
-
         if current_tile:
             tile_state = current_tile.get("state", "unknown")
             tile_obj = current_tile.get("object")
             can_till = current_tile.get("canTill", False)
             can_plant = current_tile.get("canPlant", False)
 
-            # Check if standing on a harvestable crop
-            player_x = state.get("player", {}).get("tileX", 0) if state else 0
-            player_y = state.get("player", {}).get("tileY", 0) if state else 0
-            crops = state.get("location", {}).get("crops", []) if state else []
-            crop_here = next((c for c in crops if c.get("x") == player_x and c.get("y") == player_y), None)
+            # Single pass over crops for every hint below: the crop we're standing on,
+            # plus count and nearest (Manhattan, first wins on ties) per category.
+            # "dry" also checks the legacy "watered" field (SMAPI inconsistency).
+            crop_here = None
+            unwatered_count = harvestable_count = dry_other_count = 0
+            nearest_unwatered = nearest_unwatered_other = None
+            nearest_harvestable = nearest_harvestable_other = nearest_dry_other = None
+            d_unwatered = d_unwatered_other = d_harvestable = d_harvestable_other = d_dry_other = float("inf")
+            for c in crops:
+                here = c.get("x") == player_x and c.get("y") == player_y
+                if here and crop_here is None:
+                    crop_here = c
+                unwatered = not c.get("isWatered", False)
+                ready = c.get("isReadyForHarvest", False)
+                dry = unwatered and not c.get("watered")
+                if not (unwatered or ready):
+                    continue
+                d = abs(c["x"] - player_x) + abs(c["y"] - player_y)
+                if unwatered:
+                    unwatered_count += 1
+                    if d < d_unwatered:
+                        nearest_unwatered, d_unwatered = c, d
+                    if not here and d < d_unwatered_other:
+                        nearest_unwatered_other, d_unwatered_other = c, d
+                if ready:
+                    harvestable_count += 1
+                    if d < d_harvestable:
+                        nearest_harvestable, d_harvestable = c, d
+                    if not here and d < d_harvestable_other:
+                        nearest_harvestable_other, d_harvestable_other = c, d
+                if dry and not here:
+                    dry_other_count += 1
+                    if d < d_dry_other:
+                        nearest_dry_other, d_dry_other = c, d
 
             # PRIORITY CHECK: Empty watering can + unwatered crops = REFILL FIRST
             # This prevents conflicting guidance (crop directions vs refill message)
             # BUT: Skip this hint if we're at a shop/building for a task (buying seeds, etc.)
-            water_left = state.get("player", {}).get("wateringCanWater", 0) if state else 0
-            unwatered_crops = [c for c in crops if not c.get("isWatered", False)]
-            current_location = state.get("location", {}).get("name", "") if state else ""
+            water_left = player.get("wateringCanWater", 0)
+            current_location = location.get("name", "")
             task_locations = ["SeedShop", "Blacksmith", "FishShop", "Hospital", "JojaMart", "Saloon"]
             at_task_location = current_location in task_locations
 
-            if water_left <= 0 and unwatered_crops and not at_task_location:
+            if water_left <= 0 and unwatered_count and not at_task_location:
                 # CAN IS EMPTY AND CROPS NEED WATER - REFILL IS THE ONLY PRIORITY
                 # Check if we're already AT the water (water is immediate blocker, 0-1 tiles)
-                directions = normalize_directions_map(data.get("directions", {}))
                 water_adjacent = None
-                for dir_name, dir_info in directions.items():
+                for dir_name, dir_info in dirs.items():
                     blocker = dir_info.get("blocker", "")
                     tiles_until = dir_info.get("tilesUntilBlocked", 99)
                     if blocker and "water" in blocker.lower() and tiles_until <= 1:
@@ -1339,8 +1971,7 @@ class ModBridgeController:
                         front_info = ">>> ⚠️ WATERING CAN EMPTY! DO: go_refill_watering_can <<<"
             elif at_task_location:
                 # At a shop/building - give location-specific guidance
-                money = state.get("player", {}).get("money", 0) if state else 0
-                inventory = state.get("inventory", []) if state else []
+                money = player.get("money", 0)
                 has_seeds = any(i and "seed" in i.get("name", "").lower() for i in inventory)
                 if current_location == "SeedShop":
                     if not has_seeds and money >= 20:
@@ -1362,18 +1993,13 @@ class ModBridgeController:
                 elif crop_here.get("isWatered"):
                     # Crop is growing and watered - find something else to do
                     days_left = crop_here.get("daysUntilHarvest", "?")
-                    # Check for other unwatered crops
-                    other_unwatered = [c for c in crops if not c.get("isWatered", False)
-                                      and (c.get("x") != player_x or c.get("y") != player_y)]
-                    # Check for harvestable crops elsewhere
-                    other_harvestable = [c for c in crops if c.get("isReadyForHarvest", False)
-                                        and (c.get("x") != player_x or c.get("y") != player_y)]
-                    if other_unwatered:
-                        nearest = min(other_unwatered, key=lambda c: abs(c["x"] - player_x) + abs(c["y"] - player_y))
+                    # Other unwatered crops first, then harvestable crops elsewhere
+                    if nearest_unwatered_other:
+                        nearest = nearest_unwatered_other
                         adj_hint = self._calc_adjacent_hint(nearest["x"] - player_x, nearest["y"] - player_y, action="water")
                         front_info = f">>> 🌱 {crop_name} growing ({days_left} days). Move to water other crops! {adj_hint} <<<"
-                    elif other_harvestable:
-                        nearest = min(other_harvestable, key=lambda c: abs(c["x"] - player_x) + abs(c["y"] - player_y))
+                    elif nearest_harvestable_other:
+                        nearest = nearest_harvestable_other
                         adj_hint = self._calc_adjacent_hint(nearest["x"] - player_x, nearest["y"] - player_y, action="harvest")
                         front_info = f">>> 🌱 {crop_name} growing ({days_left} days). {adj_hint} <<<"
                     else:
@@ -1382,231 +2008,43 @@ class ModBridgeController:
                 else:
                     # Crop needs watering - but we're ON it, need to step off and face it
                     front_info = f">>> 🌱 {crop_name} needs water! Step off crop, face it, then water_crop. <<<"
-            elif tile_state == "tilled":
-                # Check if player has seeds before showing plant message
-                inventory = state.get("inventory", []) if state else []
-                # Find first seed slot (not just check existence)
-                seed_slot = None
-                seed_name = None
-                for item in inventory:
-                    item_name = item.get("name", "")
-                    if "Seed" in item_name or item_name == "Mixed Seeds":
-                        seed_slot = item.get("slot")
-                        seed_name = item_name
-                        break
-
-                if seed_slot is not None:
-                    if "Seed" in current_tool or current_tool == "Mixed Seeds":
-                        front_info = f">>> 🌱🌱🌱 PLANT NOW! TILE IS TILLED! You have {current_tool}! DO: use_tool 🌱🌱🌱 <<<"
-                    else:
-                        front_info = f">>> 🌱🌱🌱 PLANT NOW! TILE IS TILLED! DO: select_slot {seed_slot} ({seed_name}), THEN use_tool! 🌱🌱🌱 <<<"
-                else:
-                    # No seeds - check for other priorities (shipping, clearing)
-                    if unwatered_crops:
-                        front_info = ">>> TILE: TILLED (empty, no seeds) - Move to find PLANTED crops to water! <<<"
-                    else:
-                        # All watered, no seeds - use done farming hint (suggests shipping if items)
-                        front_info = self._get_done_farming_hint(state, data)
-            elif tile_state == "planted":
-                # CROP PROTECTION: Warn if holding wrong tool
-                dangerous_tools = ["Scythe", "Hoe", "Pickaxe", "Axe"]
-                if any(tool.lower() in current_tool.lower() for tool in dangerous_tools):
-                    front_info = f">>> ⚠️ CROP HERE! DO NOT use {current_tool}! Use water_crop skill! <<<"
-                else:
-                    # Check watering can water level
-                    water_left = state.get("player", {}).get("wateringCanWater", 0) if state else 0
-                    water_max = state.get("player", {}).get("wateringCanMax", 40) if state else 40
-
-                    if water_left <= 0:
-                        # Get nearest water location
-                        nearest_water = data.get("nearestWater")
-                        if nearest_water:
-                            water_dir = normalize_direction(nearest_water.get("direction", "nearby"))
-                            water_dist = nearest_water.get("distance", "?")
-                            front_info = f">>> WATERING CAN EMPTY! DO: go_refill_watering_can (water is {water_dist} tiles {water_dir}) <<<"
-                        else:
-                            front_info = ">>> WATERING CAN EMPTY! DO: go_refill_watering_can <<<"
-                    elif "Watering" in current_tool:
-                        front_info = f">>> TILE: PLANTED - You have {current_tool} ({water_left}/{water_max}), use_tool to WATER! <<<"
-                    else:
-                        front_info = f">>> TILE: PLANTED - Use water_crop skill! (can: {water_left}/{water_max}) <<<"
-            elif tile_state == "watered":
-                # Check if this is wet EMPTY soil (canPlant=true) vs planted+watered (canPlant=false)
-                if can_plant:
-                    # Wet empty soil from rain - check if player has seeds
-                    inventory = state.get("inventory", []) if state else []
-                    # Find first seed slot
-                    seed_slot = None
-                    seed_name = None
-                    for item in inventory:
-                        item_name = item.get("name", "")
-                        if "Seed" in item_name or item_name == "Mixed Seeds":
-                            seed_slot = item.get("slot")
-                            seed_name = item_name
-                            break
-
-                    if seed_slot is not None:
-                        if "Seed" in current_tool or current_tool == "Mixed Seeds":
-                            front_info = f">>> 🌱🌱🌱 WET TILLED SOIL - NEEDS PLANTING! You have {current_tool}! DO: use_tool NOW! 🌱🌱🌱 <<<"
-                        else:
-                            front_info = f">>> 🌱🌱🌱 WET TILLED SOIL - NEEDS PLANTING! DO: select_slot {seed_slot} ({seed_name}), THEN use_tool! 🌱🌱🌱 <<<"
-                    else:
-                        # No seeds - just wet empty soil
-                        if unwatered_crops:
-                            front_info = ">>> TILE: WET SOIL (no seeds) - Move to find PLANTED crops to water! <<<"
-                        else:
-                            # Check for harvestable crops before saying "all done"
-                            crops = state.get("location", {}).get("crops", []) if state else []
-                            harvestable = [c for c in crops if c.get("isReadyForHarvest", False)]
-                            if harvestable:
-                                player_x = state.get("player", {}).get("tileX", 0) if state else 0
-                                player_y = state.get("player", {}).get("tileY", 0) if state else 0
-                                nearest = min(harvestable, key=lambda c: abs(c["x"] - player_x) + abs(c["y"] - player_y))
-                                dx = nearest["x"] - player_x
-                                dy = nearest["y"] - player_y
-                                dist = abs(dx) + abs(dy)
-                                if dist == 1:
-                                    face_dir = "north" if dy < 0 else "south" if dy > 0 else "west" if dx < 0 else "east"
-                                    front_info = f">>> 🌾 HARVEST 1 tile {face_dir.upper()}! DO: face {face_dir}, harvest ({len(harvestable)} ready) <<<"
-                                else:
-                                    dirs = []
-                                    if dy < 0:
-                                        dirs.append(f"{abs(dy)} NORTH")
-                                    elif dy > 0:
-                                        dirs.append(f"{abs(dy)} SOUTH")
-                                    if dx < 0:
-                                        dirs.append(f"{abs(dx)} WEST")
-                                    elif dx > 0:
-                                        dirs.append(f"{abs(dx)} EAST")
-                                    direction_str = " and ".join(dirs) if dirs else "here"
-                                    front_info = f">>> 🌾 {len(harvestable)} READY! Move {direction_str}, then harvest <<<"
-                            else:
-                                front_info = ">>> TILE: WET SOIL (no seeds) - All crops watered! <<<"
-                else:
-                    # Actually planted and watered crop tile
-                    # CROP PROTECTION: Check for dangerous tools FIRST before any other logic
-                    dangerous_tools = ["Scythe", "Hoe", "Pickaxe", "Axe"]
-                    if tile_obj == "crop" and any(tool.lower() in current_tool.lower() for tool in dangerous_tools):
-                        front_info = f">>> ⚠️ WATERED CROP HERE! DO NOT use {current_tool}! This will DESTROY the crop! Move away or select safe tool. <<<"
-                    else:
-                        # Give specific direction to next unwatered crop
-                        crops = state.get("location", {}).get("crops", []) if state else []
-                        # Check both isWatered and watered fields (SMAPI inconsistency)
-                        unwatered_nearby = [c for c in crops if not c.get("isWatered") and not c.get("watered")]
-                        if unwatered_nearby:
-                            player_x = state.get("player", {}).get("tileX", 0) if state else 0
-                            player_y = state.get("player", {}).get("tileY", 0) if state else 0
-                            # Exclude current tile
-                            unwatered_others = [c for c in unwatered_nearby if c["x"] != player_x or c["y"] != player_y]
-                            if unwatered_others:
-                                nearest = min(unwatered_others, key=lambda c: abs(c["x"] - player_x) + abs(c["y"] - player_y))
-                                dx = nearest["x"] - player_x
-                                dy = nearest["y"] - player_y
-                                dist = abs(dx) + abs(dy)
-
-                                # If crop is exactly 1 tile away, use FACE + use_tool (don't move onto the crop!)
-                                # Use adjacent movement hint (stop 1 tile away from crop)
-                                adj_hint = self._calc_adjacent_hint(dx, dy, action="use_tool")
-                                front_info = f">>> TILE: WATERED ✓ - NEXT CROP: {adj_hint} ({len(unwatered_others)} more) <<<"
-                            else:
-                                front_info = self._get_done_farming_hint(state, data)
-                        else:
-                            front_info = self._get_done_farming_hint(state, data)
-            elif tile_state == "debris":
-                needed_tool = "Scythe" if tile_obj in ["Weeds", "Grass"] else "Pickaxe" if tile_obj == "Stone" else "Axe"
-                needed_slot = tool_slots.get(needed_tool, 4)
-                if needed_tool.lower() in current_tool.lower():
-                    front_info = f">>> TILE: {tile_obj} - You have {current_tool}, use_tool to clear! <<<"
-                else:
-                    front_info = f">>> TILE: {tile_obj} - select_slot {needed_slot} for {needed_tool.upper()}, then use_tool! <<<"
-            elif tile_state == "clear" and can_till:
-                # Priority: 1) Harvest ready crops, 2) Water unwatered crops, 3) Till/plant
-                crops = state.get("location", {}).get("crops", []) if state else []
-                player_x = state.get("player", {}).get("tileX", 0) if state else 0
-                player_y = state.get("player", {}).get("tileY", 0) if state else 0
-
-                # HARVEST FIRST - check for ready-to-harvest crops
-                harvestable = [c for c in crops if c.get("isReadyForHarvest", False)]
-                if harvestable:
-                    nearest = min(harvestable, key=lambda c: abs(c["x"] - player_x) + abs(c["y"] - player_y))
-                    dx = nearest["x"] - player_x
-                    dy = nearest["y"] - player_y
-                    adj_hint = self._calc_adjacent_hint(dx, dy, action="harvest")
-                    front_info = f">>> 🌾 {len(harvestable)} CROPS READY TO HARVEST! {adj_hint} <<<"
-                else:
-                    # No harvestable - check for unwatered crops
-                    unwatered = [c for c in crops if not c.get("isWatered", False)]
-                    if unwatered:
-                        nearest = min(unwatered, key=lambda c: abs(c["x"] - player_x) + abs(c["y"] - player_y))
-                        dx = nearest["x"] - player_x
-                        dy = nearest["y"] - player_y
-                        adj_hint = self._calc_adjacent_hint(dx, dy, action="water")
-                        front_info = f">>> {len(unwatered)} CROPS NEED WATERING! {adj_hint} <<<"
-                    else:
-                        # No unwatered crops - check if we have seeds before suggesting tilling
-                        inventory = state.get("inventory", []) if state else []
-                        has_seeds = any(item and "seed" in item.get("name", "").lower() for item in inventory)
-                        if has_seeds:
-                            if "Hoe" in current_tool:
-                                front_info = f">>> TILE: CLEAR DIRT - You have {current_tool}, use_tool to TILL! <<<"
-                            else:
-                                front_info = ">>> TILE: CLEAR DIRT - Use till_soil skill to prepare for planting! <<<"
-                        else:
-                            # No seeds - use done farming hint (will suggest shipping/clearing)
-                            front_info = self._get_done_farming_hint(state, data)
-            elif tile_state == "clear" or tile_state == "blocked":
-                # Priority: 1) Harvest ready crops, 2) Water unwatered crops, 3) Done farming
-                crops = state.get("location", {}).get("crops", []) if state else []
-                player_x = state.get("player", {}).get("tileX", 0) if state else 0
-                player_y = state.get("player", {}).get("tileY", 0) if state else 0
-
-                # HARVEST FIRST - check for ready-to-harvest crops
-                harvestable = [c for c in crops if c.get("isReadyForHarvest", False)]
-                if harvestable:
-                    nearest = min(harvestable, key=lambda c: abs(c["x"] - player_x) + abs(c["y"] - player_y))
-                    dx = nearest["x"] - player_x
-                    dy = nearest["y"] - player_y
-                    adj_hint = self._calc_adjacent_hint(dx, dy, action="harvest")
-                    front_info = f">>> 🌾 {len(harvestable)} CROPS READY TO HARVEST! {adj_hint} <<<"
-                else:
-                    # No harvestable - check for unwatered crops
-                    unwatered = [c for c in crops if not c.get("isWatered", False)]
-                    if unwatered:
-                        nearest = min(unwatered, key=lambda c: abs(c["x"] - player_x) + abs(c["y"] - player_y))
-                        dx = nearest["x"] - player_x
-                        dy = nearest["y"] - player_y
-                        adj_hint = self._calc_adjacent_hint(dx, dy, action="water")
-                        front_info = f">>> TILE: NOT FARMABLE - {len(unwatered)} CROPS! {adj_hint} <<<"
-                    else:
-                        # All crops watered, none harvestable - check for sellables, debris, bed
-                        front_info = self._get_done_farming_hint(state, data)
+            else:
+                handler = self._TILE_HINT_HANDLERS.get(tile_state)
+                if handler is not None:
+                    front_info = handler(self, _TileHintContext(
+                        state=state,
+                        data=data,
+                        player=player,
+                        inventory=inventory,
+                        player_x=player_x,
+                        player_y=player_y,
+                        tile_obj=tile_obj,
+                        can_till=can_till,
+                        can_plant=can_plant,
+                        current_tool=current_tool,
+                        current_tool_lower=current_tool_lower,
+                        holding_crop_danger=holding_crop_danger,
+                        unwatered_count=unwatered_count,
+                        harvestable_count=harvestable_count,
+                        dry_other_count=dry_other_count,
+                        nearest_unwatered=nearest_unwatered,
+                        nearest_harvestable=nearest_harvestable,
+                        nearest_dry_other=nearest_dry_other,
+                    ))
 
         # Add explicit location verification at the very top to prevent hallucination
-        location_name = state.get("location", {}).get("name", "Unknown") if state else "Unknown"
-        player_x = state.get("player", {}).get("tileX", 0) if state else 0
-        player_y = state.get("player", {}).get("tileY", 0) if state else 0
+        location_name = location.get("name", "Unknown")
         location_header = f"📍 LOCATION: {location_name} at tile ({player_x}, {player_y})"
 
         # Add shipping bin info when on Farm
         shipping_info = ""
+        bin_x, bin_y = _shipping_bin_xy(location)  # Also used by the priority shipping action below
         if location_name == "Farm" and state:
-            shipping_bin = state.get("location", {}).get("shippingBin")
-            if shipping_bin:
-                bin_x = shipping_bin.get("x", 71)
-                bin_y = shipping_bin.get("y", 14)
+            if location.get("shippingBin"):
                 dx = bin_x - player_x
                 dy = bin_y - player_y
                 distance = abs(dx) + abs(dy)
-                bin_dirs = []
-                if dy < 0:
-                    bin_dirs.append(f"{abs(dy)} NORTH")
-                elif dy > 0:
-                    bin_dirs.append(f"{abs(dy)} SOUTH")
-                if dx < 0:
-                    bin_dirs.append(f"{abs(dx)} WEST")
-                elif dx > 0:
-                    bin_dirs.append(f"{abs(dx)} EAST")
-                bin_dir_str = " and ".join(bin_dirs) if bin_dirs else "here"
+                bin_dir_str = _format_manhattan(dx, dy)
                 shipping_info = f"📦 SHIPPING BIN: {distance} tiles away ({bin_dir_str})"
 
         landmark_hint = ""
@@ -1643,16 +2081,6 @@ class ModBridgeController:
             dx_to_bed = bed_x - player_x
             bed_distance = abs(dx_to_bed) + abs(dy_to_bed)
 
-            bed_dirs = []
-            if dy_to_bed < 0:
-                bed_dirs.append(f"{abs(dy_to_bed)} NORTH")
-            elif dy_to_bed > 0:
-                bed_dirs.append(f"{dy_to_bed} SOUTH")
-            if dx_to_bed > 0:
-                bed_dirs.append(f"{dx_to_bed} EAST")
-            elif dx_to_bed < 0:
-                bed_dirs.append(f"{abs(dx_to_bed)} WEST")
-
             if bed_distance <= 1:
                 # Tell agent exactly which direction to face
                 if dy_to_bed < 0:
@@ -1665,7 +2093,7 @@ class ModBridgeController:
                     face_dir = "WEST"
                 bed_hint = f"🛏️ BED: Adjacent! Face {face_dir} and interact to sleep."
             else:
-                bed_hint = f"🛏️ BED: {bed_distance} tiles away ({' and '.join(bed_dirs)}). Walk there, face it, interact to sleep."
+                bed_hint = f"🛏️ BED: {bed_distance} tiles away ({_format_manhattan(dx_to_bed, dy_to_bed)}). Walk there, face it, interact to sleep."
 
             # FarmHouse exit is at south edge - walk SOUTH to exit through door
             # Door mat is around (3, 12) - walk south to trigger exit
@@ -1696,16 +2124,7 @@ class ModBridgeController:
             dy = farmhouse_y - player_y
             distance = abs(dx) + abs(dy)
             if distance > 0:
-                dirs = []
-                if dy < 0:
-                    dirs.append(f"{abs(dy)} NORTH")
-                elif dy > 0:
-                    dirs.append(f"{abs(dy)} SOUTH")
-                if dx < 0:
-                    dirs.append(f"{abs(dx)} WEST")
-                elif dx > 0:
-                    dirs.append(f"{abs(dx)} EAST")
-                location_hint = f"🏠 FARMHOUSE DOOR: {distance} tiles away ({' and '.join(dirs)})"
+                location_hint = f"🏠 FARMHOUSE DOOR: {distance} tiles away ({_format_manhattan(dx, dy)})"
 
         # Assemble result with explicit tool context always visible
         header_parts = [location_header, tool_info]
@@ -1717,32 +2136,17 @@ class ModBridgeController:
         # Add PRIORITY shipping action when sellables in inventory (more prominent than tile hints)
         priority_action = ""
         if location_name == "Farm" and state:
-            inventory = state.get("inventory", [])
-            sellable_items = ["Parsnip", "Potato", "Cauliflower", "Green Bean", "Kale", "Melon",
-                             "Blueberry", "Corn", "Tomato", "Pumpkin", "Cranberry", "Eggplant", "Grape", "Radish"]
-            sellables = [item for item in inventory if item and item.get("name") in sellable_items and item.get("stack", 0) > 0]
-            if sellables:
-                total_to_ship = sum(item.get("stack", 0) for item in sellables)
+            _, total_to_ship, _ = _inventory_summary(inventory)
+            if total_to_ship:
                 # Calculate distance to shipping bin
-                shipping_bin = state.get("location", {}).get("shippingBin") or {}
-                bin_x = shipping_bin.get("x", 71)
-                bin_y = shipping_bin.get("y", 14)
                 dx = bin_x - player_x
                 dy = bin_y - player_y
                 dist = abs(dx) + abs(dy)
                 if dist <= 1:
                     priority_action = f"⭐ PRIORITY ACTION: SHIP {total_to_ship} CROPS! At bin! DO: ship_item"
                 else:
-                    dirs = []
-                    if dy < 0:
-                        dirs.append(f"{abs(dy)} north")
-                    elif dy > 0:
-                        dirs.append(f"{abs(dy)} south")
-                    if dx < 0:
-                        dirs.append(f"{abs(dx)} west")
-                    elif dx > 0:
-                        dirs.append(f"{abs(dx)} east")
-                    priority_action = f"⭐ PRIORITY ACTION: SHIP {total_to_ship} CROPS! Move {', '.join(dirs)} to bin, then ship_item"
+                    bin_dir_str = _format_manhattan(dx, dy, ", ", caps=False)
+                    priority_action = f"⭐ PRIORITY ACTION: SHIP {total_to_ship} CROPS! Move {bin_dir_str} to bin, then ship_item"
         if priority_action:
             header_parts.append(priority_action)
 
@@ -1752,9 +2156,9 @@ class ModBridgeController:
         # Bedtime hint based on time and energy
         bedtime_hint = ""
         if state:
-            hour = state.get("time", {}).get("hour", 6)
-            energy = state.get("player", {}).get("energy", 270)
-            max_energy = state.get("player", {}).get("maxEnergy", 270)
+            hour = (state.get("time") or _EMPTY_DICT).get("hour", 6)
+            energy = player.get("energy", 270)
+            max_energy = player.get("maxEnergy", 270)
             energy_pct = (energy / max_energy * 100) if max_energy > 0 else 100
 
             if hour >= 24 or hour < 2:  # Midnight to 2 AM - critical
@@ -1776,13 +2180,175 @@ class ModBridgeController:
         header_parts.append(result)
         return "\n".join(header_parts)
 
+    # -------------------------------------------------------------------------
+    # Tile-state hints for _format_surroundings, dispatched on currentTile.state
+    # via _TILE_HINT_HANDLERS. Each returns the ">>> ... <<<" front_info line.
+    # -------------------------------------------------------------------------
+
+    def _first_seed(self, inventory: List[Dict[str, Any]]) -> Tuple[Optional[int], Optional[str]]:
+        """Slot and name of the first seed stack in the inventory, or (None, None).
+
+        Scanned once per /state payload - repeat prompts on the same (cached) state reuse it.
+        """
+        cached_inventory, seed_slot, seed_name = self._first_seed_cache
+        if cached_inventory is inventory:
+            return seed_slot, seed_name
+        seed_slot = seed_name = None
+        for item in inventory:
+            item_name = item.get("name", "")
+            if "Seed" in item_name or item_name == "Mixed Seeds":
+                seed_slot, seed_name = item.get("slot"), item_name
+                break
+        self._first_seed_cache = (inventory, seed_slot, seed_name)
+        return seed_slot, seed_name
+
+    def _tile_hint_tilled(self, ctx: "_TileHintContext") -> str:
+        # Check if player has seeds before showing plant message
+        # Find first seed slot (not just check existence)
+        seed_slot, seed_name = self._first_seed(ctx.inventory)
+        current_tool = ctx.current_tool
+        if seed_slot is not None:
+            if "Seed" in current_tool or current_tool == "Mixed Seeds":
+                return f">>> 🌱🌱🌱 PLANT NOW! TILE IS TILLED! You have {current_tool}! DO: use_tool 🌱🌱🌱 <<<"
+            return f">>> 🌱🌱🌱 PLANT NOW! TILE IS TILLED! DO: select_slot {seed_slot} ({seed_name}), THEN use_tool! 🌱🌱🌱 <<<"
+        # No seeds - check for other priorities (shipping, clearing)
+        if ctx.unwatered_count:
+            return ">>> TILE: TILLED (empty, no seeds) - Move to find PLANTED crops to water! <<<"
+        # All watered, no seeds - use done farming hint (suggests shipping if items)
+        return self._get_done_farming_hint(ctx.state, ctx.data)
+
+    def _tile_hint_planted(self, ctx: "_TileHintContext") -> str:
+        current_tool = ctx.current_tool
+        # CROP PROTECTION: Warn if holding wrong tool
+        if ctx.holding_crop_danger:
+            return f">>> ⚠️ CROP HERE! DO NOT use {current_tool}! Use water_crop skill! <<<"
+        # Check watering can water level
+        water_left = ctx.player.get("wateringCanWater", 0)
+        water_max = ctx.player.get("wateringCanMax", 40)
+        if water_left <= 0:
+            # Get nearest water location
+            nearest_water = ctx.data.get("nearestWater")
+            if nearest_water:
+                water_dir = normalize_direction(nearest_water.get("direction", "nearby"))
+                water_dist = nearest_water.get("distance", "?")
+                return f">>> WATERING CAN EMPTY! DO: go_refill_watering_can (water is {water_dist} tiles {water_dir}) <<<"
+            return ">>> WATERING CAN EMPTY! DO: go_refill_watering_can <<<"
+        if "Watering" in current_tool:
+            return f">>> TILE: PLANTED - You have {current_tool} ({water_left}/{water_max}), use_tool to WATER! <<<"
+        return f">>> TILE: PLANTED - Use water_crop skill! (can: {water_left}/{water_max}) <<<"
+
+    def _tile_hint_watered(self, ctx: "_TileHintContext") -> str:
+        current_tool = ctx.current_tool
+        # Check if this is wet EMPTY soil (canPlant=true) vs planted+watered (canPlant=false)
+        if ctx.can_plant:
+            # Wet empty soil from rain - check if player has seeds
+            seed_slot, seed_name = self._first_seed(ctx.inventory)
+            if seed_slot is not None:
+                if "Seed" in current_tool or current_tool == "Mixed Seeds":
+                    return f">>> 🌱🌱🌱 WET TILLED SOIL - NEEDS PLANTING! You have {current_tool}! DO: use_tool NOW! 🌱🌱🌱 <<<"
+                return f">>> 🌱🌱🌱 WET TILLED SOIL - NEEDS PLANTING! DO: select_slot {seed_slot} ({seed_name}), THEN use_tool! 🌱🌱🌱 <<<"
+            # No seeds - just wet empty soil
+            if ctx.unwatered_count:
+                return ">>> TILE: WET SOIL (no seeds) - Move to find PLANTED crops to water! <<<"
+            # Check for harvestable crops before saying "all done"
+            nearest = ctx.nearest_harvestable
+            if nearest:
+                dx = nearest["x"] - ctx.player_x
+                dy = nearest["y"] - ctx.player_y
+                if abs(dx) + abs(dy) == 1:
+                    face_dir = "north" if dy < 0 else "south" if dy > 0 else "west" if dx < 0 else "east"
+                    return f">>> 🌾 HARVEST 1 tile {face_dir.upper()}! DO: face {face_dir}, harvest ({ctx.harvestable_count} ready) <<<"
+                return f">>> 🌾 {ctx.harvestable_count} READY! Move {_format_manhattan(dx, dy)}, then harvest <<<"
+            return ">>> TILE: WET SOIL (no seeds) - All crops watered! <<<"
+
+        # Actually planted and watered crop tile
+        # CROP PROTECTION: Check for dangerous tools FIRST before any other logic
+        if ctx.tile_obj == "crop" and ctx.holding_crop_danger:
+            return f">>> ⚠️ WATERED CROP HERE! DO NOT use {current_tool}! This will DESTROY the crop! Move away or select safe tool. <<<"
+        # Give specific direction to next unwatered crop (excluding the current tile)
+        # Check both isWatered and watered fields (SMAPI inconsistency)
+        nearest = ctx.nearest_dry_other
+        if nearest:
+            # Use adjacent movement hint (stop 1 tile away from crop, don't move onto it)
+            adj_hint = self._calc_adjacent_hint(nearest["x"] - ctx.player_x, nearest["y"] - ctx.player_y, action="use_tool")
+            return f">>> TILE: WATERED ✓ - NEXT CROP: {adj_hint} ({ctx.dry_other_count} more) <<<"
+        return self._get_done_farming_hint(ctx.state, ctx.data)
+
+    def _tile_hint_debris(self, ctx: "_TileHintContext") -> str:
+        tile_obj = ctx.tile_obj
+        needed_tool = "Scythe" if tile_obj in ["Weeds", "Grass"] else "Pickaxe" if tile_obj == "Stone" else "Axe"
+        needed_slot = TOOL_SLOTS.get(needed_tool, 4)
+        if needed_tool.lower() in ctx.current_tool_lower:
+            return f">>> TILE: {tile_obj} - You have {ctx.current_tool}, use_tool to clear! <<<"
+        return f">>> TILE: {tile_obj} - select_slot {needed_slot} for {needed_tool.upper()}, then use_tool! <<<"
+
+    def _tile_hint_clear(self, ctx: "_TileHintContext") -> str:
+        if not ctx.can_till:
+            return self._tile_hint_blocked(ctx)
+        # Priority: 1) Harvest ready crops, 2) Water unwatered crops, 3) Till/plant
+        if ctx.nearest_harvestable:
+            nearest = ctx.nearest_harvestable
+            adj_hint = self._calc_adjacent_hint(nearest["x"] - ctx.player_x, nearest["y"] - ctx.player_y, action="harvest")
+            return f">>> 🌾 {ctx.harvestable_count} CROPS READY TO HARVEST! {adj_hint} <<<"
+        if ctx.nearest_unwatered:
+            nearest = ctx.nearest_unwatered
+            adj_hint = self._calc_adjacent_hint(nearest["x"] - ctx.player_x, nearest["y"] - ctx.player_y, action="water")
+            return f">>> {ctx.unwatered_count} CROPS NEED WATERING! {adj_hint} <<<"
+        # No unwatered crops - check if we have seeds before suggesting tilling
+        if any(item and "seed" in item.get("name", "").lower() for item in ctx.inventory):
+            if "Hoe" in ctx.current_tool:
+                return f">>> TILE: CLEAR DIRT - You have {ctx.current_tool}, use_tool to TILL! <<<"
+            return ">>> TILE: CLEAR DIRT - Use till_soil skill to prepare for planting! <<<"
+        # No seeds - use done farming hint (will suggest shipping/clearing)
+        return self._get_done_farming_hint(ctx.state, ctx.data)
+
+    def _tile_hint_blocked(self, ctx: "_TileHintContext") -> str:
+        # Priority: 1) Harvest ready crops, 2) Water unwatered crops, 3) Done farming
+        if ctx.nearest_harvestable:
+            nearest = ctx.nearest_harvestable
+            adj_hint = self._calc_adjacent_hint(nearest["x"] - ctx.player_x, nearest["y"] - ctx.player_y, action="harvest")
+            return f">>> 🌾 {ctx.harvestable_count} CROPS READY TO HARVEST! {adj_hint} <<<"
+        if ctx.nearest_unwatered:
+            nearest = ctx.nearest_unwatered
+            adj_hint = self._calc_adjacent_hint(nearest["x"] - ctx.player_x, nearest["y"] - ctx.player_y, action="water")
+            return f">>> TILE: NOT FARMABLE - {ctx.unwatered_count} CROPS! {adj_hint} <<<"
+        # All crops watered, none harvestable - check for sellables, debris, bed
+        return self._get_done_farming_hint(ctx.state, ctx.data)
+
+    # tile state -> hint handler; states not listed keep the facing-direction hint
+    _TILE_HINT_HANDLERS = {
+        "tilled": _tile_hint_tilled,
+        "planted": _tile_hint_planted,
+        "watered": _tile_hint_watered,
+        "debris": _tile_hint_debris,
+        "clear": _tile_hint_clear,
+        "blocked": _tile_hint_blocked,
+    }
+
     def _get_done_farming_hint(self, state: dict, surroundings: dict) -> str:
-        """Get hint when all crops are watered - check for harvest, then suggest clearing debris or bed."""
+        """Get hint when all crops are watered - check for harvest, then suggest clearing debris or bed.
+
+        Memoized on the (TTL-cached) /state and /surroundings payloads - repeat prompts within
+        one poll window reuse the hint instead of rescanning crops, inventory and objects.
+        """
+        cached_state, cached_surroundings, hint = self._done_hint_cache
+        if state is not None and state is cached_state and surroundings is cached_surroundings:
+            return hint
+        hint = self._build_done_farming_hint(state, surroundings)
+        self._done_hint_cache = (state, surroundings, hint)
+        return hint
+
+    def _build_done_farming_hint(self, state: dict, surroundings: dict) -> str:
+        """Uncached body of _get_done_farming_hint."""
         if not state:
             return ">>> ALL CROPS WATERED! ✓ Go to bed or explore. <<<"
 
+        player = state.get("player") or _EMPTY_DICT
+        location_data = state.get("location") or _EMPTY_DICT
+        time_data = state.get("time") or _EMPTY_DICT
+
         # Session 124: Location awareness - don't give farm hints outside Farm
-        location = state.get("location", {}).get("name", "") if state else ""
+        location = location_data.get("name", "")
         if "Mine" in location:
             # In mines - give mining hint, not farming hint
             return ">>> ⛏️ IN MINES! Break rocks to find ladder. Use Pickaxe on rocks. <<<"
@@ -1790,69 +2356,46 @@ class ModBridgeController:
             # Not on farm - no farming hints (let other systems handle)
             return ""
 
-        hour = state.get("time", {}).get("hour", 12)
-        energy = state.get("player", {}).get("energy", 100)
-        energy_pct = (energy / state.get("player", {}).get("maxEnergy", 270) * 100) if state.get("player", {}).get("maxEnergy", 270) > 0 else 100
-        player_x = state.get("player", {}).get("tileX", 0)
-        player_y = state.get("player", {}).get("tileY", 0)
+        hour = time_data.get("hour", 12)
+        energy = player.get("energy", 100)
+        max_energy = player.get("maxEnergy", 270)
+        energy_pct = (energy / max_energy * 100) if max_energy > 0 else 100
+        player_x = player.get("tileX", 0)
+        player_y = player.get("tileY", 0)
 
         # PRIORITY: Check for harvestable crops first!
-        crops = state.get("location", {}).get("crops", [])
-        harvestable = [c for c in crops if c.get("isReadyForHarvest", False)]
-        if harvestable:
-            nearest = min(harvestable, key=lambda c: abs(c["x"] - player_x) + abs(c["y"] - player_y))
+        crops = location_data.get("crops") or _EMPTY_LIST
+        nearest, harvestable_count = _nearest_tile(
+            (c for c in crops if c.get("isReadyForHarvest", False)), player_x, player_y)
+        if nearest is not None:
             dx = nearest["x"] - player_x
             dy = nearest["y"] - player_y
             dist = abs(dx) + abs(dy)
             if dist == 1:
                 face_dir = "north" if dy < 0 else "south" if dy > 0 else "west" if dx < 0 else "east"
-                return f">>> 🌾 HARVEST 1 tile {face_dir.upper()}! DO: face {face_dir}, harvest ({len(harvestable)} ready) <<<"
+                return f">>> 🌾 HARVEST 1 tile {face_dir.upper()}! DO: face {face_dir}, harvest ({harvestable_count} ready) <<<"
             else:
-                dirs = []
-                if dy < 0:
-                    dirs.append(f"{abs(dy)} NORTH")
-                elif dy > 0:
-                    dirs.append(f"{abs(dy)} SOUTH")
-                if dx < 0:
-                    dirs.append(f"{abs(dx)} WEST")
-                elif dx > 0:
-                    dirs.append(f"{abs(dx)} EAST")
-                direction_str = " and ".join(dirs) if dirs else "here"
-                return f">>> 🌾 {len(harvestable)} READY TO HARVEST! Move {direction_str}, then harvest <<<"
+                direction_str = _format_manhattan(dx, dy)
+                return f">>> 🌾 {harvestable_count} READY TO HARVEST! Move {direction_str}, then harvest <<<"
 
         # Check for sellable items in inventory (harvested crops)
-        inventory = state.get("inventory", [])
-        sellable_items = ["Parsnip", "Potato", "Cauliflower", "Green Bean", "Kale", "Melon", "Blueberry",
-                         "Corn", "Tomato", "Pumpkin", "Cranberry", "Eggplant", "Grape", "Radish"]
-        sellables = [item for item in inventory if item and item.get("name") in sellable_items and item.get("stack", 0) > 0]
-        logging.info(f"   📊 _get_done_farming_hint: inventory={len(inventory)}, sellables={len(sellables)}")
-        if sellables:
-            total_count = sum(item.get("stack", 0) for item in sellables)
-            shipping_bin = state.get("location", {}).get("shippingBin") or {}
-            bin_x = shipping_bin.get("x", 71)
-            bin_y = shipping_bin.get("y", 14)
+        inventory = state.get("inventory") or _EMPTY_LIST
+        sellable_stacks, total_count, has_seeds = _inventory_summary(inventory)
+        logging.info("   📊 _get_done_farming_hint: inventory=%d, sellables=%d", len(inventory), sellable_stacks)
+        if sellable_stacks:
+            bin_x, bin_y = _shipping_bin_xy(location_data)
             dx = bin_x - player_x
             dy = bin_y - player_y
             dist = abs(dx) + abs(dy)
-            dirs = []
-            if dy < 0:
-                dirs.append(f"{abs(dy)} NORTH")
-            elif dy > 0:
-                dirs.append(f"{abs(dy)} SOUTH")
-            if dx < 0:
-                dirs.append(f"{abs(dx)} WEST")
-            elif dx > 0:
-                dirs.append(f"{abs(dx)} EAST")
-            bin_dir_str = " and ".join(dirs) if dirs else "here"
+            bin_dir_str = _format_manhattan(dx, dy)
             if dist <= 1:
                 return f">>> 📦 SHIP {total_count} ITEMS! At shipping bin! DO: ship_item <<<"
             else:
                 return f">>> 📦 SHIP {total_count} CROPS! Move {bin_dir_str} to shipping bin, then ship_item <<<"
 
         # Check if we need seeds and can afford them
-        has_seeds = any(item and ("Seed" in item.get("name", "") or item.get("name") == "Mixed Seeds") for item in inventory)
-        money = state.get("player", {}).get("money", 0)
-        day_of_week = state.get("time", {}).get("dayOfWeek", "")
+        money = player.get("money", 0)
+        day_of_week = time_data.get("dayOfWeek", "")
 
         # Suggest buying seeds if: no seeds, has money, Pierre's open (9-17, not Wed), not too late
         if not has_seeds and money >= 20 and hour >= 9 and hour < 17 and day_of_week != "Wed":
@@ -1862,9 +2405,9 @@ class ModBridgeController:
         # Check for nearby debris in surroundings
         nearby_debris = []
         if surroundings:
-            for direction, info in normalize_directions_map(surroundings.get("directions", {})).items():
+            for direction, info in normalize_directions_map(surroundings.get("directions") or _EMPTY_DICT).items():
                 blocker = info.get("blocker", "")
-                if blocker in ["Stone", "Weeds", "Twig", "Wood", "Log", "Stump", "Boulder"]:
+                if blocker in _NEARBY_DEBRIS:
                     dist = info.get("tilesUntilBlocked", 5)
                     nearby_debris.append((direction, blocker, dist))
 
@@ -1876,8 +2419,7 @@ class ModBridgeController:
         if nearby_debris and energy_pct > 40:
             closest = min(nearby_debris, key=lambda x: x[2])
             direction, debris_type, dist = closest
-            # Map debris to clear skill
-            skill = "clear_weeds" if debris_type in ["Weeds", "Grass"] else "clear_stone" if debris_type in ["Stone", "Boulder"] else "clear_wood"
+            skill = _DEBRIS_CLEAR_SKILL.get(debris_type, "clear_wood")
             if dist == 1:
                 return f">>> ✅ WATERING DONE! CLEAR DEBRIS: {debris_type} {direction.upper()}. Use {skill} with target_direction={direction} <<<"
             else:
@@ -1887,28 +2429,15 @@ class ModBridgeController:
         # Mining is handled by task executor, not hint system
         
         # Default - find debris on farm
-        objects = state.get("location", {}).get("objects", []) if state else []
-        debris_types = ["Weeds", "Stone", "Twig", "Wood"]
-        debris_nearby = [o for o in objects if o.get("name") in debris_types]
-        if debris_nearby:
-            # Find closest debris
-            closest = min(debris_nearby, key=lambda o: abs(o["x"] - player_x) + abs(o["y"] - player_y))
+        objects = location_data.get("objects") or _EMPTY_LIST
+        closest, _ = _nearest_tile((o for o in objects if o.get("name") in _FARM_DEBRIS), player_x, player_y)
+        if closest is not None:
             dx = closest["x"] - player_x
             dy = closest["y"] - player_y
             dist = abs(dx) + abs(dy)
             debris_name = closest["name"]
-            # Map debris to clear skill
-            skill = "clear_weeds" if debris_name == "Weeds" else "clear_stone" if debris_name == "Stone" else "clear_wood"
-            dirs = []
-            if dy < 0:
-                dirs.append(f"{abs(dy)} NORTH")
-            elif dy > 0:
-                dirs.append(f"{abs(dy)} SOUTH")
-            if dx < 0:
-                dirs.append(f"{abs(dx)} WEST")
-            elif dx > 0:
-                dirs.append(f"{abs(dx)} EAST")
-            direction_str = " then ".join(dirs) if dirs else "nearby"
+            skill = _DEBRIS_CLEAR_SKILL.get(debris_name, "clear_wood")
+            direction_str = _format_manhattan(dx, dy, " then ", "nearby")
             return f">>> ✅ WATERING DONE! CLEAR DEBRIS: {debris_name} {direction_str}. Move there, then use {skill} <<<"
 
         # Only suggest bed if it's actually late or low energy
@@ -1918,12 +2447,15 @@ class ModBridgeController:
         # Daytime with nothing to do - suggest exploring
         return ">>> ✅ FARM CHORES DONE! Explore, forage, fish, or visit town. <<<"
 
-    def _calc_adjacent_hint(self, dx: int, dy: int, action: str = "water") -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _calc_adjacent_hint(dx: int, dy: int, action: str = "water") -> str:
         """
         Calculate movement instructions to stop ADJACENT to a crop (not on it).
         
         In Stardew Valley, you must be 1 tile away from a crop to water/harvest it.
         This method calculates the movement to get adjacent, then which direction to face.
+        Pure in (dx, dy, action), so results are memoized - the offsets repeat tick to tick.
         
         Args:
             dx: Horizontal distance to crop (positive = east, negative = west)
@@ -1988,315 +2520,156 @@ class ModBridgeController:
 
     def execute(self, action: Action) -> bool:
         """Execute an action via SMAPI mod API."""
-        if not self.enabled:
+        if not self._available():
             logging.info(f"[DRY RUN] {action.action_type}: {action.params}")
             return True
 
         try:
             action_type = action.action_type.lower()
 
-            if action_type == "wait":
-                time.sleep(action.params.get("seconds", 1))
-                return True
-
-            elif action_type == "move":
-                direction = normalize_direction(action.params.get("direction", ""))
-                tiles = action.params.get("tiles", 1)
-                # Convert duration-based moves to tile-based
-                if "duration" in action.params:
-                    tiles = max(1, int(action.params["duration"] * 3))  # ~3 tiles per second
-
-                return self._send_action({
-                    "action": "move_direction",
-                    "direction": direction,
-                    "tiles": tiles
-                })
-
-            elif action_type == "move_to":
-                # Direct pathfinding to coordinates - SMAPI handles A* navigation
-                # Must poll for completion since movement takes multiple game ticks
-                x = action.params.get("x")
-                y = action.params.get("y")
-                if x is None or y is None:
-                    logging.error("move_to requires x and y coordinates")
-                    return False
-
-                # Send the move command - check data.success for path failures
-                try:
-                    resp = httpx.post(
-                        f"{self.base_url}/action",
-                        json={"action": "move_to", "target": {"x": x, "y": y}},
-                        timeout=5
-                    )
-                    if resp.status_code != 200:
-                        logging.warning(f"move_to HTTP error: {resp.status_code}")
-                        return False
-                    result = resp.json()
-                    data = result.get("data", {})
-                    if not data.get("success", False):
-                        error = data.get("error", "Unknown error")
-                        logging.warning(f"move_to failed: {error}")
-                        return False  # No path found - don't poll
-                except Exception as e:
-                    logging.error(f"move_to request failed: {e}")
-                    return False
-
-                # Poll for arrival (max 10 seconds, check every 200ms)
-                max_polls = 50
-                for i in range(max_polls):
-                    time.sleep(0.2)
-                    state = self.get_state()
-                    if state:
-                        player = state.get("player", {})
-                        # Use tileX/tileY directly (not position.x/64)
-                        px = player.get("tileX", 0)
-                        py = player.get("tileY", 0)
-                        # Check if arrived (within 1 tile)
-                        if abs(px - x) <= 1 and abs(py - y) <= 1:
-                            logging.debug(f"move_to arrived at ({px}, {py})")
-                            return True
-                    if i > 0 and i % 10 == 0:
-                        logging.debug(f"move_to polling... {i}/{max_polls}")
-
-                logging.warning(f"move_to timeout - may not have reached ({x}, {y})")
-                return True  # Return true anyway - let task executor handle stuck detection
-
-            elif action_type == "interact":
-                return self._send_action({"action": "interact_facing"})
-
-            elif action_type == "harvest":
-                direction = normalize_direction(action.params.get("direction", ""))
-                return self._send_action({
-                    "action": "harvest",
-                    "direction": direction
-                })
-
-            elif action_type == "use_tool":
-                direction = normalize_direction(action.params.get("direction", ""))
-                return self._send_action({
-                    "action": "use_tool",
-                    "direction": direction
-                })
-
-            elif action_type == "face":
-                direction = normalize_direction(action.params.get("direction", "south"))
-                return self._send_action({
-                    "action": "face",
-                    "direction": direction
-                })
-
-            elif action_type == "warp":
-                location = action.params.get("location", "").lower()
-                if location == "farm" or location == "outside":
-                    return self._send_action({"action": "warp_to_farm"})
-                elif location == "house" or location == "farmhouse":
-                    return self._send_action({"action": "warp_to_house"})
-                elif location:
-                    return self._send_action({
-                        "action": "warp_location",
-                        "location": location
-                    })
-                else:
-                    # Default: warp to farm if no location specified
-                    return self._send_action({"action": "warp_to_farm"})
-
-            elif action_type in ("equip", "equip_tool"):
-                # Session 127: "equip_tool" alias used by batch mining
-                tool = action.params.get("tool", "")
-                return self._send_action({
-                    "action": "equip_tool",
-                    "tool": tool
-                })
-
-            elif action_type == "select_slot":
-                slot = action.params.get("slot", 0)
-                return self._send_action({
-                    "action": "select_slot",
-                    "slot": slot
-                })
-
-            elif action_type == "select_item_type":
-                # Accept "value", "type", or "item_type" as param key
-                item_type = action.params.get("value", action.params.get("type", action.params.get("item_type", "")))
-                if not item_type:
-                    logging.error(f"select_item_type: no item type specified in params: {action.params}")
-                    return False
-                return self._send_action({
-                    "action": "select_item_type",
-                    "itemType": item_type
-                })
-
-            elif action_type == "menu":
-                return self._send_action({"action": "toggle_menu"})
-
-            elif action_type == "cancel":
-                return self._send_action({"action": "cancel"})
-
-            elif action_type == "dismiss_menu":
-                return self._send_action({"action": "dismiss_menu"})
-
-            elif action_type == "sleep" or action_type == "go_to_bed":
-                return self._send_action({"action": "go_to_bed"})
-
-            elif action_type in ("toolbar_next", "toolbar_right"):
-                return self._send_action({"action": "toolbar_next"})
-
-            elif action_type in ("toolbar_prev", "toolbar_left"):
-                return self._send_action({"action": "toolbar_prev"})
-
-            elif action_type == "ship":
-                slot = action.params.get("slot", -1)
-                return self._send_action({
-                    "action": "ship",
-                    "slot": slot
-                })
-
-            elif action_type == "buy":
-                item = action.params.get("item", "")
-                quantity = action.params.get("quantity", 1)
-                
-                # Dynamic quantity: "max" or "auto" calculates based on money
-                if quantity in ("max", "auto"):
-                    # Seed prices (lowercase item name -> price)
-                    seed_prices = {
-                        "parsnip seeds": 20, "cauliflower seeds": 80,
-                        "potato seeds": 50, "kale seeds": 70, "garlic seeds": 40,
-                        "bean starter": 60, "melon seeds": 80, "tomato seeds": 50,
-                        "blueberry seeds": 80, "pepper seeds": 40, "radish seeds": 40,
-                        "pumpkin seeds": 100, "cranberry seeds": 240, "grape starter": 60,
-                        "wheat seeds": 10, "corn seeds": 150,
-                    }
-                    price = seed_prices.get(item.lower(), 50)  # Default 50g if unknown
-                    money = self.get_state().get("player", {}).get("money", 0) if self.get_state() else 0
-                    # Calculate max affordable, cap at 20 to leave money for other things
-                    max_qty = min(money // price, 20) if price > 0 else 1
-                    quantity = max(1, max_qty)  # At least 1
-                    logging.info(f"💰 Buy {item}: {money}g / {price}g = {quantity} seeds")
-                
-                return self._send_action({
-                    "action": "buy",
-                    "item": item,
-                    "quantity": quantity
-                })
-            elif action_type == "buy_backpack":
-                return self._send_action({"action": "buy_backpack"})
-
-            # Session 131: Crafting action
-            elif action_type == "craft":
-                item = action.params.get("item", "")
-                quantity = action.params.get("quantity", 1)
-                return self._send_action({
-                    "action": "craft",
-                    "item": item,
-                    "quantity": quantity
-                })
+            # Plain actions: params -> one /action payload
+            build_payload = _MOD_ACTION_PAYLOADS.get(action_type)
+            if build_payload is not None:
+                return self._send_action(build_payload(action.params))
 
-            # Session 131: Chest operations
-            elif action_type == "open_chest":
-                direction = normalize_direction(action.params.get("direction", "south"))
-                return self._send_action({
-                    "action": "open_chest",
-                    "direction": direction
-                })
-
-            elif action_type == "close_chest":
-                return self._send_action({"action": "close_chest"})
-
-            elif action_type == "deposit_item":
-                slot = action.params.get("slot", 0)
-                quantity = action.params.get("quantity", -1)  # -1 = all
-                return self._send_action({
-                    "action": "deposit_item",
-                    "slot": slot,
-                    "quantity": quantity
-                })
-
-            elif action_type == "withdraw_item":
-                slot = action.params.get("slot", 0)
-                quantity = action.params.get("quantity", -1)
-                return self._send_action({
-                    "action": "withdraw_item",
-                    "slot": slot,
-                    "quantity": quantity
-                })
+            # Actions that wait, poll or validate around the request
+            handler = self._EXECUTE_HANDLERS.get(action_type)
+            if handler is not None:
+                return handler(self, action.params)
 
-            elif action_type == "withdraw_by_name":
-                item = action.params.get("item", "")
-                quantity = action.params.get("quantity", 1)
-                return self._send_action({
-                    "action": "withdraw_by_name",
-                    "item": item,
-                    "quantity": quantity
-                })
-
-            # Session 131: Place item (for placing crafted items like chest/scarecrow)
-            elif action_type == "place_item":
-                direction = normalize_direction(action.params.get("direction", action.params.get("value", "south")))
-                return self._send_action({
-                    "action": "place_item",
-                    "direction": direction
-                })
-
-            elif action_type == "upgrade_tool":
-                tool = action.params.get("tool", "")
-                return self._send_action({
-                    "action": "upgrade_tool",
-                    "tool": tool
-                })
+            # Fallback for unknown actions
+            logging.warning(f"Unknown action for ModBridge: {action_type}")
+            return False
 
-            elif action_type == "collect_upgraded_tool":
-                return self._send_action({"action": "collect_upgraded_tool"})
+        except Exception as e:
+            logging.error(f"ModBridge action failed: {e}")
+            return False
 
-            # Mining actions
-            elif action_type == "enter_mine_level":
-                level = action.params.get("level", 1)
-                return self._send_action({
-                    "action": "enter_mine_level",
-                    "level": level
-                })
+    def _execute_wait(self, params: Dict[str, Any]) -> bool:
+        time.sleep(params.get("seconds", 1))
+        return True
 
-            elif action_type == "use_ladder":
-                return self._send_action({"action": "use_ladder"})
+    def _execute_move_to(self, params: Dict[str, Any]) -> bool:
+        # Direct pathfinding to coordinates - SMAPI handles A* navigation
+        # Must poll for completion since movement takes multiple game ticks
+        x = params.get("x")
+        y = params.get("y")
+        if x is None or y is None:
+            logging.error("move_to requires x and y coordinates")
+            return False
 
-            elif action_type == "descend_mine":
-                # Session 127: Descend to next mine level (works from entrance or ladder)
-                return self._send_action({"action": "descend_mine"})
+        # Send the move command - check data.success for path failures
+        try:
+            resp = self._client.post(
+                "/action",
+                content=_json_dumps({"action": "move_to", "target": {"x": x, "y": y}}),
+            )
+            if resp.status_code != 200:
+                logging.warning(f"move_to HTTP error: {resp.status_code}")
+                return False
+            result = _json_loads(resp.content)
+            data = result.get("data", {})
+            if not data.get("success", False):
+                error = data.get("error", "Unknown error")
+                logging.warning(f"move_to failed: {error}")
+                return False  # No path found - don't poll
+        except _MOD_DOWN_ERRORS as e:
+            self._mark_down(e)
+            return False
+        except Exception as e:
+            logging.error(f"move_to request failed: {e}")
+            return False
+        finally:
+            self.invalidate()  # After the POST: polls during it may have cached pre-move state
+
+        # Poll for arrival (max 10 seconds, check every 200ms)
+        max_polls = 50
+        for i in range(max_polls):
+            time.sleep(0.2)
+            state = self.get_state()
+            if state:
+                player = state.get("player", {})
+                # Use tileX/tileY directly (not position.x/64)
+                px = player.get("tileX", 0)
+                py = player.get("tileY", 0)
+                # Check if arrived (within 1 tile)
+                if abs(px - x) <= 1 and abs(py - y) <= 1:
+                    logging.debug("move_to arrived at (%s, %s)", px, py)
+                    return True
+            if i > 0 and i % 10 == 0:
+                logging.debug("move_to polling... %d/%d", i, max_polls)
 
-            elif action_type == "swing_weapon":
-                direction = action.params.get("direction", "")
-                return self._send_action({
-                    "action": "swing_weapon",
-                    "direction": direction
-                })
+        logging.warning(f"move_to timeout - may not have reached ({x}, {y})")
+        return True  # Return true anyway - let task executor handle stuck detection
 
-            # Fallback for unknown actions
-            logging.warning(f"Unknown action for ModBridge: {action_type}")
+    def _execute_select_item_type(self, params: Dict[str, Any]) -> bool:
+        # Accept "value", "type", or "item_type" as param key
+        item_type = params.get("value", params.get("type", params.get("item_type", "")))
+        if not item_type:
+            logging.error(f"select_item_type: no item type specified in params: {params}")
             return False
+        return self._send_action({
+            "action": "select_item_type",
+            "itemType": item_type
+        })
 
-        except Exception as e:
-            logging.error(f"ModBridge action failed: {e}")
-            return False
+    def _execute_buy(self, params: Dict[str, Any]) -> bool:
+        item = params.get("item", "")
+        quantity = params.get("quantity", 1)
+
+        # Dynamic quantity: "max" or "auto" calculates based on money
+        if quantity in ("max", "auto"):
+            price = _SEED_BUY_PRICES.get(item.lower(), 50)  # Default 50g if unknown
+            state = self.get_state()
+            money = state.get("player", {}).get("money", 0) if state else 0
+            # Calculate max affordable, cap at 20 to leave money for other things
+            max_qty = min(money // price, 20) if price > 0 else 1
+            quantity = max(1, max_qty)  # At least 1
+            logging.info(f"💰 Buy {item}: {money}g / {price}g = {quantity} seeds")
+
+        return self._send_action({
+            "action": "buy",
+            "item": item,
+            "quantity": quantity
+        })
+
+    # action type -> handler for actions that need more than a single payload (see _MOD_ACTION_PAYLOADS)
+    _EXECUTE_HANDLERS = {
+        "wait": _execute_wait,
+        "move_to": _execute_move_to,
+        "select_item_type": _execute_select_item_type,
+        "buy": _execute_buy,
+    }
 
     def _send_action(self, payload: Dict[str, Any]) -> bool:
         """Send action to mod API."""
+        if not self._available():
+            return False
         try:
-            resp = httpx.post(
-                f"{self.base_url}/action",
-                json=payload,
-                timeout=5
-            )
+            try:
+                resp = self._client.post("/action", content=_json_dumps(payload))
+            finally:
+                self.invalidate()  # After the POST: polls during it may have cached pre-action state
             if resp.status_code == 200:
-                result = resp.json()
+                result = _json_loads(resp.content)
                 if result.get("success"):
-                    logging.debug(f"Action OK: {result.get('data', {}).get('message', '')}")
+                    if logging.getLogger().isEnabledFor(logging.DEBUG):
+                        logging.debug("Action OK: %s", (result.get("data") or _EMPTY_DICT).get("message", ""))
                     return True
                 else:
                     logging.warning(f"Action failed: {result.get('error', 'Unknown error')}")
             return False
+        except _MOD_DOWN_ERRORS as e:
+            self._mark_down(e)
+            return False
         except Exception as e:
             logging.error(f"Failed to send action: {e}")
             return False
 
+    def warp_to_tile(self, x: int, y: int) -> bool:
+        """Teleport the player to a tile on the current map."""
+        return self._send_action({"action": "warp", "target": {"x": x, "y": y}})
+
     def reset(self):
         """No-op for mod bridge."""
         pass
@@ -2318,7 +2691,7 @@ class ModBridgeController:
         tilled = {(t.get("x"), t.get("y")) for t in farm.get("tilledTiles", [])}
         result = (x, y) in tilled
         if not result:
-            logging.debug(f"verify_tilled({x},{y}): NOT in tilledTiles (count: {len(tilled)})")
+            logging.debug("verify_tilled(%s,%s): NOT in tilledTiles (count: %d)", x, y, len(tilled))
         return result
     
     def verify_planted(self, x: int, y: int) -> bool:
@@ -2355,7 +2728,7 @@ class ModBridgeController:
                     # Diagnostic: Log why verification failed (WARNING level for debugging Session 117)
                     logging.warning(f"verify_watered({x},{y}): Crop exists but isWatered=False (crop={crop.get('cropName', '?')})")
                 return is_watered
-        logging.debug(f"verify_watered({x},{y}): No crop found at position")
+        logging.debug("verify_watered(%s,%s): No crop found at position", x, y)
         return False
     
     def verify_cleared(self, x: int, y: int) -> bool:
@@ -2374,7 +2747,7 @@ class ModBridgeController:
         blocked = objects | debris | grass
         result = (x, y) not in blocked
         if not result:
-            logging.debug(f"verify_cleared({x},{y}): Still blocked (objects:{len(objects)}, debris:{len(debris)}, grass:{len(grass)})")
+            logging.debug("verify_cleared(%s,%s): Still blocked (objects:%d, debris:%d, grass:%d)", x, y, len(objects), len(debris), len(grass))
         return result
     
     def get_verification_snapshot(self) -> dict:
@@ -2471,7 +2844,7 @@ class ModBridgeController:
         
         try:
             path.write_text(json.dumps(self._verification_tracking, indent=2))
-            logging.debug(f"Persisted verification tracking: {self._verification_tracking}")
+            logging.debug("Persisted verification tracking: %s", self._verification_tracking)
         except Exception as e:
             logging.error(f"Failed to persist verification tracking: {e}")
 
@@ -2483,18 +2856,7 @@ class ModBridgeController:
 class GamepadController:
     """Virtual Xbox 360 controller for co-op play."""
 
-    BUTTONS = {}
-    if HAS_GAMEPAD:
-        BUTTONS = {
-            'a': vg.XUSB_BUTTON.XUSB_GAMEPAD_A,
-            'b': vg.XUSB_BUTTON.XUSB_GAMEPAD_B,
-            'x': vg.XUSB_BUTTON.XUSB_GAMEPAD_X,
-            'y': vg.XUSB_BUTTON.XUSB_GAMEPAD_Y,
-            'rb': vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_SHOULDER,
-            'lb': vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_SHOULDER,
-            'start': vg.XUSB_BUTTON.XUSB_GAMEPAD_START,
-            'back': vg.XUSB_BUTTON.XUSB_GAMEPAD_BACK,
-        }
+    BUTTONS = {}  # Filled per instance once vgamepad is imported (see __init__)
 
     DIRECTIONS = {
         "north": (0, 1),
@@ -2511,11 +2873,34 @@ class GamepadController:
         "right": (1, 0),
     }
 
+    # action type -> (button, hold seconds) for single-press actions
+    ACTION_BUTTONS = {
+        "interact": ('a', 0.1),        # A = Check / Do Action / Interact
+        "use_tool": ('x', 0.3),        # X = Use Tool / Swing (hold longer for charged tools)
+        "cancel": ('b', 0.1),          # B = Exit menu / Cancel
+        "menu": ('b', 0.1),            # B = Open main menu (inventory, map, etc.)
+        "crafting": ('y', 0.1),        # Y = Open crafting menu
+        "journal": ('back', 0.1),      # Back = Open journal/quest log
+        "toolbar_left": ('lb', 0.1),   # LB = Shift toolbar left
+        "toolbar_right": ('rb', 0.1),  # RB = Shift toolbar right
+    }
+
     def __init__(self):
         self.enabled = HAS_GAMEPAD
         self.gamepad = None
         if self.enabled:
             try:
+                vg = _get_vgamepad()
+                self.BUTTONS = {
+                    'a': vg.XUSB_BUTTON.XUSB_GAMEPAD_A,
+                    'b': vg.XUSB_BUTTON.XUSB_GAMEPAD_B,
+                    'x': vg.XUSB_BUTTON.XUSB_GAMEPAD_X,
+                    'y': vg.XUSB_BUTTON.XUSB_GAMEPAD_Y,
+                    'rb': vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_SHOULDER,
+                    'lb': vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_SHOULDER,
+                    'start': vg.XUSB_BUTTON.XUSB_GAMEPAD_START,
+                    'back': vg.XUSB_BUTTON.XUSB_GAMEPAD_BACK,
+                }
                 self.gamepad = vg.VX360Gamepad()
                 self.gamepad.reset()
                 logging.info("Virtual Xbox 360 controller initialized")
@@ -2532,6 +2917,10 @@ class GamepadController:
         try:
             action_type = action.action_type.lower()
 
+            press = self.ACTION_BUTTONS.get(action_type)
+            if press is not None:
+                return self._press_button(*press)
+
             if action_type == "wait":
                 time.sleep(action.params.get("seconds", 1))
                 return True
@@ -2553,38 +2942,6 @@ class GamepadController:
                     self.gamepad.update()
                     return True
 
-            elif action_type == "interact":
-                # A = Check / Do Action / Interact
-                return self._press_button('a')
-
-            elif action_type == "use_tool":
-                # X = Use Tool / Swing (hold longer for charged tools)
-                return self._press_button('x', duration=0.3)
-
-            elif action_type == "cancel":
-                # B = Exit menu / Cancel
-                return self._press_button('b')
-
-            elif action_type == "menu":
-                # B = Open main menu (inventory, map, etc.)
-                return self._press_button('b')
-
-            elif action_type == "crafting":
-                # Y = Open crafting menu
-                return self._press_button('y')
-
-            elif action_type == "journal":
-                # Back = Open journal/quest log
-                return self._press_button('back')
-
-            elif action_type == "toolbar_left":
-                # LB = Shift toolbar left
-                return self._press_button('lb')
-
-            elif action_type == "toolbar_right":
-                # RB = Shift toolbar right
-                return self._press_button('rb')
-
             elif action_type == "button":
                 button = action.params.get("button", "a").lower()
                 return self._press_button(button)
@@ -2618,9 +2975,53 @@ class GamepadController:
 # Main Agent
 # =============================================================================
 
+# Stardew hours run 6..26 (2am pass-out); index -> (display_hour, am/pm). Hours outside
+# the table fall back to the same arithmetic in _build_light_context
+_HOUR_DISPLAY = tuple((h if h <= 12 else h - 12, "am" if h < 12 else "pm") for h in range(32))
+
+# Facing names indexed by direction code: 0=north, 1=south, 2=west, 3=east
+_FACE_LC = ("north", "south", "west", "east")
+_FACE_UC = ("NORTH", "SOUTH", "WEST", "EAST")
+
+# Invariant fragments of the repetition ("stuck") warning in the action context
+_STUCK_WARNING_TEMPLATE = "🚨 STOP! You're STUCK! 🚨\nYou've done '{last_action}' {repeat_count} TIMES and it's not working!\n\n"
+_STUCK_INDOORS_WARNING = (
+    "🚪 STUCK INSIDE? Just use WARP to teleport outside!\n"
+    '→ {"type": "warp", "location": "Farm"}\n\n'
+    "Don't waste time finding the door - WARP is instant!\n\n"
+)
+_STUCK_OBSTACLE_HINT = (
+    "👁️ LOOK AT THE SCREENSHOT! There's probably an obstacle blocking you.\n"
+    "USE YOUR EYES to find a path around it:\n"
+    "- See a TREE or ROCK blocking? Move sideways first to go AROUND it\n"
+    "- Can't go south? Try going WEST or EAST first, THEN south\n"
+    "- Still stuck? Try a completely different route\n\n"
+)
+_STUCK_WARP_LOCATIONS = frozenset({"FarmHouse", "SeedShop", "Saloon", "JojaMart", "Blacksmith"})
+
+# Adjacent debris hint: debris type -> (tool name, slot number)
+_DEBRIS_HINT_TOOLS = {
+    "Weeds": ("SCYTHE", 4),
+    "Grass": ("SCYTHE", 4),
+    "Twig": ("AXE", 0),
+    "Wood": ("AXE", 0),
+    "Stone": ("PICKAXE", 3),
+    "Boulder": ("PICKAXE", 3),
+}
+
+# action_queue priorities - lower runs first, FIFO within a tier
+ACTION_PRIORITY_BEDTIME = 0
+ACTION_PRIORITY_PRECONDITION = 1
+ACTION_PRIORITY_PAUSE_RECOVERY = 2
+ACTION_PRIORITY_TASK_EXECUTOR = 3
+ACTION_PRIORITY_VLM = 4
+ACTION_PRIORITY_DAY1_CLEARING = 5
+
 class StardewAgent:
     """Main agent using unified VLM architecture."""
 
+    _USER_MESSAGE_POLL = 1.0  # Seconds between UI chat checks during an idle wait
+
     def __init__(self, config: Config):
         self.config = config
         self.vlm = UnifiedVLM(config)
@@ -2639,14 +3040,27 @@ class StardewAgent:
                 logging.info("Using Gamepad controller (vgamepad)")
         else:
             self.controller = GamepadController()
+        self._bind_controller()
 
         self.running = False
         self.goal = ""
-        self.last_think_time = 0
-        self.action_queue: List[Action] = []
+        self.last_think_time = float("-inf")  # time.monotonic(); -inf so the first tick thinks
+        self._wake: Optional[asyncio.Event] = None  # Set to cut an idle wait short (see wake())
+        # Heap of (priority, seq, action) - see _queue_action()
+        self.action_queue: List[Tuple[int, int, Action]] = []
+        self._action_seq = 0  # Increasing: FIFO tie-break within a priority
+        self._action_front_seq = 0  # Decreasing: jump ahead within a priority
         self._pending_batch = None  # For skill_override batch execution
+        self._pending_batch_task: Optional[Tuple[asyncio.Task, Dict[str, Any]]] = None  # Running batch (task, batch)
         self.recent_actions: List[str] = []  # Track last 10 actions for VLM context
+        self._history_version = 0  # Bumped on every recent_actions change
+        self._recent5_counts: Dict[str, int] = {}  # Entry -> count within the last 5 recent_actions
+        self._action_history_cache: Tuple[int, str] = (-1, "")  # (version, formatted history)
         self.vlm_status = "Idle"
+        # Coalesced UI status pushes (see _send_ui_status / _flush_ui_status)
+        self._ui_status_dirty = False
+        self._pending_ui_result: Optional[ThinkResult] = None
+        self._last_ui_status_key: Optional[Tuple] = None
         self.last_state_poll = 0.0
         self.last_state: Optional[Dict[str, Any]] = None
         self.last_position: Optional[Tuple[int, int]] = None
@@ -2668,9 +3082,10 @@ class StardewAgent:
         self.last_distance_position: Optional[Tuple[int, int]] = None
         self.crops_watered_count = 0
         self.crops_harvested_count = 0
-        self.latency_history: List[float] = []
+        self.latency_history: deque = deque(maxlen=60)  # Rolling VLM latency window (ms)
         self.last_user_message_id = 0
         self.awaiting_user_reply = False
+        self._user_message_pending = False  # UI chat message arrived while idle - think on the next tick
         self.spatial_map = None
         self.spatial_location = None
         self.last_surroundings: Optional[Dict[str, Any]] = None
@@ -2714,6 +3129,8 @@ class StardewAgent:
 
         # Skill system (contextual guidance + execution)
         self.skill_context = None
+        self._skill_context_cache: Tuple[Optional[Tuple], str] = (None, "")  # (key, formatted context)
+        self._available_skills_count = 0
         self.skills_dict: Dict[str, Any] = {}
         self.skill_executor = None
         if HAS_SKILLS and SkillLoader and SkillContext and SkillExecutor:
@@ -2805,7 +3222,17 @@ class StardewAgent:
         self._day1_clearing_active = False
         self._day1_tiles_cleared = 0
         self._day1_last_clear_time = 0.0
-        self._last_vlm_time = 0.0  # Track VLM timing for commentary during clearing
+        self._last_vlm_time = float("-inf")  # time.monotonic() of last VLM call, for commentary during clearing
+
+        # Per-tick game state snapshot (see _snapshot_tick)
+        self._tick_ctx = _TickContext()
+
+        # Dynamic hint cache - (state, surroundings) payloads the cached hints were built from
+        self._hint_cache_key: Tuple[Optional[dict], Optional[dict]] = (None, None)
+        self._hint_cache_value: str = ""
+        # Adjacent-debris hint cache - (location objects list, player tile) the hint was built from
+        self._debris_hint_key: Tuple[Optional[list], Optional[Tuple[int, int]]] = (None, None)
+        self._debris_hint_value: str = ""
 
         # Memory trigger tracking
         self.last_location: str = ""
@@ -2818,6 +3245,15 @@ class StardewAgent:
         config.screenshot_dir.mkdir(parents=True, exist_ok=True)
         config.history_dir.mkdir(parents=True, exist_ok=True)
 
+        # Screenshot rotation ring (keep last 100) - one directory scan at startup only
+        existing = sorted(config.screenshot_dir.glob("screen_*.png"))
+        for old in existing[:-100]:
+            old.unlink(missing_ok=True)
+        self._screenshot_ring: deque = deque(existing[-100:], maxlen=100)
+        self._screenshot_tasks: Set[asyncio.Task] = set()  # Keeps in-flight saves referenced
+        # At most 2 saves in worker threads - a slow disk queues saves instead of piling up threads
+        self._screenshot_slots = asyncio.Semaphore(2)
+
         # Force reconfigure logging (libraries may have already configured it)
         logging.basicConfig(
             level=getattr(logging, config.log_level),
@@ -2860,22 +3296,21 @@ class StardewAgent:
         if not state:
             return ""
 
-        player = state.get("player", {})
+        player = state.get("player") or _EMPTY_DICT
         px = player.get("tileX", 0)
         py = player.get("tileY", 0)
 
         # Get all objects from location
-        objects = state.get("location", {}).get("objects", [])
-
-        # Tool mapping: debris type -> (tool name, slot number)
-        TOOL_MAP = {
-            "Weeds": ("SCYTHE", 4),
-            "Grass": ("SCYTHE", 4),
-            "Twig": ("AXE", 0),
-            "Wood": ("AXE", 0),
-            "Stone": ("PICKAXE", 3),
-            "Boulder": ("PICKAXE", 3),
-        }
+        location = state.get("location") or _EMPTY_DICT
+        objects = location.get("objects") or _EMPTY_LIST
+
+        # Same objects payload (every poll builds a new list) and same tile -> same hint;
+        # skip rescanning every object on the map
+        cached_objects, cached_tile = self._debris_hint_key
+        if objects is cached_objects and cached_tile == (px, py):
+            return self._debris_hint_value
+        self._debris_hint_key = (objects, (px, py))
+        self._debris_hint_value = ""
 
         # Check 4 adjacent tiles
         adjacent_debris = []
@@ -2883,7 +3318,7 @@ class StardewAgent:
             ox, oy = obj.get("x", -99), obj.get("y", -99)
             name = obj.get("name", "")
 
-            if name not in TOOL_MAP:
+            if name not in _DEBRIS_HINT_TOOLS:
                 continue
 
             # Check if adjacent (Manhattan distance = 1)
@@ -2899,7 +3334,7 @@ class StardewAgent:
                 else:
                     direction = "east"
 
-                tool_name, tool_slot = TOOL_MAP[name]
+                tool_name, tool_slot = _DEBRIS_HINT_TOOLS[name]
                 adjacent_debris.append((direction, name, tool_name, tool_slot))
 
         if not adjacent_debris:
@@ -2909,7 +3344,8 @@ class StardewAgent:
         for direction, debris, tool, slot in adjacent_debris:
             hint_lines.append(f"  • {debris} to {direction.upper()}: select_slot {slot} ({tool}), face {direction}, use_tool")
         hint_lines.append("\nClear the debris blocking you, then continue moving!")
-        return "\n".join(hint_lines)
+        self._debris_hint_value = "\n".join(hint_lines)
+        return self._debris_hint_value
 
     def _get_time_urgency_hint(self, state: dict) -> str:
         """Check time and return urgent bedtime warning if late (hour >= 22).
@@ -2989,6 +3425,82 @@ class StardewAgent:
             self.ui = None
             return None
 
+    async def _save_screenshot_async(self, img: Image.Image, path: Path, evicted: Optional[Path]) -> None:
+        """Run _save_screenshot in a worker thread, bounded by _screenshot_slots."""
+        async with self._screenshot_slots:
+            await asyncio.to_thread(self._save_screenshot, img, path, evicted)
+
+    @staticmethod
+    def _save_screenshot(img: Image.Image, path: Path, evicted: Optional[Path]) -> None:
+        """Write a screenshot and drop the one it rotated out (runs off the event loop)."""
+        try:
+            img.save(path)
+            if evicted:
+                evicted.unlink(missing_ok=True)
+        except Exception as e:
+            logging.warning(f"Screenshot save failed: {e}")
+
+    def _push_recent_action(self, entry: str) -> None:
+        """Record an action (or block/skip note) in the last-10 history shown to the VLM."""
+        self.recent_actions.append(entry)
+        # Rolling last-5 window counts for repetition detection
+        counts = self._recent5_counts
+        counts[entry] = counts.get(entry, 0) + 1
+        if len(self.recent_actions) > 5:
+            dropped = self.recent_actions[-6]
+            if counts[dropped] > 1:
+                counts[dropped] -= 1
+            else:
+                del counts[dropped]
+        if len(self.recent_actions) > 10:
+            del self.recent_actions[:-10]
+        self._history_version += 1
+
+    @staticmethod
+    def _add_context(parts: List[str], text: Optional[str], log_msg: Optional[str] = None, *log_args: Any) -> bool:
+        """Append a non-empty section to the VLM action context and log it (lazily formatted).
+
+        Returns True if the section was added.
+        """
+        if not text:
+            return False
+        parts.append(text)
+        if log_msg:
+            logging.info(log_msg, *log_args)
+        return True
+
+    def _bind_controller(self) -> None:
+        """Bind the controller's optional poll methods once (the controller never changes mid-run)."""
+        self._ctrl_get_state = getattr(self.controller, "get_state", None)
+        self._ctrl_get_surroundings = getattr(self.controller, "get_surroundings", None)
+        self._ctrl_format_surroundings_async = getattr(self.controller, "format_surroundings_async", None)
+
+    def _queue_action(self, action: Action, priority: int = ACTION_PRIORITY_VLM) -> None:
+        """Queue an action behind everything already queued at the same or higher priority."""
+        self._action_seq += 1
+        heapq.heappush(self.action_queue, (priority, self._action_seq, action))
+
+    def _queue_actions_front(self, actions: List[Action], priority: int) -> None:
+        """Queue actions (in order) ahead of everything already queued at `priority`."""
+        for action in reversed(actions):
+            self._action_front_seq -= 1
+            heapq.heappush(self.action_queue, (priority, self._action_front_seq, action))
+
+    def _drop_queued_actions(self, min_priority: int) -> None:
+        """Cancel queued actions at `min_priority` and below (e.g. a cleared task's moves)."""
+        kept = [entry for entry in self.action_queue if entry[0] < min_priority]
+        if len(kept) != len(self.action_queue):
+            heapq.heapify(kept)
+            self.action_queue = kept
+
+    def _get_action_history_str(self) -> str:
+        """Numbered recent-action list for the prompt, rebuilt only when the history changed."""
+        version, text = self._action_history_cache
+        if version != self._history_version:
+            text = "\n".join(f"  {i+1}. {a}" for i, a in enumerate(self.recent_actions))
+            self._action_history_cache = (self._history_version, text)
+        return text
+
     def _track_vlm_parse(self, result: ThinkResult) -> None:
         if result.parse_success:
             self.vlm_parse_success += 1
@@ -3004,6 +3516,19 @@ class StardewAgent:
         })
         self.vlm_errors = self.vlm_errors[-10:]
 
+    def _extract_instruction(self, spatial_context: str) -> Optional[str]:
+        """Return the first line starting with '>>>' (stripped), or None."""
+        before, sep, after = spatial_context.partition(">>>")
+        if not sep:
+            return None
+        if not before[before.rfind("\n") + 1:].strip():
+            return (sep + after.partition("\n")[0]).strip()
+        # First '>>>' is mid-line - fall back to a line scan
+        return next(
+            (line.strip() for line in spatial_context.splitlines() if line.strip().startswith(">>>")),
+            None
+        )
+
     def _extract_navigation_target(self, instruction: Optional[str]) -> Optional[str]:
         if not instruction:
             return None
@@ -3129,27 +3654,34 @@ class StardewAgent:
         nearest = min(candidates, key=lambda t: abs(t.x - px) + abs(t.y - py))
         dx = nearest.x - px
         dy = nearest.y - py
-        dirs = []
-        if dy < 0:
-            dirs.append(f"{abs(dy)} NORTH")
-        elif dy > 0:
-            dirs.append(f"{abs(dy)} SOUTH")
-        if dx < 0:
-            dirs.append(f"{abs(dx)} WEST")
-        elif dx > 0:
-            dirs.append(f"{abs(dx)} EAST")
-        direction_str = " and ".join(dirs) if dirs else "here"
+        direction_str = _format_manhattan(dx, dy)
         return f"SPATIAL MAP: TILLED but UNPLANTED tile at {nearest.x},{nearest.y} ({direction_str})."
 
     def _get_skill_context(self, goal: str = "") -> str:
         """Get available skills for current game state to guide VLM.
 
         Session 122: Added goal-awareness to prioritize relevant skills.
+        Availability only depends on the hard filters (location_is, time_between),
+        so the formatted result is cached on (location, hour, minute, goal).
         """
         if not self.skill_context or not self.last_state:
             return ""
+        time_data = self.last_state.get("time") or {}
+        cache_key = (
+            (self.last_state.get("location") or {}).get("name"),
+            time_data.get("hour"), time_data.get("minute", 0), goal,
+        )
+        if self._skill_context_cache[0] == cache_key:
+            return self._skill_context_cache[1]
+        text = self._build_skill_context(goal)
+        self._skill_context_cache = (cache_key, text)
+        return text
+
+    def _build_skill_context(self, goal: str) -> str:
+        """Format the available-skills list (uncached - see _get_skill_context)."""
         try:
             available = self.skill_context.get_available_skills(self.last_state)
+            self._available_skills_count = len(available)
             if not available:
                 return ""
             # Skills that require target_direction parameter
@@ -3434,9 +3966,8 @@ class StardewAgent:
                     logging.info(f"   ↳ Using last blocked direction: {blocked_dir}")
                 elif self.last_state:
                     # Use facing direction from game state
-                    facing_map = {0: "north", 1: "east", 2: "south", 3: "west"}
                     facing = self.last_state.get("player", {}).get("facingDirection", 2)
-                    params['target_direction'] = facing_map.get(facing, "south")
+                    params['target_direction'] = _FACING_NAMES.get(facing, "south")
                     logging.info(f"   ↳ Using facing direction: {params['target_direction']}")
         
         # Session 125: Batch skills are handled specially, not in skills_dict
@@ -3454,8 +3985,7 @@ class StardewAgent:
             has_crop = tile_state.get("hasCrop", False)
             if has_crop:
                 logging.warning(f"🛡️ BLOCKED: till_soil would destroy crop! Skipping.")
-                self.recent_actions.append("BLOCKED: till_soil (crop protection)")
-                self.recent_actions = self.recent_actions[-10:]
+                self._push_recent_action("BLOCKED: till_soil (crop protection)")
                 return False
 
         # Session 118+119: Block till_soil if target tile is already tilled OR not tillable
@@ -3467,14 +3997,12 @@ class StardewAgent:
             blocker = dir_info.get("blocker", "")
             if adj_tile.get("isTilled", False):
                 logging.warning(f"🛡️ BLOCKED: till_soil target {target_dir} already tilled! Skipping.")
-                self.recent_actions.append(f"BLOCKED: till_soil ({target_dir} already tilled)")
-                self.recent_actions = self.recent_actions[-10:]
+                self._push_recent_action(f"BLOCKED: till_soil ({target_dir} already tilled)")
                 return False
             # Session 119: Block if tile is not tillable (water, cliff, etc.)
             if not adj_tile.get("canTill", False):
                 logging.warning(f"🛡️ BLOCKED: till_soil target {target_dir} not tillable (blocker={blocker})! Skipping.")
-                self.recent_actions.append(f"BLOCKED: till_soil ({target_dir} not tillable)")
-                self.recent_actions = self.recent_actions[-10:]
+                self._push_recent_action(f"BLOCKED: till_soil ({target_dir} not tillable)")
                 return False
 
         # Session 118+119: Block plant_seed if target tile already has crop OR is not tilled
@@ -3485,14 +4013,12 @@ class StardewAgent:
             adj_tile = dir_info.get("adjacentTile", {})
             if adj_tile.get("hasCrop", False):
                 logging.warning(f"🛡️ BLOCKED: plant_seed target {target_dir} already has crop! Skipping.")
-                self.recent_actions.append(f"BLOCKED: plant_seed ({target_dir} has crop)")
-                self.recent_actions = self.recent_actions[-10:]
+                self._push_recent_action(f"BLOCKED: plant_seed ({target_dir} has crop)")
                 return False
             # Session 119: Block if tile is NOT tilled - can't plant on untilled ground
             if not adj_tile.get("isTilled", False) and not adj_tile.get("canPlant", False):
                 logging.warning(f"🛡️ BLOCKED: plant_seed target {target_dir} not tilled! Skipping.")
-                self.recent_actions.append(f"BLOCKED: plant_seed ({target_dir} not tilled)")
-                self.recent_actions = self.recent_actions[-10:]
+                self._push_recent_action(f"BLOCKED: plant_seed ({target_dir} not tilled)")
                 return False
 
         # Session 119: Block debris clearing if no clearable object in target direction
@@ -3508,8 +4034,7 @@ class StardewAgent:
 
             if blocker in NON_CLEARABLE:
                 logging.warning(f"🛡️ BLOCKED: {skill_name} target {target_dir} has no clearable object (blocker={blocker or 'none'})! Skipping.")
-                self.recent_actions.append(f"BLOCKED: {skill_name} ({target_dir} nothing to clear)")
-                self.recent_actions = self.recent_actions[-10:]
+                self._push_recent_action(f"BLOCKED: {skill_name} ({target_dir} nothing to clear)")
                 return False
 
             # Optional: Warn if wrong tool for debris type (but still allow - game might accept it)
@@ -3558,8 +4083,7 @@ class StardewAgent:
 
             if not found_crop:
                 logging.warning(f"🛡️ BLOCKED: water_crop but no unwatered crop adjacent to ({player_x}, {player_y})! Skipping.")
-                self.recent_actions.append("BLOCKED: water_crop (no adjacent crop)")
-                self.recent_actions = self.recent_actions[-10:]
+                self._push_recent_action("BLOCKED: water_crop (no adjacent crop)")
                 return False
 
             # Set the correct direction for the skill to use
@@ -3805,8 +4329,7 @@ class StardewAgent:
                     if consecutive >= self._phantom_threshold:
                         # Hard-fail after threshold consecutive phantom failures
                         logging.error(f"💀 HARD FAIL: {skill_name} phantom-failed {consecutive}x consecutively. Treating as real failure.")
-                        self.recent_actions.append(f"PHANTOM_FAIL: {skill_name} ({consecutive}x)")
-                        self.recent_actions = self.recent_actions[-10:]
+                        self._push_recent_action(f"PHANTOM_FAIL: {skill_name} ({consecutive}x)")
                         # Record lesson for learning
                         if self.lesson_memory:
                             self.lesson_memory.record_failure(
@@ -3933,15 +4456,9 @@ class StardewAgent:
                     # If move_to failed, use warp (teleport - no pathfinding needed)
                     if not arrived:
                         logging.info(f"🚿 move_to failed, trying direct warp to ({adj_x},{adj_y})")
-                        # Send warp directly to API (controller.execute doesn't support coord warp)
+                        # Coordinate warp (controller.execute only warps to named locations)
                         try:
-                            import httpx
-                            resp = httpx.post(
-                                f"{self.controller.base_url}/action",
-                                json={"action": "warp", "target": {"x": adj_x, "y": adj_y}},
-                                timeout=5
-                            )
-                            if resp.status_code == 200:
+                            if hasattr(self.controller, "warp_to_tile") and self.controller.warp_to_tile(adj_x, adj_y):
                                 await asyncio.sleep(0.2)
                                 self._refresh_state_snapshot()
                                 if self.last_state:
@@ -4124,7 +4641,7 @@ class StardewAgent:
                 continue  # Loop will check for adjacent crop on next iteration
                 
                 # Fallback: step-by-step movement (should rarely happen)
-                surroundings = self.controller.get_surroundings() if hasattr(self.controller, "get_surroundings") else None
+                surroundings = self._ctrl_get_surroundings() if self._ctrl_get_surroundings else None
                 dirs_info = surroundings.get("directions", {}) if surroundings else {}
                 
                 dx = target_x - player_x
@@ -4359,7 +4876,7 @@ class StardewAgent:
 
         self._batch_last_status_time = now
         self.vlm_status = f"🏠 {phase}: {progress}"
-        self._send_ui_status()
+        self._send_ui_status(force=True)
         logging.info(f"📢 Batch status: {phase} - {progress}")
 
     async def _batch_commentary(self, context: str, batch_type: str = "mining") -> None:
@@ -7217,7 +7734,7 @@ Respond with ONLY your inner monologue, nothing else."""
         logging.info(f"🔨 Grid search: best={best_pos} with score={best_score:.1f} (player at {player_pos})")
         return best_pos
 
-    def _filter_adjacent_crop_moves(self, actions: List[Action]) -> List[Action]:
+    def _filter_adjacent_crop_moves(self, actions: List[Action], state: Optional[Dict[str, Any]] = None) -> List[Action]:
         """
         Post-processing filter: Remove invalid move actions when already adjacent to a crop.
 
@@ -7227,7 +7744,7 @@ Respond with ONLY your inner monologue, nothing else."""
         Returns:
             Filtered action list with invalid moves removed.
         """
-        if not actions or not hasattr(self.controller, "get_state"):
+        if not actions or not self._ctrl_get_state:
             return actions
 
         # Only filter if first action is a move
@@ -7241,13 +7758,15 @@ Respond with ONLY your inner monologue, nothing else."""
             return actions
 
         # Get game state
-        state = self.controller.get_state()
+        if state is None:
+            state = self.controller.get_state()
         if not state:
             return actions
 
-        player_x = state.get("player", {}).get("tileX", 0)
-        player_y = state.get("player", {}).get("tileY", 0)
-        crops = state.get("location", {}).get("crops", [])
+        player = state.get("player") or _EMPTY_DICT
+        player_x = player.get("tileX", 0)
+        player_y = player.get("tileY", 0)
+        crops = (state.get("location") or _EMPTY_DICT).get("crops") or _EMPTY_LIST
 
         if not crops:
             return actions
@@ -7284,7 +7803,7 @@ Respond with ONLY your inner monologue, nothing else."""
 
         return actions
 
-    def _fix_empty_watering_can(self, actions: List[Action]) -> List[Action]:
+    def _fix_empty_watering_can(self, actions: List[Action], state: Optional[Dict[str, Any]] = None) -> List[Action]:
         """
         Override: If watering can is empty AND at water, FORCE refill_watering_can.
 
@@ -7299,7 +7818,8 @@ Respond with ONLY your inner monologue, nothing else."""
             return actions
 
         # Get state to check watering can level
-        state = self.controller.get_state() if hasattr(self.controller, "get_state") else None
+        if state is None:
+            state = self._ctrl_get_state() if self._ctrl_get_state else None
         if not state:
             return actions
 
@@ -7308,7 +7828,7 @@ Respond with ONLY your inner monologue, nothing else."""
             return actions  # Can has water, no fix needed
 
         # Watering can is empty - check if at water
-        surroundings = self.controller.get_surroundings() if hasattr(self.controller, "get_surroundings") else None
+        surroundings = self._ctrl_get_surroundings() if self._ctrl_get_surroundings else None
         if not surroundings:
             return actions
 
@@ -7463,7 +7983,7 @@ Respond with ONLY your inner monologue, nothing else."""
             logging.error(f"🌱 Cell farming failed to start: {e}")
             return False
 
-    def _process_cell_farming(self) -> Optional[Action]:
+    def _process_cell_farming(self, now: Optional[float] = None) -> Optional[Action]:
         """
         Process one tick of cell-by-cell farming.
 
@@ -7474,7 +7994,7 @@ Respond with ONLY your inner monologue, nothing else."""
             return None
 
         # Get current game state and player position
-        game_state = self.controller.get_state() if hasattr(self.controller, "get_state") else None
+        game_state = self._ctrl_get_state() if self._ctrl_get_state else None
         if not game_state:
             return None
 
@@ -7490,7 +8010,8 @@ Respond with ONLY your inner monologue, nothing else."""
         location = data.get("location", {}).get("name", "")
         if location == "FarmHouse":
             # Check if warp is already pending (prevent warp loop)
-            now = time.time()
+            if now is None:
+                now = time.monotonic()
             if self._pending_warp_location == "Farm":
                 if now - self._pending_warp_time < 3.0:
                     # Warp in progress, wait for it
@@ -7710,11 +8231,11 @@ Respond with ONLY your inner monologue, nothing else."""
         """Start Day 1 clearing mode - systematic debris clearing."""
         self._day1_clearing_active = True
         self._day1_tiles_cleared = 0
-        self._day1_last_clear_time = time.time()
+        self._day1_last_clear_time = time.monotonic()
         logging.info("🧹 Day 1 clearing: Started - clearing debris near farmhouse")
         return True
 
-    def _process_day1_clearing(self) -> Optional[Action]:
+    def _process_day1_clearing(self, now: Optional[float] = None) -> Optional[Action]:
         """
         Process one tick of Day 1 clearing.
 
@@ -7728,7 +8249,7 @@ Respond with ONLY your inner monologue, nothing else."""
             return None
 
         # Get surroundings
-        surroundings = self.controller.get_surroundings() if hasattr(self.controller, "get_surroundings") else None
+        surroundings = self._ctrl_get_surroundings() if self._ctrl_get_surroundings else None
         if not surroundings:
             return None
 
@@ -7759,21 +8280,21 @@ Respond with ONLY your inner monologue, nothing else."""
             if blocker and blocker in DEBRIS_TOOLS and tiles_until == 0:
                 skill_name, tool_slot = DEBRIS_TOOLS[blocker]
                 self._day1_tiles_cleared += 1
-                self._day1_last_clear_time = time.time()
+                self._day1_last_clear_time = now if now is not None else time.monotonic()
 
                 logging.info(f"🧹 Day 1: Clearing {blocker} to {direction} (#{self._day1_tiles_cleared})")
 
                 # Queue primitive actions: face, select_slot, use_tool
-                self.action_queue.append(Action(
+                self._queue_action(Action(
                     action_type="face",
                     params={"direction": direction},
                     description=f"Face {direction}"
-                ))
-                self.action_queue.append(Action(
+                ), ACTION_PRIORITY_DAY1_CLEARING)
+                self._queue_action(Action(
                     action_type="select_slot",
                     params={"slot": tool_slot},
                     description=f"Select tool slot {tool_slot}"
-                ))
+                ), ACTION_PRIORITY_DAY1_CLEARING)
                 return Action(
                     action_type="use_tool",
                     params={},
@@ -7907,7 +8428,7 @@ Respond with ONLY your inner monologue, nothing else."""
 
         # Don't start tasks if daily plan hasn't been created yet for today
         # This prevents race condition on first tick where tasks run before planning
-        state = self.controller.get_state() if hasattr(self.controller, "get_state") else None
+        state = self._ctrl_get_state() if self._ctrl_get_state else None
         if state:
             data = state.get("data") or state
             time_data = data.get("time", {})
@@ -7926,7 +8447,7 @@ Respond with ONLY your inner monologue, nothing else."""
         #     ... (removed - see git history for original code)
 
         # Get current game state for target generation
-        state = self.controller.get_state() if hasattr(self.controller, "get_state") else None
+        state = self._ctrl_get_state() if self._ctrl_get_state else None
         if not state:
             return False
 
@@ -8071,7 +8592,7 @@ Respond with ONLY your inner monologue, nothing else."""
         """
         Legacy fallback: Use keyword matching when PrereqResolver not available.
         """
-        state = self.controller.get_state() if hasattr(self.controller, "get_state") else None
+        state = self._ctrl_get_state() if self._ctrl_get_state else None
         if not state:
             return False
 
@@ -8147,7 +8668,7 @@ Respond with ONLY your inner monologue, nothing else."""
             return False
 
         # Get current state
-        state = self.controller.get_state() if hasattr(self.controller, "get_state") else None
+        state = self._ctrl_get_state() if self._ctrl_get_state else None
         if not state:
             return False
 
@@ -8183,7 +8704,7 @@ Respond with ONLY your inner monologue, nothing else."""
             logging.info(f"📋 Added {new_tasks} new crafting task(s)")
 
             # Re-resolve prerequisites for new tasks
-            surroundings = self.controller.get_surroundings() if hasattr(self.controller, "get_surroundings") else None
+            surroundings = self._ctrl_get_surroundings() if self._ctrl_get_surroundings else None
             self.daily_planner._resolve_prerequisites(state, surroundings, farm_state)
             return True
 
@@ -8259,14 +8780,36 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
 
         return ""
 
-    def _fix_active_popup(self, actions: List[Action]) -> List[Action]:
+    def _rewrite_actions(self, actions: List[Action]) -> List[Action]:
+        """Apply the VLM action overrides in order, sharing one post-think state fetch.
+
+        Each override used to poll /state itself (up to 7 calls per think).
+        """
+        state = self._ctrl_get_state() if self._ctrl_get_state else None
+        state = state or {}  # Empty dict = "no state" for the overrides, without re-polling
+        for override in (
+            self._fix_active_popup,  # Popup/menu dismiss first
+            self._fix_late_night_bed,  # Midnight override
+            self._fix_priority_shipping,  # Shipping priority
+            self._fix_no_seeds,  # No seeds → go to Pierre's
+            self._fix_edge_stuck,  # Edge-stuck → retreat
+            self._fix_empty_watering_can,  # Empty can override
+            self._filter_adjacent_crop_moves,  # Adjacent move filter
+        ):
+            actions = override(actions, state)
+            if not actions:
+                break  # Every later override passes an empty list through unchanged
+        return actions
+
+    def _fix_active_popup(self, actions: List[Action], state: Optional[Dict[str, Any]] = None) -> List[Action]:
         """
         Override: If menu/event is active, handle it before continuing.
         This handles level-up screens, shipping summaries, dialogue boxes, etc.
 
         Special case: Sleep confirmation dialog should be CONFIRMED, not dismissed.
         """
-        state = self.controller.get_state() if hasattr(self.controller, "get_state") else None
+        if state is None:
+            state = self._ctrl_get_state() if self._ctrl_get_state else None
         if not state:
             return actions
 
@@ -8317,7 +8860,7 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
 
         return actions
 
-    def _fix_late_night_bed(self, actions: List[Action]) -> List[Action]:
+    def _fix_late_night_bed(self, actions: List[Action], state: Optional[Dict[str, Any]] = None) -> List[Action]:
         """
         Override: If very late (hour >= 23) and not going to bed, force go_to_bed.
         Game time: 2AM = hour 26, midnight = 24, 11PM = 23
@@ -8330,7 +8873,8 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
             return actions
 
         # Get state to check time
-        state = self.controller.get_state() if hasattr(self.controller, "get_state") else None
+        if state is None:
+            state = self._ctrl_get_state() if self._ctrl_get_state else None
         if not state:
             return actions
 
@@ -8342,7 +8886,7 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
         logging.info(f"🛏️ OVERRIDE: Hour {hour} >= 23, forcing go_to_bed")
         return [Action("go_to_bed", {}, "Auto-bed (very late)")]
 
-    def _fix_priority_shipping(self, actions: List[Action]) -> List[Action]:
+    def _fix_priority_shipping(self, actions: List[Action], state: Optional[Dict[str, Any]] = None) -> List[Action]:
         """
         Override: If we have sellable crops in inventory, prioritize shipping over other tasks.
         AGGRESSIVE: Override ALL actions except critical ones until crops are shipped.
@@ -8356,38 +8900,35 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
             return actions
 
         # Get state to check inventory and location
-        state = self.controller.get_state() if hasattr(self.controller, "get_state") else None
+        if state is None:
+            state = self._ctrl_get_state() if self._ctrl_get_state else None
         if not state:
             return actions
 
-        location = state.get("location", {}).get("name", "")
+        location_data = state.get("location") or _EMPTY_DICT
+        location = location_data.get("name", "")
         if location not in ["Farm", "FarmHouse"]:
             return actions  # Only apply on farm areas
 
         # Check for sellable items
-        inventory = state.get("inventory", [])
-        sellable_items = ["Parsnip", "Potato", "Cauliflower", "Green Bean", "Kale", "Melon",
-                         "Blueberry", "Corn", "Tomato", "Pumpkin", "Cranberry", "Eggplant", "Grape", "Radish"]
-        sellables = [item for item in inventory if item and item.get("name") in sellable_items and item.get("stack", 0) > 0]
+        inventory = state.get("inventory") or _EMPTY_LIST
+        _, total_to_ship, _ = _inventory_summary(inventory)
 
-        if not sellables:
+        if not total_to_ship:
             return actions  # No sellables, proceed normally
 
-        total_to_ship = sum(item.get("stack", 0) for item in sellables)
-
         # Get player and bin positions
-        player_x = state.get("player", {}).get("tileX", 0)
-        player_y = state.get("player", {}).get("tileY", 0)
-        shipping_bin = state.get("location", {}).get("shippingBin") or {}
-        bin_x = shipping_bin.get("x", 71)
-        bin_y = shipping_bin.get("y", 14)
+        player = state.get("player") or _EMPTY_DICT
+        player_x = player.get("tileX", 0)
+        player_y = player.get("tileY", 0)
+        bin_x, bin_y = _shipping_bin_xy(location_data)
         dx = bin_x - player_x
         dy = bin_y - player_y
         dist = abs(dx) + abs(dy)
 
         # If in FarmHouse, override to warp to Farm first (with loop protection)
         if location == "FarmHouse":
-            now = time.time()
+            now = time.monotonic()
             if self._pending_warp_location == "Farm":
                 if now - self._pending_warp_time < 3.0:
                     logging.debug("📦 Warp to Farm pending, waiting...")
@@ -8426,7 +8967,7 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
         tiles = primary_tiles
 
         # Check surroundings to avoid blocked directions
-        surroundings = self.controller.get_surroundings() if hasattr(self.controller, "get_surroundings") else None
+        surroundings = self._ctrl_get_surroundings() if self._ctrl_get_surroundings else None
         if surroundings:
             data = surroundings.get("data") or surroundings
             directions = data.get("directions", {})
@@ -8462,7 +9003,7 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
         logging.info(f"📦 OVERRIDE: VLM wanted '{original_action}' but have {total_to_ship} sellables → move {direction} toward bin (dist={dist})")
         return [Action("move", {"direction": direction, "tiles": tiles}, f"Move to ship {total_to_ship} crops")]
 
-    def _fix_no_seeds(self, actions: List[Action]) -> List[Action]:
+    def _fix_no_seeds(self, actions: List[Action], state: Optional[Dict[str, Any]] = None) -> List[Action]:
         """
         Override: If we have no seeds and Pierre's is open, force go_to_pierre.
         If already at Pierre's, force buying optimal seeds from crop advisor.
@@ -8472,21 +9013,22 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
             return actions
 
         # Get state to check inventory and location
-        state = self.controller.get_state() if hasattr(self.controller, "get_state") else None
+        if state is None:
+            state = self._ctrl_get_state() if self._ctrl_get_state else None
         if not state:
             return actions
 
-        location = state.get("location", {}).get("name", "")
+        location = (state.get("location") or _EMPTY_DICT).get("name", "")
+        money = (state.get("player") or _EMPTY_DICT).get("money", 0)
 
         # Check for seeds in inventory (used in both branches)
-        inventory = state.get("inventory", [])
+        inventory = state.get("inventory") or _EMPTY_LIST
         has_seeds = any(item and ("Seed" in item.get("name", "") or item.get("name") == "Mixed Seeds")
                        for item in inventory if item)
 
         # If at Pierre's (SeedShop), force buy seeds regardless of VLM action
         if location == "SeedShop":
             if not has_seeds:
-                money = state.get("player", {}).get("money", 0)
                 if money >= 20:
                     seed_skill, seed_reason = get_recommended_seed_skill(state)
                     logging.info(f"🛒 OVERRIDE: In SeedShop with no seeds → {seed_skill} - {seed_reason} (have {money}g)")
@@ -8504,19 +9046,13 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
         if first_action not in override_actions:
             return actions  # Not a farming/debris action, let it through
 
-        # Check for seeds in inventory
-        inventory = state.get("inventory", [])
-        has_seeds = any(item and ("Seed" in item.get("name", "") or item.get("name") == "Mixed Seeds") 
-                       for item in inventory if item)
-        
         if has_seeds:
             return actions  # Has seeds, proceed normally
 
         # Check if Pierre's is open
-        time_data = state.get("time", {})
+        time_data = state.get("time") or _EMPTY_DICT
         hour = time_data.get("hour", 12)
         day_of_week = time_data.get("dayOfWeek", "")
-        money = state.get("player", {}).get("money", 0)
 
         # Pierre's is open 9-17, closed Wednesday
         if day_of_week == "Wed" or hour < 9 or hour >= 17:
@@ -8529,7 +9065,7 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
         logging.info(f"🌱 OVERRIDE: VLM wanted '{first_action}' but NO SEEDS! → go_to_pierre (have {money}g, Pierre's open)")
         return [Action("go_to_pierre", {}, f"Buy seeds (have {money}g, no seeds in inventory)")]
 
-    def _fix_edge_stuck(self, actions: List[Action]) -> List[Action]:
+    def _fix_edge_stuck(self, actions: List[Action], state: Optional[Dict[str, Any]] = None) -> List[Action]:
         """
         Override: If stuck at map edge (cliffs/water), force movement toward farm center.
         Detects repetitive actions at edges and forces retreat.
@@ -8540,16 +9076,18 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
             return actions
 
         # Get state to check position
-        state = self.controller.get_state() if hasattr(self.controller, "get_state") else None
+        if state is None:
+            state = self._ctrl_get_state() if self._ctrl_get_state else None
         if not state:
             return actions
 
-        location = state.get("location", {}).get("name", "")
+        location = (state.get("location") or _EMPTY_DICT).get("name", "")
         if location != "Farm":
             return actions  # Only apply on farm
 
-        player_x = state.get("player", {}).get("tileX", 0)
-        player_y = state.get("player", {}).get("tileY", 0)
+        player = state.get("player") or _EMPTY_DICT
+        player_x = player.get("tileX", 0)
+        player_y = player.get("tileY", 0)
 
         # Farm center is roughly (60, 20) - farmhouse area
         # Edges are: east > 75 (water), south > 50 (south water), north < 8 (north edge), west < 6
@@ -8560,7 +9098,7 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
             return actions  # Not at edge
 
         # Session 119: Check if surrounded by water/impassable (worse than just being at edge)
-        surroundings = self.controller.get_surroundings() if hasattr(self.controller, "get_surroundings") else None
+        surroundings = self._ctrl_get_surroundings() if self._ctrl_get_surroundings else None
         blocked_dirs = 0
         if surroundings:
             dirs = surroundings.get("directions", {})
@@ -8601,7 +9139,7 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
             tiles = min(abs(dy), 5)
         
         # Force move toward center (or go_to_bed if late)
-        hour = state.get("time", {}).get("hour", 12)
+        hour = (state.get("time") or _EMPTY_DICT).get("hour", 12)
         if hour >= 20:
             logging.info(f"🏃 EDGE-STUCK OVERRIDE: At edge ({player_x}, {player_y}), late night → go_to_bed")
             return [Action("go_to_bed", {}, "Late night at edge, time for bed")]
@@ -8632,15 +9170,48 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
             logging.warning(f"VLM reasoning failed: {e}")
             return None
 
-    def _refresh_state_snapshot(self) -> None:
-        if not hasattr(self.controller, "get_state"):
+    def _snapshot_tick(self) -> _TickContext:
+        """Fetch game state once for this tick and extract the fields the tick reads.
+
+        Falls back to last_state for the extracted fields when the fetch fails,
+        so overrides like bedtime still see the most recent known values.
+        """
+        game_state = self._ctrl_get_state() if self._ctrl_get_state else None
+        if game_state:
+            game_state = game_state.get("data") or game_state
+        data = game_state or self.last_state or {}
+        location_data = data.get("location") or {}
+        time_data = data.get("time") or {}
+        player = data.get("player") or {}
+        tile_x = player.get("tileX")
+        tile_y = player.get("tileY")
+        ctx = _TickContext(
+            game_state=game_state,
+            data=data,
+            location_name=location_data.get("name", "") or "",
+            hour=time_data.get("hour", 6),
+            day=time_data.get("day", 0),
+            time_data=time_data,
+            player_tile=(tile_x, tile_y) if tile_x is not None and tile_y is not None else None,
+            current_tool=player.get("currentTool"),
+        )
+        self._tick_ctx = ctx
+        return ctx
+
+    def _refresh_state_snapshot(self, state: Optional[Dict[str, Any]] = None) -> None:
+        """Refresh last_state (throttled to 0.5s) and run per-state bookkeeping.
+
+        Pass an already-fetched state (e.g. the tick snapshot) to skip the poll.
+        """
+        if not self._ctrl_get_state:
             return
         if not getattr(self.controller, "enabled", True):
             return
         now = time.time()
-        if now - self.last_state_poll < 0.5:
-            return
-        state = self.controller.get_state()
+        if state is None:
+            if now - self.last_state_poll < 0.5:
+                return
+            state = self._ctrl_get_state()
         if not state:
             return
         self.last_state_poll = now
@@ -8655,9 +9226,9 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
                 self.rusty_memory.start_session(day, season)
 
         # Fetch surroundings early - needed for daily planning (water locations)
-        if hasattr(self.controller, "get_surroundings"):
+        if self._ctrl_get_surroundings:
             try:
-                self.last_surroundings = self.controller.get_surroundings()
+                self.last_surroundings = self._ctrl_get_surroundings()
             except Exception:
                 self.last_surroundings = None
 
@@ -8809,11 +9380,10 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
             Empty dict if file not found.
         """
         try:
-            with open("logs/cell_farming_stats.json") as f:
-                stats = json.load(f)
-                logging.info(f"📊 Loaded persisted stats: {stats.get('cells_completed', 0)} completed, "
-                           f"{stats.get('cells_skipped', 0)} skipped")
-                return stats
+            stats = json.loads(Path("logs/cell_farming_stats.json").read_bytes())
+            logging.info(f"📊 Loaded persisted stats: {stats.get('cells_completed', 0)} completed, "
+                         f"{stats.get('cells_skipped', 0)} skipped")
+            return stats
         except FileNotFoundError:
             logging.debug("No persisted cell stats found")
             return {}
@@ -9066,9 +9636,21 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
             return f"press {button}"
         return action.action_type.replace("_", " ")
 
-    def _send_ui_status(self, result: Optional[ThinkResult] = None) -> None:
+    def _send_ui_status(self, result: Optional[ThinkResult] = None, force: bool = False) -> None:
+        """Push agent status to the UI.
+
+        Inside a tick, calls are coalesced: they only mark the status dirty and
+        _flush_ui_status() sends once at the end of the tick. Use force=True for
+        pushes outside the tick (start/stop, background batches) or before a
+        long blocking step that the UI should reflect right away.
+        """
         if not self.ui_enabled:
             return
+        if not force:
+            self._ui_status_dirty = True
+            if result:
+                self._pending_ui_result = result
+            return
         self._refresh_state_snapshot()
         payload: Dict[str, Any] = {
             "mode": self.config.mode,
@@ -9123,8 +9705,27 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
         # Guard against UI being disabled mid-operation
         if self.ui_enabled and self.ui:
             self._ui_safe(self.ui.update_status, **payload)
+        self._last_ui_status_key = self._ui_status_key()
+
+    def _ui_status_key(self) -> Tuple:
+        """Cheap fingerprint of the fields that make a status push worth sending."""
+        return (
+            self.vlm_status, self.think_count, self.action_count, self.action_fail_count,
+            self.validation_status, self.executed_outcome, self.last_position,
+        )
+
+    def _flush_ui_status(self) -> None:
+        """Send the coalesced status push for this tick, skipping unchanged repeats."""
+        if not self._ui_status_dirty:
+            return
+        result = self._pending_ui_result
+        self._ui_status_dirty = False
+        self._pending_ui_result = None
+        if result or self._ui_status_key() != self._last_ui_status_key:
+            self._send_ui_status(result, force=True)
 
     def _send_ui_message(self, result: ThinkResult) -> None:
+        """Post the think summary to the UI chat (once per think, not coalesced)."""
         if not self.ui_enabled:
             return
         plan = [self._format_action(a) for a in result.actions]
@@ -9153,21 +9754,116 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
         logging.info(f"Model: {self.config.model}")
         logging.info(f"Goal: {goal or 'General assistance'}")
         logging.info(f"Controller: {'ENABLED' if self.controller.enabled else 'DRY RUN'}")
+        logging.info(f"Pillow: {PIL_VERSION}{' (SIMD build)' if '.post' in PIL_VERSION else ''}")
         logging.info("=" * 60)
-        self._send_ui_status()
+        self._send_ui_status(force=True)
+        self._wake = asyncio.Event()
 
         try:
             while self.running:
                 await self._tick()
-                await asyncio.sleep(0.1)
+                await self._wait_for_next_tick()
         except KeyboardInterrupt:
             logging.info("Stopped by user")
         finally:
             self.running = False
+            if self._pending_batch_task:
+                # Let the batch unwind before its clients are closed, then hand its
+                # task back to the planner (cancelled -> reset for retry)
+                task, batch = self._pending_batch_task
+                self._pending_batch_task = None
+                if not task.done():
+                    task.cancel()
+                    try:
+                        await task
+                    except (asyncio.CancelledError, Exception):
+                        pass  # Outcome is reported by _finish_batch_task
+                self._finish_batch_task(task, batch)
             self.controller.reset()
+            controller_close = getattr(self.controller, "close", None)
+            if controller_close:
+                controller_close()
+            self.vlm.close()
+            await self.vlm.aclose()
             self.vlm_status = "Idle"
-            self._send_ui_status()
+            self._send_ui_status(force=True)
+
+
+    def _finish_batch_task(self, task: asyncio.Task, batch: Dict[str, Any]) -> None:
+        """Apply the outcome of a background batch skill to the daily planner."""
+        try:
+            success = task.result()
+            if success:
+                logging.info(f"✅ Batch {batch['skill']} completed")
+                self.daily_planner.complete_task(batch['task_id'])
+                # Session 126: Only remove from queue on SUCCESS
+                self.daily_planner.remove_resolved_task(batch['task_id'])
+            else:
+                logging.warning(f"⚠️ Batch {batch['skill']} returned False - task stays in queue for retry")
+                # Reset task status so it can be retried
+                self.daily_planner._reset_task_status(batch['task_id'])
+        except asyncio.CancelledError:
+            logging.warning(f"⚠️ Batch {batch['skill']} cancelled - task stays in queue for retry")
+            self.daily_planner._reset_task_status(batch['task_id'])
+        except Exception as e:
+            logging.error(f"❌ Batch {batch['skill']} failed: {e}")
+            # Session 134: Reset task on exception too
+            self.daily_planner._reset_task_status(batch['task_id'])
+
+    def wake(self) -> None:
+        """Wake the main loop early from an idle wait (state changed, stopping, etc.)."""
+        if self._wake:
+            self._wake.set()
+
+    def _has_tick_work(self) -> bool:
+        """True when the next tick has deterministic work that shouldn't wait for a think."""
+        return bool(
+            self.action_queue
+            or self._pending_batch
+            or self._day1_clearing_active
+            or (self.cell_coordinator and not self.cell_coordinator.is_complete())
+            or (self.task_executor and self.task_executor.is_active())
+        )
+
+    async def _wait_for_next_tick(self) -> None:
+        """Pause between ticks.
+
+        Busy ticks (queued actions, executor, batch/clearing modes) keep the 0.1s
+        cadence. When idle, sleep until the next think is due or wake() is called,
+        instead of re-running the tick every 0.1s just to hit the think gate.
+        """
+        remaining = self.config.think_interval - (time.monotonic() - self.last_think_time)
+        if self._has_tick_work() or remaining <= 0.1 or not self._wake:
+            await asyncio.sleep(0.1)
+            return
+        # With the UI up, wait in slices and check for chat messages between them
+        watch_ui = self.ui_enabled and self.ui is not None
+        deadline = time.monotonic() + remaining
+        while not self._wake.is_set():
+            left = deadline - time.monotonic()
+            if left <= 0:
+                break
+            try:
+                await asyncio.wait_for(
+                    self._wake.wait(), timeout=min(left, self._USER_MESSAGE_POLL) if watch_ui else left
+                )
+            except asyncio.TimeoutError:
+                if watch_ui:
+                    await self._check_user_messages()
+        self._wake.clear()
 
+    async def _check_user_messages(self) -> None:
+        """Wake the loop (and request a think) when a UI chat message arrived since the last think."""
+        try:
+            messages = await asyncio.to_thread(
+                self.ui.list_messages, limit=50, since_id=self.last_user_message_id or None
+            )
+        except Exception as exc:
+            logging.debug(f"Failed to poll UI messages: {exc}")
+            return
+        if any(msg.get("role") == "user" and msg.get("content") for msg in messages or ()):
+            self._user_message_pending = True
+            self.wake()
 
     def _build_dynamic_hints(self) -> str:
         """
@@ -9186,28 +9882,42 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
         hints = []
         state = self.last_state
         data = self.last_surroundings
+
+        # Hints are built only from these two payloads, and every poll yields new dicts -
+        # reuse the last build while the player idles between polls
+        cached_state, cached_data = self._hint_cache_key
+        if state is cached_state and data is cached_data:
+            return self._hint_cache_value
         
         # Extract common data
-        player = state.get("player", {})
-        location = state.get("location", {})
-        crops = location.get("crops", [])
+        player = state.get("player") or _EMPTY_DICT
+        location = state.get("location") or _EMPTY_DICT
+        crops = location.get("crops") or _EMPTY_LIST
         current_tool = player.get("currentTool", "none")
         current_slot = player.get("currentToolIndex", -1)
         player_x = player.get("tileX", 0)
         player_y = player.get("tileY", 0)
         water_left = player.get("wateringCanWater", 0)
         water_max = player.get("wateringCanMax", 40)
-        hour = state.get("time", {}).get("hour", 6)
+        hour = (state.get("time") or _EMPTY_DICT).get("hour", 6)
         energy = player.get("energy", 270)
         max_energy = player.get("maxEnergy", 270)
         energy_pct = int(100 * energy / max_energy) if max_energy > 0 else 100
-        
-        # Crop counts
-        unwatered = [c for c in crops if not c.get("isWatered", False)]
-        harvestable = [c for c in crops if c.get("isReadyForHarvest", False)]
-        
-        # Tool slots for reference (from constants)
-        tool_slots = TOOL_SLOTS
+        current_tile = data.get("currentTile", {})
+        tile_state = current_tile.get("state", "unknown")
+        inventory = state.get("inventory") or _EMPTY_LIST
+        
+        # Crop counts + crop at current position, one pass over the crop list
+        unwatered = []
+        harvestable = []
+        crop_here = None
+        for c in crops:
+            if not c.get("isWatered", False):
+                unwatered.append(c)
+            if c.get("isReadyForHarvest", False):
+                harvestable.append(c)
+            if crop_here is None and c.get("x") == player_x and c.get("y") == player_y:
+                crop_here = c
         
         # --- PRIORITY 1: Empty Watering Can ---
         if water_left <= 0 and unwatered:
@@ -9220,17 +9930,11 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
                 hints.append("⚠️ WATERING CAN EMPTY! Use go_refill_watering_can")
         
         # --- PRIORITY 2: Current Tile Action ---
-        current_tile = data.get("currentTile", {})
-        tile_state = current_tile.get("state", "unknown")
         tile_obj = current_tile.get("object")
         can_till = current_tile.get("canTill", False)
         can_plant = current_tile.get("canPlant", False)
         
-        # Check for crop at current position
-        crop_here = next((c for c in crops if c.get("x") == player_x and c.get("y") == player_y), None)
-        
         # Check for seeds in inventory
-        inventory = state.get("inventory", [])
         seed_slot = None
         seed_name = None
         for item in inventory:
@@ -9268,7 +9972,7 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
                 hints.append("✅ WATERED - move to next crop")
         elif tile_state == "debris":
             needed = "Scythe" if tile_obj in ["Weeds", "Grass"] else "Pickaxe" if tile_obj == "Stone" else "Axe"
-            needed_slot = tool_slots.get(needed, 4)
+            needed_slot = TOOL_SLOTS.get(needed, 4)
             if needed.lower() in current_tool.lower():
                 hints.append(f"🪓 {tile_obj} - use_tool to clear")
             else:
@@ -9283,7 +9987,7 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
         
         # --- PRIORITY 3: Crop Status (if not already handled) ---
         if unwatered and water_left > 0 and tile_state not in ["planted"]:
-            nearest = min(unwatered, key=lambda c: abs(c["x"] - player_x) + abs(c["y"] - player_y))
+            nearest, _ = _nearest_tile(unwatered, player_x, player_y)
             dx = nearest["x"] - player_x
             dy = nearest["y"] - player_y
             dist = abs(dx) + abs(dy)
@@ -9292,25 +9996,25 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
                 # Standing ON crop - step back first
                 hints.append(f"💧 ON CROP! DO: move 1 tile back, face crop, water")
             elif dist == 1:
-                face_dir = "north" if dy < 0 else "south" if dy > 0 else "west" if dx < 0 else "east"
+                face_dir = _FACE_LC[0 if dy < 0 else 1 if dy > 0 else 2 if dx < 0 else 3]
                 hints.append(f"💧 ADJACENT! DO: face {face_dir}, water_crop (NO move!)")
             elif dist > 1:
                 # Calculate movement to stop ADJACENT (1 tile away), then face crop
                 abs_dx, abs_dy = abs(dx), abs(dy)
                 if abs_dy == 0:
                     move_hint = f"{abs_dx-1}{'E' if dx > 0 else 'W'}"
-                    face_dir = "EAST" if dx > 0 else "WEST"
+                    face_dir = _FACE_UC[3 if dx > 0 else 2]
                 elif abs_dx == 0:
                     move_hint = f"{abs_dy-1}{'S' if dy > 0 else 'N'}"
-                    face_dir = "SOUTH" if dy > 0 else "NORTH"
+                    face_dir = _FACE_UC[1 if dy > 0 else 0]
                 else:
                     # Diagonal: reduce larger axis by 1
                     if abs_dy >= abs_dx:
                         my, mx = abs_dy - 1, abs_dx
-                        face_dir = "SOUTH" if dy > 0 else "NORTH"
+                        face_dir = _FACE_UC[1 if dy > 0 else 0]
                     else:
                         my, mx = abs_dy, abs_dx - 1
-                        face_dir = "EAST" if dx > 0 else "WEST"
+                        face_dir = _FACE_UC[3 if dx > 0 else 2]
                     parts = []
                     if my > 0: parts.append(f"{my}{'S' if dy > 0 else 'N'}")
                     if mx > 0: parts.append(f"{mx}{'E' if dx > 0 else 'W'}")
@@ -9318,7 +10022,7 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
                 hints.append(f"💧 {len(unwatered)} unwatered - move {move_hint}, face {face_dir}")
         
         if harvestable and tile_state != "planted":
-            nearest_h = min(harvestable, key=lambda c: abs(c["x"] - player_x) + abs(c["y"] - player_y))
+            nearest_h, _ = _nearest_tile(harvestable, player_x, player_y)
             dx = nearest_h["x"] - player_x
             dy = nearest_h["y"] - player_y
             dist = abs(dx) + abs(dy)
@@ -9327,25 +10031,25 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
                 # Standing ON crop - step back first
                 hints.append(f"🌾 ON CROP! DO: move 1 tile back, face crop, harvest")
             elif dist == 1:
-                face_dir = "north" if dy < 0 else "south" if dy > 0 else "west" if dx < 0 else "east"
+                face_dir = _FACE_LC[0 if dy < 0 else 1 if dy > 0 else 2 if dx < 0 else 3]
                 hints.append(f"🌾 ADJACENT! DO: face {face_dir}, harvest_crop (NO move!)")
             elif dist > 1:
                 # Calculate movement to stop ADJACENT (1 tile away), then face crop
                 abs_dx, abs_dy = abs(dx), abs(dy)
                 if abs_dy == 0:
                     move_hint = f"{abs_dx-1}{'E' if dx > 0 else 'W'}"
-                    face_dir = "EAST" if dx > 0 else "WEST"
+                    face_dir = _FACE_UC[3 if dx > 0 else 2]
                 elif abs_dx == 0:
                     move_hint = f"{abs_dy-1}{'S' if dy > 0 else 'N'}"
-                    face_dir = "SOUTH" if dy > 0 else "NORTH"
+                    face_dir = _FACE_UC[1 if dy > 0 else 0]
                 else:
                     # Diagonal: reduce larger axis by 1
                     if abs_dy >= abs_dx:
                         my, mx = abs_dy - 1, abs_dx
-                        face_dir = "SOUTH" if dy > 0 else "NORTH"
+                        face_dir = _FACE_UC[1 if dy > 0 else 0]
                     else:
                         my, mx = abs_dy, abs_dx - 1
-                        face_dir = "EAST" if dx > 0 else "WEST"
+                        face_dir = _FACE_UC[3 if dx > 0 else 2]
                     parts = []
                     if my > 0: parts.append(f"{my}{'S' if dy > 0 else 'N'}")
                     if mx > 0: parts.append(f"{mx}{'E' if dx > 0 else 'W'}")
@@ -9364,7 +10068,9 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
             hints.append("😐 Energy low - pace yourself")
         
         # Return top 5 hints max
-        return "\n".join(hints[:5])
+        self._hint_cache_key = (state, data)
+        self._hint_cache_value = "\n".join(islice(hints, 5))
+        return self._hint_cache_value
 
     def _build_light_context(self) -> str:
         """
@@ -9377,9 +10083,10 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
             return ""
 
         # Basic state
-        location_data = self.last_state.get("location", {})
-        time_data = self.last_state.get("time", {})
-        player_data = self.last_state.get("player", {})
+        state = self.last_state
+        location_data = state.get("location") or _EMPTY_DICT
+        time_data = state.get("time") or _EMPTY_DICT
+        player_data = state.get("player") or _EMPTY_DICT
 
         location = location_data.get("name", "Unknown")
         pos = location_data.get("position", {})
@@ -9387,8 +10094,11 @@ If everything looks normal, just provide commentary. Only say PAUSE if something
 
         hour = time_data.get("hour", 6)
         minute = time_data.get("minute", 0)
-        am_pm = "am" if hour < 12 else "pm"
-        display_hour = hour if hour <= 12 else hour - 12
+        if type(hour) is int and 0 <= hour < len(_HOUR_DISPLAY):
+            display_hour, am_pm = _HOUR_DISPLAY[hour]
+        else:  # Unexpected hour (negative, float, ...) - same arithmetic as the table
+            am_pm = "am" if hour < 12 else "pm"
+            display_hour = hour if hour <= 12 else hour - 12
         time_str = f"{display_hour}:{minute:02d} {am_pm}"
 
         energy = player_data.get("energy", 270)
@@ -9475,15 +10185,32 @@ Recent: {recent}"""
         return result
 
     async def _tick(self):
-        """Single tick of the agent loop."""
-        now = time.time()
+        """Single tick of the agent loop; UI status pushes are flushed once at the end."""
+        try:
+            await self._tick_once()
+        finally:
+            self._flush_ui_status()
+
+    async def _tick_once(self):
+        """Tick body - see _tick()."""
+        # One monotonic read per tick - intervals must not jump with the wall clock
+        now = time.monotonic()
 
         # Session 124: DIAGNOSTIC - this MUST appear every tick
-        logging.info(f"⏱️ TICK: queue={len(self.action_queue)}, day1={self._day1_clearing_active}, pending_batch={self._pending_batch is not None}")
+        logging.info(f"⏱️ TICK: queue={len(self.action_queue)}, day1={self._day1_clearing_active}, pending_batch={self._pending_batch is not None or self._pending_batch_task is not None}")
+
+        # Batch skill running in background owns the controller - only finish it when done
+        if self._pending_batch_task:
+            task, batch = self._pending_batch_task
+            if not task.done():
+                return
+            self._pending_batch_task = None
+            self._finish_batch_task(task, batch)
+            return  # Done with this tick
 
         # Execute queued actions first
         if self.action_queue:
-            action = self.action_queue.pop(0)
+            priority, _, action = heapq.heappop(self.action_queue)
 
             # Handle diagonal movement: split into two cardinal moves
             diagonal_second_dir = None  # Track if we're doing a diagonal split
@@ -9503,7 +10230,7 @@ Recent: {recent}"""
                         params={"direction": second_dir, "duration": action.params.get("duration", 0.3)},
                         description=f"move {second_dir} (diagonal split)"
                     )
-                    self.action_queue.insert(0, second_action)
+                    self._queue_actions_front([second_action], priority)
 
             # Collision check for move actions - skip if direction is blocked
             if action.action_type == "move" and isinstance(self.controller, ModBridgeController):
@@ -9526,8 +10253,7 @@ Recent: {recent}"""
                         if blocker_key in self._skip_blockers:
                             # Already know this is impassable, skip immediately
                             logging.debug(f"⏭️ Known impassable: {blocker} at ({target_x},{target_y})")
-                            self.recent_actions.append(f"SKIP: {blocker} at ({target_x},{target_y}) (known impassable)")
-                            self.recent_actions = self.recent_actions[-10:]
+                            self._push_recent_action(f"SKIP: {blocker} at ({target_x},{target_y}) (known impassable)")
                             # Don't try to execute this move, let VLM pick alternative
                             return
 
@@ -9549,15 +10275,7 @@ Recent: {recent}"""
                         })
 
                         if blocker in CLEARABLE_DEBRIS:
-                            # Get blocker position for failure tracking
-                            position = surroundings.get("position", {})
-                            px, py = position.get("x", 0), position.get("y", 0)
-                            loc_name = self.last_state.get("location", {}).get("name", "Farm") if self.last_state else "Farm"
-                            # Calculate target tile based on direction
-                            dx, dy = {"north": (0, -1), "south": (0, 1), "west": (-1, 0), "east": (1, 0), "up": (0, -1), "down": (0, 1), "left": (-1, 0), "right": (1, 0)}.get(direction, (0, 0))
-                            target_x, target_y = px + dx, py + dy
-                            blocker_key = (loc_name, target_x, target_y, blocker)
-
+                            # blocker_key (location + target tile) computed by the early skip check above
                             # Check if we've given up on this blocker
                             if blocker_key in self._skip_blockers:
                                 logging.warning(f"⏭️ Skipping {blocker} at ({target_x},{target_y}) - gave up after {self._max_clear_attempts} attempts")
@@ -9571,8 +10289,7 @@ Recent: {recent}"""
                                     # Too many failures - give up on this blocker
                                     self._skip_blockers.add(blocker_key)
                                     logging.warning(f"🚫 Giving up on {blocker} at ({target_x},{target_y}) after {attempts} failed attempts")
-                                    self.recent_actions.append(f"GAVE_UP: {blocker} at ({target_x},{target_y}) - unclearable")
-                                    self.recent_actions = self.recent_actions[-10:]
+                                    self._push_recent_action(f"GAVE_UP: {blocker} at ({target_x},{target_y}) - unclearable")
                                     # Record lesson about this obstacle
                                     if self.lesson_memory:
                                         self.lesson_memory.record_failure(
@@ -9602,13 +10319,12 @@ Recent: {recent}"""
                                             f"move {diagonal_second_dir} (diagonal)"
                                         ))
                                         # Remove the queued second move (we'll add it back after clearing)
-                                        if self.action_queue and self.action_queue[0].params.get("direction") == diagonal_second_dir:
-                                            self.action_queue.pop(0)
+                                        if self.action_queue and self.action_queue[0][2].params.get("direction") == diagonal_second_dir:
+                                            heapq.heappop(self.action_queue)
 
                                     # Insert clearing actions at front of queue
-                                    self.action_queue = clear_actions + self.action_queue
-                                    self.recent_actions.append(f"CLEARING: {blocker} to {direction} (attempt {attempts})")
-                                    self.recent_actions = self.recent_actions[-10:]
+                                    self._queue_actions_front(clear_actions, priority)
+                                    self._push_recent_action(f"CLEARING: {blocker} to {direction} (attempt {attempts})")
                                     # Update validation status - blocked but auto-clearing
                                     self.validation_status = "blocked"
                                     self.validation_reason = f"{blocker} (auto-clearing, attempt {attempts})"
@@ -9618,13 +10334,6 @@ Recent: {recent}"""
                                     return  # Will execute select_slot next tick
 
                         # Non-clearable obstacle (or gave up) - track it so we don't loop
-                        position = surroundings.get("position", {})
-                        px, py = position.get("x", 0), position.get("y", 0)
-                        loc_name = self.last_state.get("location", {}).get("name", "Farm") if self.last_state else "Farm"
-                        dx, dy = {"north": (0, -1), "south": (0, 1), "west": (-1, 0), "east": (1, 0), "up": (0, -1), "down": (0, 1), "left": (-1, 0), "right": (1, 0)}.get(direction, (0, 0))
-                        target_x, target_y = px + dx, py + dy
-                        blocker_key = (loc_name, target_x, target_y, blocker)
-
                         # Add to skip set if not already there (prevents infinite loops on non-clearable)
                         if blocker_key not in self._skip_blockers:
                             self._skip_blockers.add(blocker_key)
@@ -9651,15 +10360,14 @@ Recent: {recent}"""
 
                         # If this was part of a diagonal, cancel the second move too
                         if diagonal_second_dir and self.action_queue:
-                            next_action = self.action_queue[0]
+                            next_action = self.action_queue[0][2]
                             if (next_action.action_type == "move" and
                                 next_action.params.get("direction") == diagonal_second_dir):
-                                self.action_queue.pop(0)
+                                heapq.heappop(self.action_queue)
                                 logging.warning(f"   ↳ Cancelling diagonal second move ({diagonal_second_dir})")
 
                         # Still record the ATTEMPTED action so VLM learns from failed attempts
-                        self.recent_actions.append(f"BLOCKED: move {direction} (hit {blocker})")
-                        self.recent_actions = self.recent_actions[-10:]
+                        self._push_recent_action(f"BLOCKED: move {direction} (hit {blocker})")
                         self.movement_attempts += 1
                         self.last_blocked_direction = f"{direction} ({blocker})"
                         # Update validation status - blocked, cannot clear
@@ -9676,8 +10384,7 @@ Recent: {recent}"""
             self.vlm_status = "Executing"
             if action.action_type == "move":
                 self.movement_attempts += 1
-            self.recent_actions.append(self._format_action(action))
-            self.recent_actions = self.recent_actions[-10:]  # Keep last 10 for pattern detection
+            self._push_recent_action(self._format_action(action))
 
             # Save daily summary before going to bed
             if action.action_type in ("go_to_bed", "sleep"):
@@ -9686,10 +10393,10 @@ Recent: {recent}"""
 
             # Check if this is a skill (multi-step action sequence)
             if self.is_skill(action.action_type):
-                logging.info(f"🎯 Executing skill: {action.action_type} {action.params}")
+                logging.info("🎯 Executing skill: %s %s", action.action_type, action.params)
                 success = await self.execute_skill(action.action_type, action.params)
             else:
-                logging.info(f"🎮 Executing: {action.action_type} {action.params}")
+                logging.info("🎮 Executing: %s %s", action.action_type, action.params)
                 success = self.controller.execute(action)
 
             self._record_action_event(action, success)
@@ -9703,12 +10410,19 @@ Recent: {recent}"""
             
             await asyncio.sleep(self.config.action_delay)
             self._send_ui_status()
+            # Queue drained (warps included - the mod confirms them before execute returns):
+            # run STEP 2 on the next tick instead of idling until the next think
+            if not self.action_queue:
+                self.wake()
             return
 
         # ═══════════════════════════════════════════════════════════════════════
         # TASK EXECUTOR: Deterministic execution (skip VLM when task is active)
         # ═══════════════════════════════════════════════════════════════════════
 
+        # Single state fetch for the rest of this tick
+        ctx = self._snapshot_tick()
+
         # STEP 1: Handle completed tasks FIRST (remove from queue before starting new)
         # This runs when state is TASK_COMPLETE - cleanup must happen before starting next task
         if self.task_executor and self.task_executor.is_complete() and self.task_executor.progress:
@@ -9725,18 +10439,13 @@ Recent: {recent}"""
                     logging.info(f"📋 Daily planner: marked {task_id} complete")
                     # Remove from resolved queue to prevent re-execution
                     resolved_queue = getattr(self.daily_planner, 'resolved_queue', [])
-                    # Log queue IDs (handle both ResolvedTask objects and dicts)
-                    rt_ids = [getattr(rt, 'original_task_id', None) or (rt.get('original_task_id', '?') if isinstance(rt, dict) else '?') for rt in resolved_queue[:5]]
-                    logging.info(f"📋 Queue before removal: {rt_ids}")
-                    removed = False
-                    for i, rt in enumerate(resolved_queue):
-                        rt_id = rt.original_task_id if hasattr(rt, 'original_task_id') else rt.get('original_task_id', '')
-                        if rt_id == task_id:
-                            resolved_queue.pop(i)
-                            logging.info(f"📋 Removed {task_id} from resolved queue ({len(resolved_queue)} remaining)")
-                            removed = True
-                            break
-                    if not removed:
+                    if logging.getLogger().isEnabledFor(logging.DEBUG):
+                        # Log queue IDs (handle both ResolvedTask objects and dicts)
+                        rt_ids = [getattr(rt, 'original_task_id', None) or (rt.get('original_task_id', '?') if isinstance(rt, dict) else '?') for rt in resolved_queue[:5]]
+                        logging.debug(f"📋 Queue before removal: {rt_ids}")
+                    if self.daily_planner.remove_resolved_task(task_id):
+                        logging.info(f"📋 Removed {task_id} from resolved queue ({len(resolved_queue)} remaining)")
+                    else:
                         logging.warning(f"⚠️ Could not find {task_id} in resolved queue to remove!")
                 except Exception as e:
                     logging.warning(f"Failed to mark task complete: {e}")
@@ -9745,6 +10454,7 @@ Recent: {recent}"""
             self.task_executor.state = TaskState.IDLE
             self.task_executor.progress = None
             logging.info(f"📋 TaskExecutor reset to IDLE, ready for next task")
+            self.wake()  # Start the next task next tick, not at the next think
 
         # STEP 1b: Handle BLOCKED tasks (0 targets, need to retry from different position)
         # This happens when water task is started from FarmHouse - pathfinding fails
@@ -9753,9 +10463,7 @@ Recent: {recent}"""
             task_type = self.task_executor.progress.task_type
             
             # Check if we're now on Farm (can retry)
-            current_loc = self.last_state.get("location", {}).get("name", "") if self.last_state else ""
-            
-            if current_loc == "Farm":
+            if ctx.location_name == "Farm":
                 # We're on Farm now - retry the blocked task
                 logging.info(f"🔄 Retrying blocked task {task_type} - now on Farm")
                 self.task_executor.state = TaskState.IDLE
@@ -9770,25 +10478,21 @@ Recent: {recent}"""
 
         # STEP 2a: Day 1 clearing mode (systematic, no VLM)
         # Check if we should be in Day 1 clearing mode
-        game_state = self.controller.get_state() if hasattr(self.controller, "get_state") else None
-        if game_state:
-            data = game_state.get("data") or game_state
-            time_data = data.get("time", {})
-            current_day = time_data.get("day", 0)
-            location = data.get("location", {}).get("name", "")
+        if ctx.game_state:
+            location = ctx.location_name
 
-            if current_day == 1:
+            if ctx.day == 1:
                 # Warp to Farm if in FarmHouse (use pending warp to prevent loop)
                 if location == "FarmHouse":
                     if self._pending_warp_location != "Farm":
                         logging.info("🧹 Day 1: Warping to Farm for clearing")
                         self._pending_warp_location = "Farm"
-                        self._pending_warp_time = time.time()
-                        self.action_queue.append(Action(
+                        self._pending_warp_time = now
+                        self._queue_action(Action(
                             action_type="warp",
                             params={"location": "Farm"},
                             description="Day 1: Warp to Farm for clearing"
-                        ))
+                        ), ACTION_PRIORITY_PRECONDITION)
                     return
                 elif location == "Farm":
                     self._pending_warp_location = None  # Clear pending warp
@@ -9797,14 +10501,13 @@ Recent: {recent}"""
 
         if self._day1_clearing_active:
             # Run VLM commentary every 25 seconds during clearing
-            now = time.time()
-            time_since_vlm = now - getattr(self, '_last_vlm_time', 0)
+            time_since_vlm = now - self._last_vlm_time
 
             if time_since_vlm < 25:
                 # Process clearing
-                clear_action = self._process_day1_clearing()
+                clear_action = self._process_day1_clearing(now)
                 if clear_action:
-                    self.action_queue.append(clear_action)
+                    self._queue_action(clear_action, ACTION_PRIORITY_DAY1_CLEARING)
                     self.vlm_status = f"Day 1 clearing: {self._day1_tiles_cleared} tiles cleared"
                     self._send_ui_status()
                     return  # Action queued - skip VLM this tick
@@ -9815,9 +10518,9 @@ Recent: {recent}"""
 
         # STEP 2b: Cell-by-cell farming execution (if active, Day 2+)
         if self.cell_coordinator and not self.cell_coordinator.is_complete():
-            cell_action = self._process_cell_farming()
+            cell_action = self._process_cell_farming(now)
             if cell_action:
-                self.action_queue.append(cell_action)
+                self._queue_action(cell_action, ACTION_PRIORITY_TASK_EXECUTOR)
                 self.vlm_status = f"Cell farming: {self.cell_coordinator.get_status_summary()}"
                 self._send_ui_status()
                 return  # Action queued - skip VLM this tick
@@ -9826,7 +10529,9 @@ Recent: {recent}"""
         # STEP 2b: Try to start a task from daily planner if executor is idle
         # Skip task executor on Day 1 - Day 1 clearing handles everything
         # Session 124: Diagnostic logging BEFORE executor check
-        logging.info(f"🔍 STEP 2b: day1_clearing={self._day1_clearing_active}, has_executor={self.task_executor is not None}, has_planner={self.daily_planner is not None}")
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info("🔍 STEP 2b: day1_clearing=%s, has_executor=%s, has_planner=%s",
+                         self._day1_clearing_active, self.task_executor is not None, self.daily_planner is not None)
         if self._day1_clearing_active:
             pass  # Day 1 clearing is exclusive
         elif self.task_executor:
@@ -9835,13 +10540,13 @@ Recent: {recent}"""
             if executor_active:
                 logging.debug(f"📋 Task executor active: state={executor_state}")
             elif not executor_active:
-                # Session 123: Debug logging for task queue
-                if self.daily_planner:
+                # Session 123: Debug logging for task queue (skip the task scan unless DEBUG)
+                if self.daily_planner and logging.getLogger().isEnabledFor(logging.DEBUG):
                     queue = getattr(self.daily_planner, 'resolved_queue', [])
                     pending = [t for t in self.daily_planner.tasks if t.status == "pending"]
-                    logging.info(f"📋 Task queue: {len(queue)} resolved, {len(pending)} pending tasks")
+                    logging.debug(f"📋 Task queue: {len(queue)} resolved, {len(pending)} pending tasks")
                     for t in pending[:3]:
-                        logging.info(f"   📋 Pending: {t.id} ({t.category}) skill_override={getattr(t, 'skill_override', None)}")
+                        logging.debug(f"   📋 Pending: {t.id} ({t.category}) skill_override={getattr(t, 'skill_override', None)}")
                 if self._try_start_daily_task():
                     # Check if batch operation is pending
                     if hasattr(self, '_pending_batch') and self._pending_batch:
@@ -9852,45 +10557,21 @@ Recent: {recent}"""
                         self.vlm_status = f"Batch: {batch['skill']}"
                         self._send_ui_status()
 
-                        try:
-                            success = await self.execute_skill(batch['skill'], {})
-                            if success:
-                                logging.info(f"✅ Batch {batch['skill']} completed")
-                                self.daily_planner.complete_task(batch['task_id'])
-                                # Session 126: Only remove from queue on SUCCESS
-                                queue = batch['queue']
-                                for j, rt in enumerate(queue):
-                                    rt_id = rt.original_task_id if hasattr(rt, 'original_task_id') else rt.get('original_task_id', '')
-                                    if rt_id == batch['task_id']:
-                                        queue.pop(j)
-                                        break
-                            else:
-                                logging.warning(f"⚠️ Batch {batch['skill']} returned False - task stays in queue for retry")
-                                # Reset task status so it can be retried
-                                self.daily_planner._reset_task_status(batch['task_id'])
-                        except Exception as e:
-                            logging.error(f"❌ Batch {batch['skill']} failed: {e}")
-                            # Session 134: Reset task on exception too
-                            self.daily_planner._reset_task_status(batch['task_id'])
-
+                        # Run in background - ticks keep the loop alive and finish it when done
+                        task = asyncio.create_task(self.execute_skill(batch['skill'], {}))
+                        task.add_done_callback(lambda _t: self.wake())
+                        self._pending_batch_task = (task, batch)
                         return  # Done with this tick
                     # else: Task started - executor will handle it next iteration
 
         if self.task_executor and self.task_executor.is_active() and not self._day1_clearing_active:
-            # Get FRESH game state for position and precondition checks
-            game_state = self.controller.get_state() if hasattr(self.controller, "get_state") else None
-            surroundings = self.controller.get_surroundings() if hasattr(self.controller, "get_surroundings") else None
-
-            # Extract FRESH player position from game state (not cached last_position)
-            if game_state:
-                data = game_state.get("data") or game_state
-                player = data.get("player") or {}
-                tile_x = player.get("tileX")
-                tile_y = player.get("tileY")
-                if tile_x is not None and tile_y is not None:
-                    player_pos = (tile_x, tile_y)
-                else:
-                    player_pos = self.last_position or (0, 0)
+            # FRESH game state (tick snapshot) for position and precondition checks
+            game_state = ctx.game_state
+            surroundings = self._ctrl_get_surroundings() if self._ctrl_get_surroundings else None
+
+            # FRESH player position from the snapshot (not cached last_position)
+            if game_state and ctx.player_tile:
+                player_pos = ctx.player_tile
             else:
                 player_pos = self.last_position or (0, 0)
 
@@ -9906,8 +10587,8 @@ Recent: {recent}"""
                         params=executor_action.params,
                         description=executor_action.reason
                     )
-                    self.action_queue.append(action)
-                    logging.info(f"🎯 TaskExecutor (precondition): {executor_action.action_type} → {executor_action.reason}")
+                    self._queue_action(action, ACTION_PRIORITY_PRECONDITION)
+                    logging.info("🎯 TaskExecutor (precondition): %s → %s", executor_action.action_type, executor_action.reason)
                     self.vlm_status = f"Precondition: {executor_action.action_type}"
                     self._send_ui_status()
                     return  # Execute precondition immediately, skip VLM
@@ -9917,11 +10598,11 @@ Recent: {recent}"""
 
                 if should_comment:
                     if event_context:
-                        logging.info(f"🎭 Event-driven commentary: {event_context}")
+                        logging.info("🎭 Event-driven commentary: %s", event_context)
                         # Store event context for VLM prompt injection
                         self._commentary_event = event_context
                     else:
-                        logging.info(f"🎭 Fallback commentary: tick {self.task_executor.tick_count}")
+                        logging.info("🎭 Fallback commentary: tick %s", self.task_executor.tick_count)
                         self._commentary_event = None
                     # Store executor action - VLM will run in commentary-only mode
                     self._pending_executor_action = Action(
@@ -9930,7 +10611,7 @@ Recent: {recent}"""
                         description=executor_action.reason
                     )
                     self._task_executor_commentary_only = True  # VLM observes, doesn't generate actions
-                    logging.info(f"🎯 TaskExecutor owns execution, VLM commentary-only: {executor_action.action_type}")
+                    logging.info("🎯 TaskExecutor owns execution, VLM commentary-only: %s", executor_action.action_type)
                     # Continue to VLM for observation/commentary (don't return)
                 else:
                     # Queue the executor's action and skip VLM
@@ -9939,8 +10620,8 @@ Recent: {recent}"""
                         params=executor_action.params,
                         description=executor_action.reason
                     )
-                    self.action_queue.append(action)
-                    logging.info(f"🎯 TaskExecutor: {executor_action.action_type} → {executor_action.reason}")
+                    self._queue_action(action, ACTION_PRIORITY_TASK_EXECUTOR)
+                    logging.info("🎯 TaskExecutor: %s → %s", executor_action.action_type, executor_action.reason)
                     
                     # Update UI status
                     self.vlm_status = f"Executing task: {self.task_executor.progress.task_type if self.task_executor.progress else 'unknown'}"
@@ -9951,13 +10632,33 @@ Recent: {recent}"""
                 self._task_executor_commentary_only = False  # Ensure flag is cleared
                 # Note: Task completion handling is now done in STEP 1 above (before is_active check)
 
-        # Time to think?
-        if now - self.last_think_time >= self.config.think_interval:
+        # Time to think? (or answer a chat message that arrived during the idle wait)
+        if self._user_message_pending or now - self.last_think_time >= self.config.think_interval:
             self.last_think_time = now
+            self._user_message_pending = False
 
             self.vlm_status = "Thinking"
-            self._send_ui_status()
-            self._refresh_state_snapshot()
+            self._send_ui_status(force=True)  # VLM call blocks for seconds - show it now
+            self._refresh_state_snapshot(ctx.game_state)
+
+            # Get memory context (NPC knowledge + past experiences) in a worker thread
+            # while the screenshot and prompt context are built. Only think() uses it.
+            game_day = ""
+            if ctx.data:
+                time_data = ctx.time_data
+                game_day = f"{time_data.get('season', '')} {time_data.get('day', '')} Y{time_data.get('year', 1)}"
+            memory_task = None
+            if HAS_MEMORY and get_context_for_vlm and not self.config.vision_first_enabled:
+                # NPC names are only needed here - skip unnamed entries
+                npcs = (ctx.data.get("location") or {}).get("npcs", ())
+                nearby_npcs = [name for name in (npc.get("name") for npc in npcs) if name]
+                memory_task = asyncio.create_task(asyncio.to_thread(
+                    get_context_for_vlm,
+                    location=ctx.location_name,
+                    nearby_npcs=nearby_npcs,
+                    current_goal=self.goal,
+                    game_day=game_day
+                ))
 
             # Capture screen (crop for splitscreen mode - Player 2 right half)
             crop = self.config.splitscreen_region if self.config.mode == "splitscreen" else None
@@ -9966,28 +10667,29 @@ Recent: {recent}"""
             # Save screenshot (with rotation - keep last 100)
             if self.config.save_screenshots:
                 timestamp = datetime.now().strftime("%H%M%S")
-                img.save(self.config.screenshot_dir / f"screen_{timestamp}.png")
-                # Cleanup old screenshots every 50 saves
-                if not hasattr(self, '_screenshot_count'):
-                    self._screenshot_count = 0
-                self._screenshot_count += 1
-                if self._screenshot_count >= 50:
-                    self._screenshot_count = 0
-                    screenshots = sorted(self.config.screenshot_dir.glob("screen_*.png"))
-                    if len(screenshots) > 100:
-                        for old in screenshots[:-100]:
-                            old.unlink()
+                screenshot_path = self.config.screenshot_dir / f"screen_{timestamp}.png"
+                ring = self._screenshot_ring
+                evicted = None
+                # Same-second saves overwrite one file - don't track it twice
+                if not ring or ring[-1] != screenshot_path:
+                    if len(ring) == ring.maxlen:
+                        evicted = ring[0]
+                    ring.append(screenshot_path)
+                # PNG encode + disk I/O in a worker thread, overlapping the VLM call. The save
+                # gets its own copy: Image.save mutates encoder state on the image, and the
+                # think below encodes the same frame concurrently.
+                save_task = asyncio.create_task(
+                    self._save_screenshot_async(img.copy(), screenshot_path, evicted)
+                )
+                self._screenshot_tasks.add(save_task)
+                save_task.add_done_callback(self._screenshot_tasks.discard)
 
             # Get spatial context from mod if available
             spatial_context = ""
-            if hasattr(self.controller, 'format_surroundings'):
-                spatial_context = self.controller.format_surroundings()
+            if self._ctrl_format_surroundings_async:
+                spatial_context = await self._ctrl_format_surroundings_async()
                 if spatial_context:
-                    lines = spatial_context.splitlines()
-                    self.current_instruction = next(
-                        (line.strip() for line in lines if line.strip().startswith(">>>")),
-                        None
-                    )
+                    self.current_instruction = self._extract_instruction(spatial_context)
                     self.navigation_target = self._extract_navigation_target(self.current_instruction)
                     logging.info(f"   🧭 {spatial_context}")
                 else:
@@ -9998,25 +10700,20 @@ Recent: {recent}"""
             action_context_parts = []
 
             # Check for late-night urgency FIRST (overrides other goals)
-            time_hint = self._get_time_urgency_hint(self.last_state)
-            if time_hint:
-                action_context_parts.append(time_hint)
-                logging.info(f"   ⏰ Time urgency: hour >= 22, warning added")
+            self._add_context(action_context_parts, self._get_time_urgency_hint(ctx.data),
+                              "   ⏰ Time urgency: hour >= 22, warning added")
 
             # Add task executor context (current task, progress, next target)
-            task_context = self._get_task_executor_context()
-            if task_context:
-                action_context_parts.append(task_context)
-                logging.info(f"   🎯 Task context added: {self.task_executor.progress.task_type if self.task_executor and self.task_executor.progress else 'none'}")
+            progress = self.task_executor.progress if self.task_executor else None
+            self._add_context(action_context_parts, self._get_task_executor_context(),
+                              "   🎯 Task context added: %s", progress.task_type if progress else "none")
 
             # Add farm plan context if active
             if self.plot_manager and self.plot_manager.is_active() and self.last_position:
                 farm_plan_context = self.plot_manager.get_prompt_context(
                     self.last_position[0], self.last_position[1]
                 )
-                if farm_plan_context:
-                    action_context_parts.append(farm_plan_context)
-                    logging.info("   📋 Farm plan context added")
+                if self._add_context(action_context_parts, farm_plan_context, "   📋 Farm plan context added"):
                     # Also sync state from game
                     if self.last_surroundings and self.last_state:
                         self.plot_manager.update_from_game_state(
@@ -10028,76 +10725,43 @@ Recent: {recent}"""
                 action_context_parts.append(
                     f"USER MESSAGES (respond in reasoning):\n{user_context}"
                 )
-            spatial_hint = self._get_spatial_hint()
-            if spatial_hint:
-                action_context_parts.append(spatial_hint)
-            skill_context = self._get_skill_context(self.goal)  # Session 122: Pass goal for prioritization
-            if skill_context:
-                action_context_parts.append(skill_context)
-                logging.info(f"   📚 Skill context: {len(self.skill_context.get_available_skills(self.last_state) if self.skill_context and self.last_state else [])} available")
+            self._add_context(action_context_parts, self._get_spatial_hint())
+            if not self.config.vision_first_enabled:  # think_vision_first() lists no skills
+                # Session 122: Pass goal for prioritization
+                self._add_context(action_context_parts, self._get_skill_context(self.goal),
+                                  "   📚 Skill context: %d available", self._available_skills_count)
             if self.recent_actions:
-                action_history = "\n".join(f"  {i+1}. {a}" for i, a in enumerate(self.recent_actions))
+                action_history = self._get_action_history_str()
                 # Detect repetition - warn if same action 3+ times in last 5
-                recent_5 = self.recent_actions[-5:]
-                repeat_count = 0
-                last_action = ""
-                if recent_5:
-                    last_action = recent_5[-1]
-                    repeat_count = sum(1 for a in recent_5 if a == last_action)
+                last_action = self.recent_actions[-1]
+                repeat_count = self._recent5_counts.get(last_action, 0)
 
                 if repeat_count >= 3:
                     # VERY PROMINENT warning - tell VLM to USE VISION
-                    warning = f"🚨 STOP! You're STUCK! 🚨\nYou've done '{last_action}' {repeat_count} TIMES and it's not working!\n\n"
+                    warning = _STUCK_WARNING_TEMPLATE.format(last_action=last_action, repeat_count=repeat_count)
 
                     # Check if stuck indoors - suggest warp
-                    current_location = ""
-                    if self.last_state:
-                        location_data = self.last_state.get("location", {})
-                        current_location = location_data.get("name", "") or ""
-
-                    if current_location in ["FarmHouse", "SeedShop", "Saloon", "JojaMart", "Blacksmith"]:
-                        warning += "🚪 STUCK INSIDE? Just use WARP to teleport outside!\n"
-                        warning += '→ {"type": "warp", "location": "Farm"}\n\n'
-                        warning += "Don't waste time finding the door - WARP is instant!\n\n"
+                    if ctx.location_name in _STUCK_WARP_LOCATIONS:
+                        warning += _STUCK_INDOORS_WARNING
                     else:
                         # Check for debris blocking adjacent tiles
-                        debris_hint = self._get_adjacent_debris_hint(self.last_state)
+                        debris_hint = self._get_adjacent_debris_hint(ctx.data)
                         if debris_hint:
                             warning += debris_hint + "\n\n"
                         else:
-                            warning += "👁️ LOOK AT THE SCREENSHOT! There's probably an obstacle blocking you.\n"
-                            warning += "USE YOUR EYES to find a path around it:\n"
-                            warning += "- See a TREE or ROCK blocking? Move sideways first to go AROUND it\n"
-                            warning += "- Can't go south? Try going WEST or EAST first, THEN south\n"
-                            warning += "- Still stuck? Try a completely different route\n\n"
+                            warning += _STUCK_OBSTACLE_HINT
                     action_context_parts.append(warning)
 
-                action_context_parts.append(f"YOUR RECENT ACTIONS (oldest→newest):\n{action_history}")
-                logging.info(f"   📜 Action history: {len(self.recent_actions)} actions tracked")
+                self._add_context(action_context_parts, f"YOUR RECENT ACTIONS (oldest→newest):\n{action_history}",
+                                  "   📜 Action history: %d actions tracked", len(self.recent_actions))
                 if repeat_count >= 3:
                     logging.warning(f"   ⚠️  REPETITION DETECTED: '{last_action}' done {repeat_count}x in last 5")
 
-            action_context = "\n\n".join(action_context_parts)
-
-            # Get memory context (NPC knowledge + past experiences)
+            # Collect memory context started above
             memory_context = ""
-            if HAS_MEMORY and get_context_for_vlm:
+            if memory_task:
                 try:
-                    # Extract nearby NPCs from game state if available
-                    nearby_npcs = []
-                    game_day = ""
-                    if self.last_state:
-                        loc_data = self.last_state.get("location", {})
-                        nearby_npcs = [npc.get("name", "") for npc in loc_data.get("npcs", [])]
-                        time_data = self.last_state.get("time", {})
-                        game_day = f"{time_data.get('season', '')} {time_data.get('day', '')} Y{time_data.get('year', 1)}"
-
-                    memory_context = get_context_for_vlm(
-                        location=self.last_state.get("location", {}).get("name", "") if self.last_state else "",
-                        nearby_npcs=nearby_npcs,
-                        current_goal=self.goal,
-                        game_day=game_day
-                    )
+                    memory_context = await memory_task
                     if memory_context:
                         logging.info(f"   🧠 Memory: {len(memory_context)} chars context loaded")
                 except Exception as e:
@@ -10111,7 +10775,7 @@ Recent: {recent}"""
                 if "--- HINTS ---" in light_context:
                     logging.debug(f"   📝 Light context hints: {light_context.split('--- HINTS ---')[1][:100]}...")
                 lessons = self.lesson_memory.get_context() if self.lesson_memory else ""
-                result = self.vlm.think_vision_first(
+                result = await self.vlm.athink_vision_first(
                     img, self.goal, light_context=light_context, lessons=lessons
                 )
                 # Log vision-first specific output
@@ -10119,13 +10783,14 @@ Recent: {recent}"""
                     logging.info(f"   👁️ Sees: {result.observation[:100]}{'...' if len(result.observation) > 100 else ''}")
             else:
                 logging.info("🧠 Thinking...")
-                result = self.vlm.think(img, self.goal, spatial_context=spatial_context, memory_context=memory_context, action_context=action_context)
+                # Join the context sections only on this path - vision-first never reads them
+                action_context = "\n\n".join(action_context_parts)
+                result = await self.vlm.athink(img, self.goal, spatial_context=spatial_context, memory_context=memory_context, action_context=action_context)
 
             self.think_count += 1
-            self._last_vlm_time = time.time()  # Track for Day 1 clearing commentary timing
+            self._last_vlm_time = time.monotonic()  # Track for Day 1 clearing commentary timing
             if result.latency_ms:
                 self.latency_history.append(result.latency_ms)
-                self.latency_history = self.latency_history[-60:]
             self._track_vlm_parse(result)
 
             # Update VLM debug state for UI panel
@@ -10142,14 +10807,12 @@ Recent: {recent}"""
             self.executed_outcome = None
 
             # Override VLM's tool perception with actual game state (VLM often hallucinates tools)
-            if self.last_state:
-                actual_tool = self.last_state.get("player", {}).get("currentTool")
-                if actual_tool:
-                    result.holding = actual_tool
+            if ctx.current_tool:
+                result.holding = ctx.current_tool
 
             # Log perception with personality
-            energy_emoji = {"full": "💪", "good": "👍", "half": "😐", "low": "😓", "exhausted": "💀"}.get(result.energy, "❓")
-            weather_emoji = {"sunny": "☀️", "rainy": "🌧️", "stormy": "⛈️", "snowy": "❄️"}.get(result.weather, "")
+            energy_emoji = _ENERGY_EMOJI.get(result.energy, "❓")
+            weather_emoji = _WEATHER_EMOJI.get(result.weather, "")
 
             logging.info(f"   📍 {result.location} @ {result.time_of_day} {weather_emoji}")
             logging.info(f"   {energy_emoji} Energy: {result.energy} | Holding: {result.holding or 'nothing'}")
@@ -10180,8 +10843,8 @@ Recent: {recent}"""
             if self.config.mode in ("single", "splitscreen"):
                 # HARD BEDTIME CHECK - interrupts EVERYTHING including TaskExecutor
                 _bedtime_forced = False
-                if self.last_state:
-                    _hour = self.last_state.get("time", {}).get("hour", 6)
+                if ctx.data:
+                    _hour = ctx.hour
                     if _hour >= 23:
                         logging.warning(f"🛏️ BEDTIME OVERRIDE: Hour {_hour} >= 23, forcing go_to_bed (interrupting all tasks)")
                         # Clear TaskExecutor state
@@ -10189,7 +10852,8 @@ Recent: {recent}"""
                             self.task_executor.clear()
                         self._task_executor_commentary_only = False
                         self._pending_executor_action = None
-                        self.action_queue = [Action("go_to_bed", {}, "Auto-bed (very late override)")]
+                        self._drop_queued_actions(ACTION_PRIORITY_TASK_EXECUTOR)
+                        self._queue_action(Action("go_to_bed", {}, "Auto-bed (very late override)"), ACTION_PRIORITY_BEDTIME)
                         _bedtime_forced = True
 
                 # Check if VLM said PAUSE (emergency interrupt) - skip if bedtime forced
@@ -10204,41 +10868,41 @@ Recent: {recent}"""
                         self.task_executor.clear()
                     self._task_executor_commentary_only = False
                     self._pending_executor_action = None
+                    self._drop_queued_actions(ACTION_PRIORITY_TASK_EXECUTOR)
                     # Let VLM take over with its actions
-                    self.action_queue = result.actions
+                    for a in result.actions:
+                        self._queue_action(a, ACTION_PRIORITY_PAUSE_RECOVERY)
                     logging.info(f"   VLM taking control after PAUSE")
-                    for i, a in enumerate(self.action_queue):
-                        logging.info(f"   [{i}] {a.action_type}: {a.params}")
+                    if logging.getLogger().isEnabledFor(logging.INFO):
+                        for i, a in enumerate(result.actions):
+                            logging.info("   [%d] %s: %s", i, a.action_type, a.params)
                 elif self._task_executor_commentary_only:
                     # TaskExecutor owns execution - use executor action if available
                     logging.info(f"   🎭 VLM commentary: {result.reasoning[:80] if result.reasoning else 'no comment'}...")
                     if self._pending_executor_action:
                         # Use executor's action, ignore VLM actions
-                        self.action_queue = [self._pending_executor_action]
+                        self._queue_action(self._pending_executor_action, ACTION_PRIORITY_TASK_EXECUTOR)
                         logging.info(f"   [0] 🎯 {self._pending_executor_action.action_type}: {self._pending_executor_action.params} (executor)")
                         self._pending_executor_action = None
                     else:
                         # No executor action - fall back to VLM actions (Session 72 fix)
                         # This prevents agent from freezing when executor finishes but flag wasn't cleared
                         logging.info(f"   ⚠️ Commentary-only but no executor action - using VLM actions as fallback")
-                        self.action_queue = result.actions
-                        for i, a in enumerate(self.action_queue):
-                            logging.info(f"   [{i}] {a.action_type}: {a.params} (VLM fallback)")
+                        for a in result.actions:
+                            self._queue_action(a, ACTION_PRIORITY_VLM)
+                        if logging.getLogger().isEnabledFor(logging.INFO):
+                            for i, a in enumerate(result.actions):
+                                logging.info("   [%d] %s: %s (VLM fallback)", i, a.action_type, a.params)
                     # Clear the commentary-only flag for next tick
                     self._task_executor_commentary_only = False
                 else:
                     # Normal VLM mode - apply action overrides in sequence
-                    filtered_actions = result.actions
-                    filtered_actions = self._fix_active_popup(filtered_actions)  # Popup/menu dismiss first
-                    filtered_actions = self._fix_late_night_bed(filtered_actions)  # Midnight override
-                    filtered_actions = self._fix_priority_shipping(filtered_actions)  # Shipping priority
-                    filtered_actions = self._fix_no_seeds(filtered_actions)  # No seeds → go to Pierre's
-                    filtered_actions = self._fix_edge_stuck(filtered_actions)  # Edge-stuck → retreat
-                    filtered_actions = self._fix_empty_watering_can(filtered_actions)  # Empty can override
-                    filtered_actions = self._filter_adjacent_crop_moves(filtered_actions)  # Adjacent move filter
-                    self.action_queue = filtered_actions
-                    for i, a in enumerate(self.action_queue):
-                        logging.info(f"   [{i}] {a.action_type}: {a.params}")
+                    vlm_actions = self._rewrite_actions(result.actions)
+                    for a in vlm_actions:
+                        self._queue_action(a, ACTION_PRIORITY_VLM)
+                    if logging.getLogger().isEnabledFor(logging.INFO):
+                        for i, a in enumerate(vlm_actions):
+                            logging.info("   [%d] %s: %s", i, a.action_type, a.params)
             else:
                 # Helper mode: just log advice, don't execute
                 logging.info("   💡 ADVICE (not executing):")
@@ -10251,6 +10915,7 @@ Recent: {recent}"""
     def stop(self):
         """Stop the agent."""
         self.running = False
+        self.wake()
         if self.commentary_worker:
             self.commentary_worker.stop()
 
@@ -10259,27 +10924,11 @@ Recent: {recent}"""
 # CLI
 # =============================================================================
 
+_BANNER_SEP = "=" * 60
+
+
 def main():
-    import argparse
-
-    parser = argparse.ArgumentParser(description="StardewAI Unified Agent")
-    parser.add_argument("--config", "-c", default="./config/settings.yaml",
-                        help="Path to config file")
-    parser.add_argument("--goal", "-g", default="",
-                        help="Goal for the agent")
-    parser.add_argument("--mode", "-m", choices=["single", "splitscreen", "helper"],
-                        help="Override mode: single (full screen), splitscreen (Player 2), helper (advisory)")
-    parser.add_argument("--observe", "-o", action="store_true",
-                        help="Observe only (disable controller)")
-    parser.add_argument("--ui", action="store_true",
-                        help="Enable UI updates")
-    parser.add_argument("--ui-url", default=None,
-                        help="UI base URL (default http://localhost:9001)")
-    parser.add_argument("--plot", type=str, default=None,
-                        help="Define farm plot: 'x,y,width,height' e.g., '30,20,5,3'")
-    parser.add_argument("--clear-plan", action="store_true",
-                        help="Clear existing farm plan")
-    args = parser.parse_args()
+    args = build_arg_parser().parse_args()
 
     # Load config
     config = Config.from_yaml(args.config)
@@ -10319,24 +10968,27 @@ def main():
         except ValueError as e:
             print(f"⚠️  Invalid --plot values: {e}")
 
-    print("\n" + "=" * 60)
-    print("   🎮 StardewAI - Unified VLM Agent")
-    print("=" * 60)
-    print(f"   Mode: {config.mode.upper()}")
-    print(f"   Model: {config.model}")
-    print(f"   Server: {config.server_url}")
-    print(f"   Goal: {args.goal or 'Explore and help'}")
     if config.mode == "splitscreen":
-        print(f"   Screen: Right half (Player 2)")
-        print(f"   Input: SMAPI Mod API")
+        screen, input_desc = "Right half (Player 2)", "SMAPI Mod API"
     elif config.mode == "single":
-        print(f"   Screen: Full screen")
-        print(f"   Input: SMAPI Mod API")
+        screen, input_desc = "Full screen", "SMAPI Mod API"
     else:
-        print(f"   Screen: Full screen")
-        print(f"   Input: Advisory only (no control)")
-    print("   Press Ctrl+C to stop")
-    print("=" * 60 + "\n")
+        screen, input_desc = "Full screen", "Advisory only (no control)"
+    # One write for the whole banner
+    print(
+        f"\n{_BANNER_SEP}\n"
+        f"   🎮 StardewAI - Unified VLM Agent\n"
+        f"{_BANNER_SEP}\n"
+        f"   Mode: {config.mode.upper()}\n"
+        f"   Model: {config.model}\n"
+        f"   Server: {config.server_url}\n"
+        f"   Goal: {args.goal or 'Explore and help'}\n"
+        f"   Screen: {screen}\n"
+        f"   Input: {input_desc}\n"
+        f"   Press Ctrl+C to stop\n"
+        f"{_BANNER_SEP}\n",
+        flush=True,
+    )
 
     asyncio.run(agent.run(goal=args.goal))
 